@@ -0,0 +1,105 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Measures how many rows per second a row filter evaluates over a record batch with pyarrow.compute
+
+The filter selects a range of days and a set of categories, with a null check, as a residual filter after a scan
+would. The reference evaluates the compiled row evaluator on every row, after converting the batch to rows.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_arrow_evaluator.py
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from iceberg.expressions.base import (
+    And,
+    Operation,
+    Or,
+    UnboundPredicate,
+    UnboundReference,
+)
+from iceberg.expressions.evaluator import Evaluator
+from iceberg.expressions.literals import literal
+from iceberg.expressions.pyarrow import ArrowEvaluator
+from iceberg.schema import Schema
+from iceberg.types import DateType, LongType, NestedField, StringType
+
+SCHEMA = Schema(
+    NestedField(1, "id", LongType(), is_optional=False),
+    NestedField(2, "category", StringType()),
+    NestedField(3, "d", DateType()),
+    schema_id=1,
+)
+ROW_FILTER = And(
+    UnboundPredicate(Operation.GT_EQ, UnboundReference("d"), [literal("2022-01-10")]),
+    UnboundPredicate(Operation.LT, UnboundReference("d"), [literal("2022-01-20")]),
+    Or(
+        UnboundPredicate(Operation.IN, UnboundReference("category"), [literal("a"), literal("c"), literal("e")]),
+        UnboundPredicate(Operation.IS_NULL, UnboundReference("category")),
+    ),
+)
+
+
+class Row:
+    def __init__(self, *values: Any):
+        self.values = values
+
+    def get(self, pos: int) -> Any:
+        return self.values[pos]
+
+
+def make_batch(num_rows: int) -> pa.RecordBatch:
+    rng = np.random.default_rng(42)
+    categories = np.array(["a", "b", "c", "d", "e", None], dtype=object)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(np.arange(num_rows)),
+            pa.array(categories[rng.integers(0, len(categories), num_rows)], type=pa.string()),
+            pa.array(rng.integers(18993, 18993 + 30, num_rows).astype(np.int32)).cast(pa.date32()),
+        ],
+        names=["id", "category", "d"],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch = make_batch(args.rows)
+    arrow_evaluator = ArrowEvaluator(SCHEMA, ROW_FILTER)
+    evaluate = Evaluator(SCHEMA, ROW_FILTER).eval
+
+    def row_by_row() -> list:
+        columns = [batch.column(0).to_pylist(), batch.column(1).to_pylist(), batch.column(2).cast(pa.int32()).to_pylist()]
+        return [evaluate(Row(*values)) for values in zip(*columns)]
+
+    assert arrow_evaluator.mask(batch).to_pylist() == row_by_row()
+    for name, function in [("arrow mask", lambda: arrow_evaluator.mask(batch)), ("row by row", row_by_row)]:
+        seconds = min(timeit.repeat(function, repeat=args.repeat, number=1))
+        print(f"{name:<12}{seconds:>9.3f}s {args.rows / seconds / 1e6:>8.2f}M rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Measures decoding the lower bounds of a column in many data files
+
+The bounds are decoded one value at a time with `from_bytes`, which resolves the cached codec of the type on every
+call, and as a whole column with `from_bytes_many`, which decodes fixed-width values with a single numpy view. One
+in a hundred bounds is missing, as it is for data files that only hold nulls.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_conversions.py
+"""
+
+import argparse
+import timeit
+from decimal import Decimal
+
+from iceberg.conversions import from_bytes, from_bytes_many, to_bytes
+from iceberg.types import (
+    DateType,
+    DecimalType,
+    DoubleType,
+    LongType,
+    StringType,
+)
+
+COLUMNS = {
+    "long": (LongType(), lambda i: i * 7919),
+    "double": (DoubleType(), lambda i: i / 3),
+    "date": (DateType(), lambda i: i % 20000),
+    "decimal(9, 2)": (DecimalType(9, 2), lambda i: Decimal(i).scaleb(-2)),
+    "string": (StringType(), lambda i: f"value-{i}"),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (primitive_type, value_of) in COLUMNS.items():
+        buffers = [None if i % 100 == 0 else to_bytes(primitive_type, value_of(i)) for i in range(args.files)]
+        per_value = min(
+            timeit.repeat(
+                lambda: [None if b is None else from_bytes(primitive_type, b) for b in buffers], number=1, repeat=args.repeat
+            )
+        )
+        bulk = min(timeit.repeat(lambda: from_bytes_many(primitive_type, buffers), number=1, repeat=args.repeat))
+        print(
+            f"{name:>14}   from_bytes {per_value * 1000:8.1f} ms   from_bytes_many {bulk * 1000:8.1f} ms   {per_value / bulk:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Measures how many rows per second a compiled row filter evaluates, such as the partition values of manifest entries
+
+The filter selects a range of days and a set of categories, with a null check, over rows of partition values. The
+reference walks the bound expression tree for every row, as a visitor-based evaluator does.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_evaluator.py
+"""
+
+import argparse
+import operator
+import random
+import timeit
+from typing import Any
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    BoundPredicate,
+    Not,
+    Operation,
+    Or,
+    UnboundPredicate,
+    UnboundReference,
+    bind,
+)
+from iceberg.expressions.evaluator import Evaluator
+from iceberg.expressions.literals import literal
+from iceberg.schema import Schema
+from iceberg.types import DateType, IntegerType, NestedField, StringType
+
+SCHEMA = Schema(
+    NestedField(1, "category", StringType()),
+    NestedField(2, "ts_day", DateType()),
+    NestedField(3, "id_bucket", IntegerType()),
+    schema_id=1,
+)
+ROW_FILTER = And(
+    UnboundPredicate(Operation.GT_EQ, UnboundReference("ts_day"), [literal("2022-01-10")]),
+    UnboundPredicate(Operation.LT, UnboundReference("ts_day"), [literal("2022-01-20")]),
+    Or(
+        UnboundPredicate(Operation.IN, UnboundReference("category"), [literal("a"), literal("c"), literal("e")]),
+        UnboundPredicate(Operation.IS_NULL, UnboundReference("category")),
+    ),
+)
+COMPARISONS = {
+    Operation.LT: operator.lt,
+    Operation.LT_EQ: operator.le,
+    Operation.GT: operator.gt,
+    Operation.GT_EQ: operator.ge,
+}
+
+
+class Row:
+    def __init__(self, *values: Any):
+        self.values = values
+
+    def get(self, pos: int) -> Any:
+        return self.values[pos]
+
+
+def walk(expr: BooleanExpression, row: Row) -> bool:
+    if isinstance(expr, And):
+        return walk(expr.left, row) and walk(expr.right, row)
+    elif isinstance(expr, Or):
+        return walk(expr.left, row) or walk(expr.right, row)
+    elif isinstance(expr, Not):
+        return not walk(expr.child, row)
+    elif isinstance(expr, (AlwaysTrue, AlwaysFalse)):
+        return isinstance(expr, AlwaysTrue)
+    assert isinstance(expr, BoundPredicate)
+    value = expr.term.eval(row)
+    if expr.op == Operation.IS_NULL:
+        return value is None
+    elif expr.op == Operation.IN:
+        return value in {lit.value for lit in expr.literals}
+    return value is not None and COMPARISONS[expr.op](value, expr.literal.value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rows = [
+        Row(rng.choice(["a", "b", "c", "d", "e", None]), 18993 + rng.randint(0, 30), rng.randint(0, 15)) for _ in range(args.rows)
+    ]
+    bound = bind(SCHEMA, ROW_FILTER)
+    evaluate = Evaluator(SCHEMA, ROW_FILTER).eval
+    assert [evaluate(row) for row in rows[:1000]] == [walk(bound, row) for row in rows[:1000]]
+
+    for name, function in [
+        ("compiled", lambda: [row for row in rows if evaluate(row)]),
+        ("tree walk", lambda: [row for row in rows if walk(bound, row)]),
+    ]:
+        seconds = min(timeit.repeat(function, repeat=args.repeat, number=1))
+        print(f"{name:<12}{seconds:>9.3f}s {args.rows / seconds / 1e6:>8.2f}M rows/s")
+
+
+if __name__ == "__main__":
+    main()
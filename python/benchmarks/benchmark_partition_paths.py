@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Measures how many Hive-style partition paths per second PartitionSpec parses into typed columns
+
+The paths are those of the data files of an existing Hive table partitioned by date, region and hour, where every
+partition holds several files, so field values repeat heavily. The path-by-path reference splits every path and
+converts every value with `conversions.partition_to_py`.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_partition_paths.py
+"""
+
+import argparse
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+
+from iceberg.conversions import partition_to_py
+from iceberg.schema import Schema
+from iceberg.table.partitioning import PartitionField, PartitionSpec
+from iceberg.transforms import identity
+from iceberg.types import DateType, IntegerType, NestedField, StringType
+
+SCHEMA = Schema(
+    NestedField(1, "dt", DateType()),
+    NestedField(2, "region", StringType()),
+    NestedField(3, "hour", IntegerType()),
+    schema_id=1,
+)
+SPEC = PartitionSpec(
+    SCHEMA,
+    0,
+    [
+        PartitionField(1, 1000, identity(DateType()), "dt"),
+        PartitionField(2, 1001, identity(StringType()), "region"),
+        PartitionField(3, 1002, identity(IntegerType()), "hour"),
+    ],
+    1002,
+)
+
+
+def make_paths(num_paths: int, num_days: int) -> list:
+    rng = np.random.default_rng(42)
+    days = [(date(2020, 1, 1) + timedelta(days=int(day))).isoformat() for day in rng.integers(0, num_days, num_paths)]
+    regions = rng.choice(["us-east-1", "us-west-2", "eu-west-1", "ap-south-1"], num_paths)
+    hours = rng.integers(0, 24, num_paths)
+    return [f"dt={day}/region={region}/hour={hour}" for day, region, hour in zip(days, regions, hours)]
+
+
+def path_by_path(paths: list) -> list:
+    types = [field.transform.result_type(SCHEMA.find_type(field.source_id)) for field in SPEC.fields]
+    return [
+        tuple(partition_to_py(field_type, segment.partition("=")[2]) for field_type, segment in zip(types, path.split("/")))
+        for path in paths
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paths", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = make_paths(args.paths, args.days)
+    for name, function in [("parse_partition_paths", SPEC.parse_partition_paths), ("path by path", path_by_path)]:
+        seconds = min(timeit.repeat(lambda: function(paths), repeat=args.repeat, number=1))
+        print(f"{name:<24}{seconds:>9.3f}s {args.paths / seconds / 1e6:>8.2f}M paths/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Measures how many rows per second PartitionSpec groups by partition
+
+The batch has a string category, a timestamp partitioned by day and an id partitioned by bucket, which is a typical
+spec for event tables. The row-by-row reference builds a key tuple per row with the scalar transforms.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_partitioning.py
+"""
+
+import argparse
+import timeit
+from collections import defaultdict
+
+import numpy as np
+import pyarrow as pa
+
+from iceberg.schema import Schema
+from iceberg.table.partitioning import PartitionField, PartitionSpec
+from iceberg.transforms import bucket, day, identity
+from iceberg.types import LongType, NestedField, StringType, TimestampType
+
+SCHEMA = Schema(
+    NestedField(1, "id", LongType(), is_optional=False),
+    NestedField(2, "category", StringType()),
+    NestedField(3, "ts", TimestampType()),
+    schema_id=1,
+)
+SPEC = PartitionSpec(
+    SCHEMA,
+    1,
+    [
+        PartitionField(2, 1000, identity(StringType()), "category"),
+        PartitionField(3, 1001, day(TimestampType()), "ts_day"),
+        PartitionField(1, 1002, bucket(LongType(), 16), "id_bucket"),
+    ],
+    1002,
+)
+
+
+def make_batch(num_rows: int, num_categories: int, num_days: int) -> pa.RecordBatch:
+    rng = np.random.default_rng(42)
+    categories = np.array([f"category-{i}" for i in range(num_categories)], dtype=object)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(rng.integers(0, 2**62, num_rows)),
+            pa.array(categories[rng.integers(0, num_categories, num_rows)], type=pa.string()),
+            pa.array(rng.integers(0, num_days * 86_400_000_000, num_rows)).cast(pa.timestamp("us")),
+        ],
+        names=["id", "category", "ts"],
+    )
+
+
+def row_by_row(batch: pa.RecordBatch) -> dict:
+    groups = defaultdict(list)
+    columns = zip(
+        batch.column("category").to_pylist(), batch.column("ts").cast(pa.int64()).to_pylist(), batch.column("id").to_pylist()
+    )
+    for row, values in enumerate(columns):
+        groups[tuple(field.transform.apply(value) for field, value in zip(SPEC.fields, values))].append(row)
+    return groups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch = make_batch(args.rows, args.categories, args.days)
+    partitions = len(SPEC.partition_indices(batch))
+    print(f"{args.rows} rows in {partitions} partitions")
+    for name, function in [
+        ("partition_indices", SPEC.partition_indices),
+        ("partition_batch", SPEC.partition_batch),
+        ("row by row", row_by_row),
+    ]:
+        seconds = min(timeit.repeat(lambda: function(batch), repeat=args.repeat, number=1))
+        print(f"{name:<20}{seconds:>9.3f}s {args.rows / seconds / 1e6:>8.2f}M rows/s")
+
+
+if __name__ == "__main__":
+    main()
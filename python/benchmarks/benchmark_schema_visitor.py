@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarks of the schema visitor against a recursive, singledispatch-based reference implementation
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_schema_visitor.py
+"""
+
+import argparse
+import sys
+import timeit
+from functools import singledispatch
+from typing import List, Tuple
+
+from iceberg.schema import Schema, SchemaVisitor, _IndexById, visit
+from iceberg.types import (
+    IcebergType,
+    IntegerType,
+    ListType,
+    MapType,
+    NestedField,
+    PrimitiveType,
+    StringType,
+    StructType,
+)
+
+
+@singledispatch
+def recursive_visit(obj, visitor: SchemaVisitor):
+    """The recursive traversal that `visit` used before it was made iterative"""
+    raise NotImplementedError("Cannot visit non-type: %s" % obj)
+
+
+@recursive_visit.register(Schema)
+def _(obj: Schema, visitor: SchemaVisitor):
+    return visitor.schema(obj, recursive_visit(obj.as_struct(), visitor))
+
+
+@recursive_visit.register(StructType)
+def _(obj: StructType, visitor: SchemaVisitor):
+    results = []
+    for field in obj.fields:
+        visitor.before_field(field)
+        result = recursive_visit(field.type, visitor)
+        visitor.after_field(field)
+        results.append(visitor.field(field, result))
+    return visitor.struct(obj, results)
+
+
+@recursive_visit.register(ListType)
+def _(obj: ListType, visitor: SchemaVisitor):
+    visitor.before_list_element(obj.element)
+    result = recursive_visit(obj.element.type, visitor)
+    visitor.after_list_element(obj.element)
+    return visitor.list(obj, result)
+
+
+@recursive_visit.register(MapType)
+def _(obj: MapType, visitor: SchemaVisitor):
+    visitor.before_map_key(obj.key)
+    key_result = recursive_visit(obj.key.type, visitor)
+    visitor.after_map_key(obj.key)
+    visitor.before_map_value(obj.value)
+    value_result = recursive_visit(obj.value.type, visitor)
+    visitor.after_map_value(obj.value)
+    return visitor.map(obj, key_result, value_result)
+
+
+@recursive_visit.register(PrimitiveType)
+def _(obj: PrimitiveType, visitor: SchemaVisitor):
+    return visitor.primitive(obj)
+
+
+def wide_schema(num_columns: int) -> Schema:
+    """A schema where every fourth column is a struct, a list or a map of primitives"""
+    field_id = num_columns
+    columns: List[NestedField] = []
+    for column in range(num_columns):
+        field_type: IcebergType
+        if column % 4 == 1:
+            field_type = StructType(NestedField(field_id + 1, "a", IntegerType()), NestedField(field_id + 2, "b", StringType()))
+        elif column % 4 == 2:
+            field_type = ListType(field_id + 1, IntegerType())
+        elif column % 4 == 3:
+            field_type = MapType(field_id + 1, StringType(), field_id + 2, IntegerType())
+        else:
+            field_type = StringType()
+        field_id += 2
+        columns.append(NestedField(column, f"column_{column}", field_type))
+    return Schema(*columns, schema_id=1)
+
+
+def deep_type(depth: int) -> StructType:
+    """A struct that nests structs `depth` levels deep"""
+    field_type = StructType(NestedField(depth, "leaf", IntegerType()))
+    for field_id in range(depth - 1, -1, -1):
+        field_type = StructType(NestedField(field_id, f"level_{field_id}", field_type))
+    return field_type
+
+
+def measure(name: str, obj, repeat: int, number: int) -> Tuple[float, float]:
+    iterative = min(timeit.repeat(lambda: visit(obj, _IndexById()), repeat=repeat, number=number)) / number
+    recursive = min(timeit.repeat(lambda: recursive_visit(obj, _IndexById()), repeat=repeat, number=number)) / number
+    print(
+        f"{name:<32} iterative {iterative * 1000:9.3f} ms   recursive {recursive * 1000:9.3f} ms   {recursive / iterative:5.2f}x"
+    )
+    return iterative, recursive
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    for num_columns in [100, 1_000, 10_000]:
+        measure(f"wide schema, {num_columns} columns", wide_schema(num_columns), args.repeat, args.number)
+
+    depth = 200
+    measure(f"deep struct, {depth} levels", deep_type(depth), args.repeat, args.number)
+
+    depth = sys.getrecursionlimit()
+    visit(deep_type(depth), _IndexById())
+    try:
+        recursive_visit(deep_type(depth), _IndexById())
+        print(f"deep struct, {depth} levels: visited by both")
+    except RecursionError:
+        print(f"deep struct, {depth} levels: visited iteratively, recursion limit exceeded by the recursive visitor")
+
+
+if __name__ == "__main__":
+    main()
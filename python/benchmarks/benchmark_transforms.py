@@ -0,0 +1,148 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarks of the transforms against the transforms of the legacy library in python_legacy
+
+Each transform is timed three ways over the same values: the legacy transform applied to one value at a time, the
+transform applied to one value at a time, and the columnar path of the transform applied to an Arrow array. Both
+libraries are named `iceberg`, so the legacy transforms are timed in a subprocess.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_transforms.py [--legacy-python PATH]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import timeit
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from iceberg import transforms
+from iceberg.types import DateType, IntegerType, StringType, TimestampType
+
+LEGACY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "python_legacy")
+
+# (name, new transform, legacy transform expression, values expression, arrow type)
+CASES: List[Tuple[str, Callable, str, str, pa.DataType]] = [
+    (
+        "year(timestamp)",
+        lambda: transforms.year(TimestampType()),
+        "Transforms.year(TimestampType.without_timezone())",
+        "random.randint(-2**50, 2**52)",
+        pa.timestamp("us"),
+    ),
+    (
+        "month(date)",
+        lambda: transforms.month(DateType()),
+        "Transforms.month(DateType.get())",
+        "random.randint(-100_000, 100_000)",
+        pa.date32(),
+    ),
+    (
+        "day(timestamp)",
+        lambda: transforms.day(TimestampType()),
+        "Transforms.day(TimestampType.without_timezone())",
+        "random.randint(-2**50, 2**52)",
+        pa.timestamp("us"),
+    ),
+    (
+        "hour(timestamp)",
+        lambda: transforms.hour(TimestampType()),
+        "Transforms.hour(TimestampType.without_timezone())",
+        "random.randint(-2**50, 2**52)",
+        pa.timestamp("us"),
+    ),
+    (
+        "truncate[10](int)",
+        lambda: transforms.truncate(IntegerType(), 10),
+        "Transforms.truncate(IntegerType.get(), 10)",
+        "random.randint(-2**31, 2**31 - 1)",
+        pa.int32(),
+    ),
+    (
+        "truncate[4](string)",
+        lambda: transforms.truncate(StringType(), 4),
+        "Transforms.truncate(StringType.get(), 4)",
+        "'value-' + str(random.randint(0, 2**31))",
+        pa.string(),
+    ),
+    (
+        "bucket[16](int)",
+        lambda: transforms.bucket(IntegerType(), 16),
+        "Transforms.bucket(IntegerType.get(), 16)",
+        "random.randint(-2**31, 2**31 - 1)",
+        pa.int32(),
+    ),
+]
+
+SETUP = """
+import random
+random.seed(42)
+values = [{values} for _ in range({rows})]
+"""
+
+LEGACY_SETUP = """
+from iceberg.api.transforms import Transforms
+from iceberg.api.types import DateType, IntegerType, StringType, TimestampType
+transform = {transform}
+"""
+
+
+def time_legacy(python: str, transform: str, values: str, rows: int, repeat: int) -> float:
+    setup = SETUP.format(values=values, rows=rows) + LEGACY_SETUP.format(transform=transform)
+    code = (
+        f"import timeit\nprint(min(timeit.repeat('[transform.apply(v) for v in values]', {setup!r}, repeat={repeat}, number=1)))"
+    )
+    env = dict(os.environ, PYTHONPATH=LEGACY_PATH)
+    process = subprocess.run([python, "-c", code], env=env, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"Cannot time the legacy transform {transform}:\n{process.stderr}")
+    return float(process.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-python", default=sys.executable, help="an interpreter with the legacy dependencies")
+    args = parser.parse_args()
+
+    print(f"{'transform':<22}{'legacy':>12}{'apply':>12}{'apply_array':>14}{'speedup':>10}")
+    for name, factory, legacy_transform, values_expression, arrow_type in CASES:
+        namespace: dict = {}
+        exec(SETUP.format(values=values_expression, rows=args.rows), namespace)  # pylint: disable=exec-used
+        values = namespace["values"]
+        if pa.types.is_date32(arrow_type):
+            array = pa.array(np.array(values, dtype=np.int32)).cast(arrow_type)
+        elif pa.types.is_timestamp(arrow_type):
+            array = pa.array(np.array(values, dtype=np.int64)).cast(arrow_type)
+        else:
+            array = pa.array(values, type=arrow_type)
+        transform = factory()
+
+        legacy = time_legacy(args.legacy_python, legacy_transform, values_expression, args.rows, args.repeat)
+        scalar = min(timeit.repeat(lambda: [transform.apply(value) for value in values], repeat=args.repeat, number=1))
+        columnar = min(timeit.repeat(lambda: transform.apply_array(array), repeat=args.repeat, number=1))
+        print(f"{name:<22}{legacy:>11.4f}s{scalar:>11.4f}s{columnar:>13.4f}s{legacy / columnar:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Measures the memory retained by interned types and schemas after loading many distinct schemas
+
+Each schema is a version of an evolving table: it has a few nested columns, and one more column than the previous
+version. The schemas are dropped after they are loaded, as a long-running service would drop old table versions. The
+benchmark is run with the weak-valued interning that the types use, and with strong dictionaries as a reference.
+
+Run from the python directory with:
+
+    python benchmarks/benchmark_type_interning.py
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from iceberg.schema import Schema
+from iceberg.types import (
+    DecimalType,
+    FixedType,
+    ListType,
+    LongType,
+    MapType,
+    NestedField,
+    StringType,
+    StructType,
+)
+
+INTERNED_CLASSES = [FixedType, DecimalType, NestedField, StructType, ListType, MapType, Schema]
+
+
+def load_schema(version: int) -> Schema:
+    columns: List[NestedField] = [
+        NestedField(1, "id", LongType(), is_optional=False),
+        NestedField(2, "payload", FixedType(16 + version % 64)),
+        NestedField(3, "amount", DecimalType(38, version % 38)),
+        NestedField(4, "tags", ListType(5, StringType())),
+        NestedField(6, "attributes", MapType(7, StringType(), 8, StructType(NestedField(9, "value", StringType())))),
+    ]
+    columns += [NestedField(100 + column, f"column_{column}", StringType()) for column in range(version % 200)]
+    columns.append(NestedField(1_000_000 + version, f"added_in_version_{version}", StringType()))
+    return Schema(*columns, schema_id=version)
+
+
+def run(num_schemas: int) -> Tuple[int, int, int]:
+    """Loads and drops schemas, and returns the retained bytes, the peak bytes and the number of interned instances"""
+    gc.collect()
+    tracemalloc.start()
+    for version in range(num_schemas):
+        schema = load_schema(version)
+        schema.find_field("id")
+    del schema
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, peak, sum(len(cls._instances) for cls in INTERNED_CLASSES)  # type: ignore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schemas", type=int, default=10_000)
+    args = parser.parse_args()
+
+    retained, peak, instances = run(args.schemas)
+    print(
+        f"weak interning    retained {retained / 2**20:8.1f} MiB   peak {peak / 2**20:8.1f} MiB   interned instances {instances}"
+    )
+
+    weak: Dict[type, object] = {cls: cls._instances for cls in INTERNED_CLASSES}  # type: ignore
+    try:
+        for cls in INTERNED_CLASSES:
+            cls._instances = {}  # type: ignore
+        retained, peak, instances = run(args.schemas)
+        print(
+            f"strong interning  retained {retained / 2**20:8.1f} MiB   peak {peak / 2**20:8.1f} MiB   interned instances {instances}"
+        )
+    finally:
+        for cls, instances_by_key in weak.items():
+            cls._instances = instances_by_key  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
@@ -21,17 +21,28 @@ This module enables:
     - Converting a value to a byte buffer
     - Converting a byte buffer to a value
 
+    - Converting a column of byte buffers to an Arrow array
+
 Note:
-    Conversion logic varies based on the PrimitiveType implementation. Therefore conversion functions
-    are defined here as generic functions using the @singledispatch decorator. For each PrimitiveType
-    implementation, a concrete function is registered for each generic conversion function. For PrimitiveType
-    implementations that share the same conversion logic, registrations can be stacked.
+    Conversion logic varies based on the PrimitiveType implementation. Partition strings are converted by a
+    generic function using the @singledispatch decorator, with a concrete function registered for each
+    PrimitiveType implementation. Conversions to and from bytes go through a codec, which is resolved once
+    per type instance and caches its precompiled `struct.Struct`, so that decoding the bounds of many data
+    files does not dispatch and parse a format string for every value.
 """
 import struct
 import uuid
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from functools import singledispatch
-from typing import Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Union,
+)
+from weakref import finalize
 
 from iceberg.types import (
     BinaryType,
@@ -50,8 +61,19 @@ from iceberg.types import (
     TimeType,
     UUIDType,
 )
+from iceberg.utils.datetime import (
+    date_to_days,
+    time_to_micros,
+    timestamp_to_micros,
+    timestamptz_to_micros,
+)
 from iceberg.utils.decimal import decimal_to_bytes, unscaled_to_decimal
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+Value = Union[bool, bytes, Decimal, float, int, str, uuid.UUID]
+
 
 def handle_none(func):
     """A decorator function to handle cases where partition values are `None` or "__HIVE_DEFAULT_PARTITION__"
@@ -87,22 +109,63 @@ def _(primitive_type, value_str: str) -> Union[int, float, str, uuid.UUID]:
     return value_str.lower() == "true"
 
 
+def _partition_int(primitive_type, value_str: str) -> int:
+    """Parses an integer partition value directly, so that longs beyond the precision of a float are exact
+
+    Raises:
+        ValueError: If the value is not an integer, including when it has fractional digits or an exponent
+    """
+    try:
+        return int(value_str)
+    except ValueError:
+        try:
+            Decimal(value_str)
+        except InvalidOperation:
+            raise ValueError(f"Cannot convert partition value to {primitive_type}: {value_str}") from None
+        raise ValueError(f"Cannot convert partition value, value cannot have fractional digits for {primitive_type} partition")
+
+
 @partition_to_py.register(IntegerType)
 @partition_to_py.register(LongType)
+@handle_none
+def _(primitive_type, value_str: str) -> int:
+    return _partition_int(primitive_type, value_str)
+
+
 @partition_to_py.register(DateType)
+@handle_none
+def _(primitive_type, value_str: str) -> int:
+    """Parses days from 1970-01-01, or an ISO-8601 date such as 2022-01-01, which is how Hive and the day transform write dates"""
+    if value_str.find("-", 1) > 0:
+        return date_to_days(value_str)
+    return _partition_int(primitive_type, value_str)
+
+
 @partition_to_py.register(TimeType)
+@handle_none
+def _(primitive_type, value_str: str) -> int:
+    """Parses microseconds from midnight, or an ISO-8601 time such as 10:15:30"""
+    if ":" in value_str:
+        return time_to_micros(value_str)
+    return _partition_int(primitive_type, value_str)
+
+
 @partition_to_py.register(TimestampType)
+@handle_none
+def _(primitive_type, value_str: str) -> int:
+    """Parses microseconds from 1970-01-01T00:00:00, or an ISO-8601 timestamp, which Hive separates with a space"""
+    if value_str.find("-", 1) > 0:
+        return timestamp_to_micros(value_str.replace(" ", "T", 1))
+    return _partition_int(primitive_type, value_str)
+
+
 @partition_to_py.register(TimestamptzType)
 @handle_none
 def _(primitive_type, value_str: str) -> int:
-    """
-    Raises:
-        ValueError: If the scale/exponent is not 0
-    """
-    _, digits, exponent = Decimal(value_str).as_tuple()
-    if exponent != 0:  # Raise if there are digits to the right of the decimal
-        raise ValueError(f"Cannot convert partition value, value cannot have fractional digits for {primitive_type} partition")
-    return int(float(value_str))
+    """Parses microseconds from 1970-01-01T00:00:00+00:00, or an ISO-8601 timestamp with an offset"""
+    if value_str.find("-", 1) > 0:
+        return timestamptz_to_micros(value_str.replace(" ", "T", 1))
+    return _partition_int(primitive_type, value_str)
 
 
 @partition_to_py.register(FloatType)
@@ -134,158 +197,411 @@ def _(primitive_type, value_str: str) -> bytes:
 @partition_to_py.register(DecimalType)
 @handle_none
 def _(primitive_type, value_str: str) -> Decimal:
-    return Decimal(value_str)
+    try:
+        return Decimal(value_str)
+    except InvalidOperation:
+        raise ValueError(f"Cannot convert partition value to {primitive_type}: {value_str}") from None
 
 
-@singledispatch
-def to_bytes(primitive_type: PrimitiveType, value: Union[bool, bytes, Decimal, float, int, str, uuid.UUID]) -> bytes:
-    """A generic function which converts a built-in python value to bytes
+class Codec:
+    """Converts the values of a single PrimitiveType to and from bytes
 
-    This conversion follows the serialization scheme for storing single values as individual binary values defined in the Iceberg specification that
-    can be found at https://iceberg.apache.org/spec/#appendix-d-single-value-serialization
+    This conversion follows the serialization scheme for storing single values as individual binary values defined in
+    the Iceberg specification that can be found at https://iceberg.apache.org/spec/#appendix-d-single-value-serialization
 
-    Args:
-        primitive_type(PrimitiveType): An implementation of the PrimitiveType base class
-        value: The value to convert to bytes (The type of this value depends on which dispatched function is
-            used--check dispatchable functions for type hints)
+    Codecs are not created directly. Instead, use `codec_for` to get the codec of a type.
     """
-    raise TypeError(f"scale does not match {primitive_type}")
 
+    def to_bytes(self, value: Value) -> bytes:
+        raise NotImplementedError()
 
-@to_bytes.register(BooleanType)
-def _(primitive_type, value: bool) -> bytes:
-    return struct.pack("<?", 1 if value else 0)
+    def from_bytes(self, b: bytes) -> Value:
+        raise NotImplementedError()
 
+    def arrow_type(self) -> "pa.DataType":
+        raise NotImplementedError()
 
-@to_bytes.register(IntegerType)
-@to_bytes.register(DateType)
-def _(primitive_type, value: int) -> bytes:
-    return struct.pack("<i", value)
+    def from_bytes_many(self, buffers: Sequence[Optional[bytes]]) -> "pa.Array":
+        """Converts a column of byte buffers, where missing values are None, to an Arrow array
 
+        Args:
+            buffers (Sequence[Optional[bytes]]): The serialized values, such as the lower bounds of a column in many data files
 
-@to_bytes.register(LongType)
-@to_bytes.register(TimeType)
-@to_bytes.register(TimestampType)
-@to_bytes.register(TimestamptzType)
-def _(primitive_type, value: int) -> bytes:
-    return struct.pack("<q", value)
+        Returns:
+            pa.Array: An array of `arrow_type()` that is null wherever a buffer is None
+        """
+        import pyarrow as pa
 
+        return pa.array([None if b is None else self.from_bytes(b) for b in buffers], type=self.arrow_type())
 
-@to_bytes.register(FloatType)
-def _(primitive_type, value: float) -> bytes:
-    """
-    Note: float in python is implemented using a double in C. Therefore this involves a conversion of a 32-bit (single precision)
-    float to a 64-bit (double precision) float which introduces some imprecision.
+
+class UnsupportedCodec(Codec):
+    """The codec of a type that cannot be converted, which raises on every conversion"""
+
+    def __init__(self, primitive_type):
+        self._type = str(primitive_type)
+
+    def to_bytes(self, value: Value) -> bytes:
+        raise TypeError(f"scale does not match {self._type}")
+
+    def from_bytes(self, b: bytes) -> Value:
+        raise TypeError(f"Cannot deserialize bytes, type {self._type} not supported: {str(b)}")
+
+    def arrow_type(self) -> "pa.DataType":
+        raise TypeError(f"Cannot convert type {self._type} to an Arrow type")
+
+
+class StructCodec(Codec):
+    """A codec for fixed-width values, which packs them with a precompiled struct
+
+    Args:
+        fmt (str): The struct format of a single value
+        dtype (str): The numpy dtype of a single value, which decodes a whole column at once
+        arrow_type (Callable): Returns the Arrow type of the values given the pyarrow module, which is imported lazily
     """
-    return struct.pack("<f", value)
 
+    def __init__(self, fmt: str, dtype: str, arrow_type: Callable[..., "pa.DataType"]):
+        self._struct = struct.Struct(fmt)
+        self._pack = self._struct.pack
+        self._unpack = self._struct.unpack
+        self._dtype = dtype
+        self._arrow_type = arrow_type
 
-@to_bytes.register(DoubleType)
-def _(primitive_type, value: float) -> bytes:
-    return struct.pack("<d", value)
+    def to_bytes(self, value: Value) -> bytes:
+        return self._pack(value)
 
+    def from_bytes(self, b: bytes) -> Value:
+        return self._unpack(b)[0]
 
-@to_bytes.register(StringType)
-def _(primitive_type, value: str) -> bytes:
-    return value.encode("UTF-8")
+    def arrow_type(self) -> "pa.DataType":
+        import pyarrow as pa
 
+        return self._arrow_type(pa)
 
-@to_bytes.register(UUIDType)
-def _(primitive_type, value: uuid.UUID) -> bytes:
-    return struct.pack(">QQ", (value.int >> 64) & 0xFFFFFFFFFFFFFFFF, value.int & 0xFFFFFFFFFFFFFFFF)
+    def from_bytes_many(self, buffers: Sequence[Optional[bytes]]) -> "pa.Array":
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
 
+        raw = pa.array(buffers, type=pa.binary())
+        if raw.null_count == len(raw):
+            return pa.nulls(len(raw), type=self.arrow_type())
+        if pc.any(pc.not_equal(pc.binary_length(raw), self._struct.size)).as_py():
+            raise ValueError(f"Cannot deserialize bytes, expected {self._struct.size} bytes for every value")
+        # null slots have no bytes, so the data buffer holds exactly the valid values in order
+        data = raw.buffers()[2]
+        valid_values = np.frombuffer(data, dtype=self._dtype, count=len(raw) - raw.null_count)
+        if raw.null_count == 0:
+            return self._to_arrow(valid_values, None)
+        mask = raw.is_null().to_numpy(zero_copy_only=False)
+        values = np.zeros(len(raw), dtype=self._dtype)
+        values[~mask] = valid_values
+        return self._to_arrow(values, mask)
 
-@to_bytes.register(BinaryType)
-@to_bytes.register(FixedType)
-def _(primitive_type, value: bytes) -> bytes:
-    return value
+    def _to_arrow(self, values, mask) -> "pa.Array":
+        import pyarrow as pa
 
+        return pa.array(values, type=self.arrow_type(), mask=mask)
 
-@to_bytes.register(DecimalType)
-def _(primitive_type, value: Decimal) -> bytes:
-    """Convert a Decimal value to bytes given a DecimalType instance with defined precision and scale
 
-    Args:
-        primitive_type (Decimal): A DecimalType instance with precision and scale
-        value (Decimal): A Decimal instance
+class BooleanCodec(StructCodec):
+    """A codec for booleans, which are stored as a single byte that is non-zero for True"""
 
-    Raises:
-        ValueError: If either the precision or scale of `value` does not match that defined in the DecimalType instance
+    def __init__(self):
+        super().__init__("<?", "u1", lambda pa: pa.bool_())
 
+    def to_bytes(self, value: Value) -> bytes:
+        return self._pack(1 if value else 0)
 
-    Returns:
-        bytes: The byte representation of `value`
+    def from_bytes(self, b: bytes) -> Value:
+        return self._unpack(b)[0] != 0
+
+    def _to_arrow(self, values, mask) -> "pa.Array":
+        return super()._to_arrow(values != 0, mask)
+
+
+class StringCodec(Codec):
+    """A codec for strings, which are stored as UTF-8 bytes without a length"""
+
+    def to_bytes(self, value: Value) -> bytes:
+        return value.encode("UTF-8")  # type: ignore
+
+    def from_bytes(self, b: bytes) -> Value:
+        return bytes(b).decode("utf-8")
+
+    def arrow_type(self) -> "pa.DataType":
+        import pyarrow as pa
+
+        return pa.string()
+
+    def from_bytes_many(self, buffers: Sequence[Optional[bytes]]) -> "pa.Array":
+        import pyarrow as pa
+
+        # the cast validates that every value is UTF-8
+        return pa.array(buffers, type=pa.binary()).cast(pa.string())
+
+
+class BinaryCodec(Codec):
+    """A codec for binary and fixed values, which are stored directly
+
+    Args:
+        length (Optional[int]): The length of every value of a fixed type, or None for binary
     """
-    sign, digits, exponent = value.as_tuple()
 
-    if -exponent != primitive_type.scale:
-        raise ValueError(f"Cannot serialize value, scale of value does not match type {primitive_type}: {-exponent}")
-    elif len(digits) > primitive_type.precision:
-        raise ValueError(
-            f"Cannot serialize value, precision of value is greater than precision of type {primitive_type}: {len(digits)}"
-        )
+    def __init__(self, length: Optional[int] = None):
+        self._length = length
+
+    def to_bytes(self, value: Value) -> bytes:
+        return value  # type: ignore
+
+    def from_bytes(self, b: bytes) -> Value:
+        return b
+
+    def arrow_type(self) -> "pa.DataType":
+        import pyarrow as pa
+
+        return pa.binary() if self._length is None else pa.binary(self._length)
+
+    def from_bytes_many(self, buffers: Sequence[Optional[bytes]]) -> "pa.Array":
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        raw = pa.array(buffers, type=pa.binary())
+        if self._length is None:
+            return raw
+        elif raw.null_count == len(raw):
+            return pa.nulls(len(raw), type=self.arrow_type())
+        if pc.any(pc.not_equal(pc.binary_length(raw), self._length)).as_py():
+            raise ValueError(f"Cannot deserialize bytes, expected {self._length} bytes for every value")
+        # the data buffer holds exactly the valid values in order, but every slot of a fixed-size array has its own bytes
+        data = raw.buffers()[2]
+        if raw.null_count > 0:
+            values = np.zeros((len(raw), self._length), dtype="u1")
+            valid_values = np.frombuffer(data, dtype="u1", count=(len(raw) - raw.null_count) * self._length)
+            values[~raw.is_null().to_numpy(zero_copy_only=False)] = valid_values.reshape(-1, self._length)
+            data = pa.py_buffer(values)
+        return pa.Array.from_buffers(self.arrow_type(), len(raw), [raw.buffers()[0], data], null_count=raw.null_count)
+
 
-    return decimal_to_bytes(value)
+class UUIDCodec(BinaryCodec):
+    """A codec for UUIDs, which are stored as 16-byte big-endian values and decoded in bulk to fixed(16)"""
+
+    _struct = struct.Struct(">QQ")
+
+    def __init__(self):
+        super().__init__(16)
+
+    def to_bytes(self, value: Value) -> bytes:
+        return self._struct.pack((value.int >> 64) & 0xFFFFFFFFFFFFFFFF, value.int & 0xFFFFFFFFFFFFFFFF)  # type: ignore
+
+    def from_bytes(self, b: bytes) -> Value:
+        unpacked_bytes = self._struct.unpack(b)
+        return uuid.UUID(int=unpacked_bytes[0] << 64 | unpacked_bytes[1])
+
+
+class DecimalCodec(Codec):
+    """A codec for decimals, which are stored as the minimal two's-complement big-endian bytes of their unscaled value"""
+
+    def __init__(self, primitive_type: DecimalType):
+        # the codec must not reference its type, which would keep the type and the cached codec alive
+        self._type = str(primitive_type)
+        self._precision = primitive_type.precision
+        self._scale = primitive_type.scale
+
+    def to_bytes(self, value: Value) -> bytes:
+        """Convert a Decimal value to bytes given a DecimalType instance with defined precision and scale
+
+        Args:
+            value (Decimal): A Decimal instance
+
+        Raises:
+            ValueError: If either the precision or scale of `value` does not match that defined in the DecimalType instance
+
+        Returns:
+            bytes: The byte representation of `value`
+        """
+        sign, digits, exponent = value.as_tuple()  # type: ignore
+
+        if -exponent != self._scale:
+            raise ValueError(f"Cannot serialize value, scale of value does not match type {self._type}: {-exponent}")
+        elif len(digits) > self._precision:
+            raise ValueError(
+                f"Cannot serialize value, precision of value is greater than precision of type {self._type}: {len(digits)}"
+            )
+
+        return decimal_to_bytes(value)  # type: ignore
+
+    def from_bytes(self, b: bytes) -> Value:
+        unscaled = int.from_bytes(b, "big", signed=True)
+        return unscaled_to_decimal(unscaled, self._scale)
+
+    def arrow_type(self) -> "pa.DataType":
+        import pyarrow as pa
+
+        return pa.decimal128(self._precision, self._scale)
+
+    def from_bytes_many(self, buffers: Sequence[Optional[bytes]]) -> "pa.Array":
+        if self._precision > 18:
+            return super().from_bytes_many(buffers)
+
+        import numpy as np
+        import pyarrow as pa
+
+        from iceberg.utils.arrow import from_decimal_values
+
+        raw = pa.array(buffers, type=pa.binary())
+        unscaled = np.fromiter(
+            (0 if b is None else int.from_bytes(b, "big", signed=True) for b in buffers), dtype=np.int64, count=len(raw)
+        )
+        return from_decimal_values(unscaled, self.arrow_type(), raw)
 
 
 @singledispatch
-def from_bytes(primitive_type: PrimitiveType, b: bytes) -> Union[bool, bytes, Decimal, float, int, str, uuid.UUID]:
-    """A generic function which converts bytes to a built-in python value
+def _codec(primitive_type) -> Codec:
+    return UnsupportedCodec(primitive_type)
 
-    Args:
-        primitive_type(PrimitiveType): An implementation of the PrimitiveType base class
-        b(bytes): The bytes to convert
+
+@_codec.register(BooleanType)
+def _(primitive_type) -> Codec:
+    return BooleanCodec()
+
+
+@_codec.register(IntegerType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<i", "<i4", lambda pa: pa.int32())
+
+
+@_codec.register(DateType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<i", "<i4", lambda pa: pa.date32())
+
+
+@_codec.register(LongType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<q", "<i8", lambda pa: pa.int64())
+
+
+@_codec.register(TimeType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<q", "<i8", lambda pa: pa.time64("us"))
+
+
+@_codec.register(TimestampType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<q", "<i8", lambda pa: pa.timestamp("us"))
+
+
+@_codec.register(TimestamptzType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<q", "<i8", lambda pa: pa.timestamp("us", tz="UTC"))
+
+
+@_codec.register(FloatType)
+def _(primitive_type) -> Codec:
     """
-    raise TypeError(f"Cannot deserialize bytes, type {primitive_type} not supported: {str(b)}")
+    Note: float in python is implemented using a double in C. Therefore this involves a conversion of a 32-bit (single precision)
+    float to a 64-bit (double precision) float which introduces some imprecision.
+    """
+    return StructCodec("<f", "<f4", lambda pa: pa.float32())
+
+
+@_codec.register(DoubleType)
+def _(primitive_type) -> Codec:
+    return StructCodec("<d", "<f8", lambda pa: pa.float64())
+
+
+@_codec.register(StringType)
+def _(primitive_type) -> Codec:
+    return StringCodec()
+
+
+@_codec.register(UUIDType)
+def _(primitive_type) -> Codec:
+    return UUIDCodec()
+
+
+@_codec.register(BinaryType)
+def _(primitive_type) -> Codec:
+    return BinaryCodec()
+
+
+@_codec.register(FixedType)
+def _(primitive_type: FixedType) -> Codec:
+    return BinaryCodec(primitive_type.length)
+
+
+@_codec.register(DecimalType)
+def _(primitive_type: DecimalType) -> Codec:
+    return DecimalCodec(primitive_type)
 
 
-@from_bytes.register(BooleanType)
-def _(primitive_type, b: bytes) -> bool:
-    return struct.unpack("<?", b)[0] != 0
+# keyed by the identity of the interned type instances, so that caching a codec does not keep a decimal or fixed type alive
+_CODECS: Dict[int, Codec] = {}
 
 
-@from_bytes.register(IntegerType)
-@from_bytes.register(DateType)
-def _(primitive_type, b: bytes) -> int:
-    return struct.unpack("<i", b)[0]
+def codec_for(primitive_type: PrimitiveType) -> Codec:
+    """Returns the codec of a type, which is created on first use and cached for the lifetime of the type
 
+    Example:
+        >>> codec = codec_for(IntegerType())
+        >>> codec.from_bytes(codec.to_bytes(34))
+        34
+        >>> codec is codec_for(IntegerType())
+        True
+
+    Args:
+        primitive_type (PrimitiveType): An implementation of the PrimitiveType base class
+    """
+    codec = _CODECS.get(id(primitive_type))
+    if codec is None:
+        codec = _CODECS[id(primitive_type)] = _codec(primitive_type)
+        # the codec is dropped with its type, before the id can be reused by another object
+        finalize(primitive_type, _CODECS.pop, id(primitive_type), None)
+    return codec
 
-@from_bytes.register(LongType)
-@from_bytes.register(TimeType)
-@from_bytes.register(TimestampType)
-@from_bytes.register(TimestamptzType)
-def _(primitive_type, b: bytes) -> int:
-    return struct.unpack("<q", b)[0]
 
+def to_bytes(primitive_type: PrimitiveType, value: Value) -> bytes:
+    """Converts a built-in python value to bytes
 
-@from_bytes.register(FloatType)
-def _(primitive_type, b: bytes):
-    return struct.unpack("<f", b)[0]
+    This conversion follows the serialization scheme for storing single values as individual binary values defined in the Iceberg specification that
+    can be found at https://iceberg.apache.org/spec/#appendix-d-single-value-serialization
+
+    Args:
+        primitive_type(PrimitiveType): An implementation of the PrimitiveType base class
+        value: The value to convert to bytes (The type of this value depends on the type--check the codecs for details)
+    """
+    return codec_for(primitive_type).to_bytes(value)
 
 
-@from_bytes.register(DoubleType)
-def _(primitive_type, b: bytes) -> float:
-    return struct.unpack("<d", b)[0]
+def from_bytes(primitive_type: PrimitiveType, b: bytes) -> Value:
+    """Converts bytes to a built-in python value
 
+    Args:
+        primitive_type(PrimitiveType): An implementation of the PrimitiveType base class
+        b(bytes): The bytes to convert
+    """
+    return codec_for(primitive_type).from_bytes(b)
 
-@from_bytes.register(StringType)
-def _(primitive_type: PrimitiveType, b: bytes) -> str:
-    return bytes(b).decode("utf-8")
 
+def from_bytes_many(primitive_type: PrimitiveType, buffers: Sequence[Optional[bytes]]) -> "pa.Array":
+    """Converts a column of byte buffers to an Arrow array in one call, such as the lower bounds of a column in many data files
 
-@from_bytes.register(UUIDType)
-def _(primitive_type, b: bytes) -> uuid.UUID:
-    unpacked_bytes = struct.unpack(">QQ", b)
-    return uuid.UUID(int=unpacked_bytes[0] << 64 | unpacked_bytes[1])
+    Fixed-width values are decoded with a single numpy view instead of unpacking every buffer. Dates, times and
+    timestamps are decoded to the matching Arrow temporal types, UUIDs to fixed(16) and decimals to decimal128.
 
+    Example:
+        >>> from_bytes_many(LongType(), [b"\\x01\\0\\0\\0\\0\\0\\0\\0", None]).to_pylist()
+        [1, None]
 
-@from_bytes.register(BinaryType)
-@from_bytes.register(FixedType)
-def _(primitive_type, b: bytes) -> bytes:
-    return b
+    Args:
+        primitive_type(PrimitiveType): An implementation of the PrimitiveType base class
+        buffers(Sequence[Optional[bytes]]): The bytes to convert, where a missing value is None
 
+    Returns:
+        pa.Array: An array that is null wherever a buffer is None
 
-@from_bytes.register(DecimalType)
-def _(primitive_type, buf: bytes) -> Decimal:
-    unscaled = int.from_bytes(buf, "big", signed=True)
-    return unscaled_to_decimal(unscaled, primitive_type.scale)
+    Raises:
+        ValueError: If a buffer of a fixed-width type has the wrong length
+    """
+    return codec_for(primitive_type).from_bytes_many(buffers)
@@ -17,11 +17,16 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from functools import reduce
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Iterable, List, Optional, Tuple, TypeVar
 
 from iceberg.files import StructProtocol
 from iceberg.schema import Accessor, Schema
-from iceberg.types import NestedField, Singleton
+from iceberg.types import (
+    DoubleType,
+    FloatType,
+    NestedField,
+    Singleton,
+)
 
 T = TypeVar("T")
 
@@ -87,6 +92,10 @@ OPERATION_NEGATIONS = {
     Operation.NOT_IN: Operation.IN,
 }
 
+UNARY_OPERATIONS = {Operation.IS_NULL, Operation.NOT_NULL, Operation.IS_NAN, Operation.NOT_NAN}
+LITERAL_OPERATIONS = {Operation.LT, Operation.LT_EQ, Operation.GT, Operation.GT_EQ, Operation.EQ, Operation.NOT_EQ}
+SET_OPERATIONS = {Operation.IN, Operation.NOT_IN}
+
 
 class Literal(Generic[T], ABC):
     """Literal which has a value and can be converted between types"""
@@ -113,6 +122,9 @@ class Literal(Generic[T], ABC):
     def __eq__(self, other):
         return self.value == other.value
 
+    def __hash__(self):
+        return hash(self.value)
+
     def __ne__(self, other):
         return not self.__eq__(other)
 
@@ -165,6 +177,9 @@ class And(BooleanExpression):
     def __eq__(self, other) -> bool:
         return id(self) == id(other) or (isinstance(other, And) and self.left == other.left and self.right == other.right)
 
+    def __hash__(self) -> int:
+        return hash((And, self.left, self.right))
+
     def __invert__(self) -> "Or":
         return Or(~self.left, ~self.right)
 
@@ -203,6 +218,9 @@ class Or(BooleanExpression):
     def __eq__(self, other) -> bool:
         return id(self) == id(other) or (isinstance(other, Or) and self.left == other.left and self.right == other.right)
 
+    def __hash__(self) -> int:
+        return hash((Or, self.left, self.right))
+
     def __invert__(self) -> "And":
         return And(~self.left, ~self.right)
 
@@ -231,6 +249,9 @@ class Not(BooleanExpression):
     def __eq__(self, other) -> bool:
         return id(self) == id(other) or (isinstance(other, Not) and self.child == other.child)
 
+    def __hash__(self) -> int:
+        return hash((Not, self.child))
+
     def __invert__(self) -> BooleanExpression:
         return self.child
 
@@ -285,11 +306,22 @@ class BoundReference:
     def __repr__(self):
         return f"BoundReference(field={repr(self.field)}, accessor={repr(self._accessor)})"
 
+    def __eq__(self, other):
+        return isinstance(other, BoundReference) and self.field == other.field and self._accessor == other._accessor
+
+    def __hash__(self):
+        return hash((self.field, self._accessor))
+
     @property
     def field(self) -> NestedField:
         """The referenced field"""
         return self._field
 
+    @property
+    def accessor(self) -> Accessor:
+        """The accessor of the value at the field's position"""
+        return self._accessor
+
     def eval(self, struct: StructProtocol) -> Any:
         """Returns the value at the referenced field's position in an object that abides by the StructProtocol
 
@@ -301,6 +333,17 @@ class BoundReference:
         """
         return self._accessor.get(struct)
 
+    def eval_many(self, structs: Iterable[StructProtocol]) -> List[Any]:
+        """Returns the values at the referenced field's position in many objects that abide by the StructProtocol
+
+        Args:
+            structs (Iterable[StructProtocol]): Row objects that abide by the StructProtocol
+
+        Returns:
+            List[Any]: The value at the referenced field's position in each of `structs`
+        """
+        return self._accessor.get_many(structs)
+
 
 class UnboundReference:
     """A reference not yet bound to a field in a schema
@@ -323,6 +366,12 @@ class UnboundReference:
     def __repr__(self) -> str:
         return f"UnboundReference(name={repr(self.name)})"
 
+    def __eq__(self, other):
+        return isinstance(other, UnboundReference) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
     @property
     def name(self) -> str:
         return self._name
@@ -346,3 +395,213 @@ class UnboundReference:
             raise ValueError(f"Cannot find field '{self.name}' in schema: {schema}")
 
         return BoundReference(field=field, accessor=schema.accessor_for_field(field.field_id))
+
+
+class Predicate(BooleanExpression, ABC):
+    """Base class for predicates, which apply an operation to a reference and to zero, one or a set of literals
+
+    Unary operations (IS_NULL, NOT_NULL, IS_NAN, NOT_NAN) take no literal, comparisons (LT, LT_EQ, GT, GT_EQ, EQ,
+    NOT_EQ) take exactly one, and set operations (IN, NOT_IN) take at least one.
+
+    Args:
+        op (Operation): The operation of the predicate
+        term (UnboundReference | BoundReference): The reference that the operation applies to
+        literals (Iterable[Literal], optional): The literals that the operation applies to
+
+    Raises:
+        ValueError: If the operation is not a predicate operation, or does not take that many literals
+    """
+
+    def __init__(self, op: Operation, term: Any, literals: Optional[Iterable[Literal]] = None):
+        literals = tuple(literals) if literals is not None else ()
+        if op in UNARY_OPERATIONS:
+            valid = len(literals) == 0
+        elif op in LITERAL_OPERATIONS:
+            valid = len(literals) == 1
+        elif op in SET_OPERATIONS:
+            valid = len(literals) > 0
+        else:
+            raise ValueError(f"Invalid predicate operation: {op}")
+        if not valid:
+            raise ValueError(f"Invalid number of literals for {op}: {len(literals)}")
+        self._op = op
+        self._term = term
+        self._literals: Tuple[Literal, ...] = literals
+
+    @property
+    def op(self) -> Operation:
+        return self._op
+
+    @property
+    def term(self) -> Any:
+        return self._term
+
+    @property
+    def literals(self) -> Tuple[Literal, ...]:
+        return self._literals
+
+    @property
+    def literal(self) -> Literal:
+        """The literal of a comparison
+
+        Raises:
+            ValueError: If the operation is not a comparison
+        """
+        if self.op not in LITERAL_OPERATIONS:
+            raise ValueError(f"{self.op} does not have a single literal")
+        return self._literals[0]
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self.op == other.op and self.term == other.term and self.literals == other.literals
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.op, self.term, self.literals))
+
+    def __invert__(self) -> "Predicate":
+        return type(self)(self.op.negate(), self.term, self.literals)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.op}, {repr(self.term)}, {repr(list(self.literals))})"
+
+    def __str__(self) -> str:
+        name = self.term.name if isinstance(self.term, UnboundReference) else self.term.field.name
+        if self.op in UNARY_OPERATIONS:
+            return f"{self.op.name.lower()}({name})"
+        elif self.op in SET_OPERATIONS:
+            return f"{name} {self.op.name.lower().replace('_', ' ')} ({', '.join(str(lit) for lit in self.literals)})"
+        return f"{name} {_OPERATION_SYMBOLS[self.op]} {self.literal}"
+
+
+_OPERATION_SYMBOLS = {
+    Operation.LT: "<",
+    Operation.LT_EQ: "<=",
+    Operation.GT: ">",
+    Operation.GT_EQ: ">=",
+    Operation.EQ: "==",
+    Operation.NOT_EQ: "!=",
+}
+
+
+class UnboundPredicate(Predicate):
+    """A predicate on a reference that is not yet bound to a field in a schema
+
+    Example:
+        >>> from iceberg.expressions.literals import literal
+        >>> print(UnboundPredicate(Operation.LT, UnboundReference("id"), [literal(10)]))
+        id < 10
+    """
+
+    def __init__(self, op: Operation, term: UnboundReference, literals: Optional[Iterable[Literal]] = None):
+        super().__init__(op, term, literals)
+
+    @property
+    def term(self) -> UnboundReference:
+        return self._term
+
+    def bind(self, schema: Schema, case_sensitive: bool = True) -> BooleanExpression:
+        """Binds the predicate to a field of a schema and converts its literals to the type of the field
+
+        Predicates that are decided by the field alone are replaced by AlwaysTrue or AlwaysFalse: null checks of
+        required fields, and comparisons with literals that are out of the range of the type. Set operations drop the
+        duplicate and out of range literals, and become comparisons when a single literal remains.
+
+        Example:
+            >>> from iceberg.expressions.literals import literal
+            >>> from iceberg.types import IntegerType
+            >>> schema = Schema(NestedField(1, "id", IntegerType(), is_optional=False), schema_id=1)
+            >>> print(UnboundPredicate(Operation.IN, UnboundReference("id"), [literal(3), literal(3)]).bind(schema))
+            id == 3
+            >>> UnboundPredicate(Operation.LT, UnboundReference("id"), [literal(2**40)]).bind(schema)
+            AlwaysTrue()
+
+        Args:
+            schema (Schema): An Iceberg schema
+            case_sensitive (bool): Whether to consider case when binding the reference to the field
+
+        Raises:
+            ValueError: If the field is not in the schema, a literal cannot be converted to the type of the field, or
+                a NaN check is applied to a field that is not a float or a double
+
+        Returns:
+            BooleanExpression: A BoundPredicate, or AlwaysTrue or AlwaysFalse
+        """
+        from iceberg.expressions.literals import AboveMax, BelowMin
+
+        term = self.term.bind(schema, case_sensitive)
+        field = term.field
+        if self.op in UNARY_OPERATIONS:
+            if self.op in (Operation.IS_NAN, Operation.NOT_NAN) and not isinstance(field.type, (FloatType, DoubleType)):
+                raise ValueError(f"{self.op} cannot be used with a non-floating-point column: {field}")
+            elif self.op == Operation.IS_NULL and field.is_required:
+                return AlwaysFalse()
+            elif self.op == Operation.NOT_NULL and field.is_required:
+                return AlwaysTrue()
+            return BoundPredicate(self.op, term)
+
+        literals = []
+        for lit in self.literals:
+            converted = lit.to(field.type)
+            if converted is None:
+                raise ValueError(f"Invalid value for conversion to type {field.type}: {lit} ({type(lit).__name__})")
+            literals.append(converted)
+
+        if self.op in LITERAL_OPERATIONS:
+            if literals[0] is not AboveMax() and literals[0] is not BelowMin():
+                return BoundPredicate(self.op, term, literals)
+            elif self.op == Operation.NOT_EQ:
+                return AlwaysTrue()
+            elif self.op not in (
+                (Operation.LT, Operation.LT_EQ) if literals[0] is AboveMax() else (Operation.GT, Operation.GT_EQ)
+            ):
+                return AlwaysFalse()
+            # every value is within the bound, but comparisons are false for null and NaN
+            matches: BooleanExpression = AlwaysTrue() if field.is_required else BoundPredicate(Operation.NOT_NULL, term)
+            if isinstance(field.type, (FloatType, DoubleType)):
+                matches = And(matches, BoundPredicate(Operation.NOT_NAN, term))
+            return matches
+
+        # out of range literals match no value, and duplicates are dropped in the order of the literals
+        in_range = list(dict.fromkeys(lit for lit in literals if lit is not AboveMax() and lit is not BelowMin()))
+        if not in_range:
+            return AlwaysFalse() if self.op == Operation.IN else AlwaysTrue()
+        elif len(in_range) == 1:
+            return BoundPredicate(Operation.EQ if self.op == Operation.IN else Operation.NOT_EQ, term, in_range)
+        return BoundPredicate(self.op, term, in_range)
+
+
+class BoundPredicate(Predicate):
+    """A predicate on a reference that is bound to a field in a schema, with literals of the type of the field"""
+
+    def __init__(self, op: Operation, term: BoundReference, literals: Optional[Iterable[Literal]] = None):
+        super().__init__(op, term, literals)
+
+    @property
+    def term(self) -> BoundReference:
+        return self._term
+
+
+def bind(schema: Schema, expr: BooleanExpression, case_sensitive: bool = True) -> BooleanExpression:
+    """Binds every predicate of an expression to a schema
+
+    Args:
+        schema (Schema): An Iceberg schema
+        expr (BooleanExpression): An expression of unbound predicates
+        case_sensitive (bool): Whether to consider case when binding references to fields
+
+    Raises:
+        ValueError: If a predicate cannot be bound, or is already bound
+
+    Returns:
+        BooleanExpression: An equivalent expression of bound predicates
+    """
+    if isinstance(expr, And):
+        return And(bind(schema, expr.left, case_sensitive), bind(schema, expr.right, case_sensitive))
+    elif isinstance(expr, Or):
+        return Or(bind(schema, expr.left, case_sensitive), bind(schema, expr.right, case_sensitive))
+    elif isinstance(expr, Not):
+        return Not(bind(schema, expr.child, case_sensitive))
+    elif isinstance(expr, UnboundPredicate):
+        return expr.bind(schema, case_sensitive)
+    elif isinstance(expr, BoundPredicate):
+        raise ValueError(f"Found already bound predicate: {expr}")
+    return expr
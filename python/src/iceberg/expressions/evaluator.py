@@ -0,0 +1,192 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Evaluation of row filters on rows that abide by the StructProtocol, such as the partition values of manifest entries
+
+A filter is bound to a schema and compiled once into the source of a single Python function, which is executed to
+create the evaluator. The values of the referenced fields are read with their accessor positions inlined, the
+literals are converted to the types of their fields ahead of time, and AND and OR are Python's short-circuiting
+operators, so evaluating a row costs one call rather than a walk of the expression tree.
+
+Comparisons and IN are false for null values, and NOT_EQ, NOT_IN and NOT_NAN are their negations, so they are true
+for null values. A field of a null struct is a null value.
+
+Example:
+    >>> from iceberg.expressions.base import And, Operation, UnboundPredicate, UnboundReference
+    >>> from iceberg.expressions.literals import literal
+    >>> from iceberg.schema import Schema
+    >>> from iceberg.types import IntegerType, NestedField, StringType
+    >>> schema = Schema(NestedField(1, "id", IntegerType()), NestedField(2, "data", StringType()), schema_id=1)
+    >>> row_filter = And(
+    ...     UnboundPredicate(Operation.GT_EQ, UnboundReference("id"), [literal(10)]),
+    ...     UnboundPredicate(Operation.IN, UnboundReference("data"), [literal("a"), literal("b")]),
+    ... )
+    >>> class Row:
+    ...     def __init__(self, *values):
+    ...         self.values = values
+    ...     def get(self, pos):
+    ...         return self.values[pos]
+    >>> evaluator = Evaluator(schema, row_filter)
+    >>> evaluator.eval(Row(12, "a")), evaluator.eval(Row(12, "c")), evaluator.eval(Row(None, "a"))
+    (True, False, False)
+"""
+
+import struct
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    BoundPredicate,
+    Not,
+    Operation,
+    Or,
+    bind,
+)
+from iceberg.files import StructProtocol
+from iceberg.schema import Schema
+from iceberg.types import FloatType
+
+_COMPARISONS = {
+    Operation.LT: "<",
+    Operation.LT_EQ: "<=",
+    Operation.GT: ">",
+    Operation.GT_EQ: ">=",
+}
+
+
+class Evaluator:
+    """Evaluates a row filter on rows that abide by the StructProtocol
+
+    The compiled function is cached for each bound filter, so creating an evaluator for a filter that has been
+    evaluated before, such as once per manifest of a scan, binds it again but does not compile it again. The cache
+    holds the bound filters, with the fields that they reference, but not the schemas that they were bound to.
+
+    Args:
+        schema (Schema): The schema of the rows
+        unbound (BooleanExpression): The row filter, which is not yet bound
+        case_sensitive (bool): Whether to consider case when binding references to fields
+
+    Attributes:
+        eval (Callable[[StructProtocol], bool]): Returns whether a row matches the filter
+    """
+
+    def __init__(self, schema: Schema, unbound: BooleanExpression, case_sensitive: bool = True):
+        self.eval: Callable[[StructProtocol], bool] = _compile_cached(bind(schema, unbound, case_sensitive))
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(bound: BooleanExpression) -> Callable[[StructProtocol], bool]:
+    # bound literals have the types of their fields, so filters whose literals are equal but of different types, such
+    # as True and 1, are told apart by their fields, or fail to bind
+    return compile_expression(bound)
+
+
+def compile_expression(expr: BooleanExpression) -> Callable[[StructProtocol], bool]:
+    """Compiles a bound expression into a function that evaluates it on a row
+
+    Args:
+        expr (BooleanExpression): An expression of bound predicates
+
+    Raises:
+        ValueError: If the expression has a predicate that is not bound
+
+    Returns:
+        Callable[[StructProtocol], bool]: A function that returns whether a row matches the expression
+    """
+    compiler = _Compiler()
+    body = compiler.emit(expr)
+    # every referenced value is read once, in the order in which the expression first uses it
+    lines = ["def evaluate(row):", *compiler.reads, f"    return {body}"]
+    namespace: Dict[str, Any] = dict(compiler.constants)
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["evaluate"]
+
+
+class _Compiler:
+    """Emits the Python source of an expression, collecting the values that it reads and the constants that it uses"""
+
+    def __init__(self):
+        self.values: Dict[Tuple[int, ...], str] = {}
+        self.reads: List[str] = []
+        self.constants: List[Tuple[str, Any]] = []
+
+    def emit(self, expr: BooleanExpression) -> str:
+        if isinstance(expr, And):
+            return f"({self.emit(expr.left)} and {self.emit(expr.right)})"
+        elif isinstance(expr, Or):
+            return f"({self.emit(expr.left)} or {self.emit(expr.right)})"
+        elif isinstance(expr, Not):
+            return f"(not {self.emit(expr.child)})"
+        elif isinstance(expr, AlwaysTrue):
+            return "True"
+        elif isinstance(expr, AlwaysFalse):
+            return "False"
+        elif isinstance(expr, BoundPredicate):
+            return self._emit_predicate(expr)
+        raise ValueError(f"Cannot compile an expression that is not bound: {expr}")
+
+    def _value(self, predicate: BoundPredicate) -> str:
+        return self._read(predicate.term.accessor.positions)
+
+    def _read(self, positions: Tuple[int, ...]) -> str:
+        """Reads the value at a position path into a local, reading each enclosing struct once and stopping at null"""
+        name = self.values.get(positions)
+        if name is None:
+            if len(positions) == 1:
+                getter = f"row.get({positions[0]})"
+            else:
+                parent = self._read(positions[:-1])
+                getter = f"{parent}.get({positions[-1]}) if {parent} is not None else None"
+            name = self.values[positions] = f"v{len(self.values)}"
+            self.reads.append(f"    {name} = {getter}")
+        return name
+
+    def _constant(self, value: Any) -> str:
+        name = f"c{len(self.constants)}"
+        self.constants.append((name, value))
+        return name
+
+    def _literal_value(self, predicate: BoundPredicate, lit) -> Any:
+        if isinstance(predicate.term.field.type, FloatType):
+            # float values are read from 32-bit storage, so the literal is rounded to 32 bits to compare equal
+            return struct.unpack("<f", struct.pack("<f", lit.value))[0]
+        return lit.value
+
+    def _emit_predicate(self, predicate: BoundPredicate) -> str:
+        value = self._value(predicate)
+        op = predicate.op
+        if op == Operation.IS_NULL:
+            return f"({value} is None)"
+        elif op == Operation.NOT_NULL:
+            return f"({value} is not None)"
+        elif op == Operation.IS_NAN:
+            return f"({value} is not None and {value} != {value})"
+        elif op == Operation.NOT_NAN:
+            return f"({value} is None or {value} == {value})"
+        elif op in (Operation.IN, Operation.NOT_IN):
+            values = self._constant(frozenset(self._literal_value(predicate, lit) for lit in predicate.literals))
+            return f"({value} {'in' if op == Operation.IN else 'not in'} {values})"
+
+        constant = self._constant(self._literal_value(predicate, predicate.literal))
+        if op == Operation.EQ:
+            return f"({value} == {constant})"
+        elif op == Operation.NOT_EQ:
+            return f"({value} != {constant})"
+        return f"({value} is not None and {value} {_COMPARISONS[op]} {constant})"
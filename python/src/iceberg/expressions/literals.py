@@ -224,6 +224,9 @@ class FloatLiteral(Literal[float]):
     def __eq__(self, other):
         return self._value32 == other
 
+    def __hash__(self):
+        return hash(self._value32)
+
     def __lt__(self, other):
         return self._value32 < other
 
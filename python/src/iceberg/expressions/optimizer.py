@@ -0,0 +1,326 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Simplification of filters, which makes expression trees smaller and so cheaper to evaluate
+
+The optimizer pushes negations down to the predicates, and then simplifies the predicates of each conjunction and
+disjunction that apply to the same bound reference: duplicates are dropped, equalities are merged into IN, ranges
+are intersected, and contradictions and tautologies are folded into AlwaysFalse and AlwaysTrue.
+
+Every rewrite keeps the results of `iceberg.expressions.evaluator.Evaluator` for every row, including rows with
+null and NaN values. Comparisons and IN are false for null values and their negations (NOT_EQ and NOT_IN) are true,
+while both a range comparison and its negated operation are false for null and NaN. So the negation of a range
+comparison is only rewritten for bound predicates, where the type and the nullability of the field are known.
+
+Example:
+    >>> from iceberg.expressions.base import Or, UnboundPredicate, UnboundReference, bind
+    >>> from iceberg.expressions.literals import literal
+    >>> from iceberg.schema import Schema
+    >>> from iceberg.types import IntegerType, NestedField
+    >>> schema = Schema(NestedField(1, "id", IntegerType()), schema_id=1)
+    >>> def eq(value):
+    ...     return UnboundPredicate(Operation.EQ, UnboundReference("id"), [literal(value)])
+    >>> print(optimize(bind(schema, Or(eq(1), Or(eq(2), eq(1))))))
+    id in (1, 2)
+    >>> print(optimize(bind(schema, And(eq(1), Not(eq(1))))))
+    false
+"""
+
+from functools import reduce
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    BoundPredicate,
+    Literal,
+    Not,
+    Operation,
+    Or,
+    Predicate,
+)
+from iceberg.types import DoubleType, FloatType
+
+_LOWER_BOUNDS = {Operation.GT, Operation.GT_EQ}
+_UPPER_BOUNDS = {Operation.LT, Operation.LT_EQ}
+
+
+def optimize(expr: BooleanExpression) -> BooleanExpression:
+    """Returns a smaller expression that is true for the same rows
+
+    Args:
+        expr (BooleanExpression): An expression, which is best bound so that its predicates can be merged
+
+    Returns:
+        BooleanExpression: An equivalent expression, where no predicate that is bound is under a Not
+    """
+    return _simplify(rewrite_not(expr))
+
+
+def rewrite_not(expr: BooleanExpression) -> BooleanExpression:
+    """Pushes negations down to the predicates, by negating their operations
+
+    Negating a range comparison of a bound predicate also matches the values that the comparison is false for on
+    both sides: null values for optional fields and NaN values for float and double fields. Range comparisons of
+    unbound predicates stay under their Not.
+
+    Example:
+        >>> from iceberg.expressions.base import UnboundReference
+        >>> from iceberg.expressions.literals import literal
+        >>> from iceberg.schema import Schema
+        >>> from iceberg.types import DoubleType, NestedField
+        >>> schema = Schema(NestedField(1, "x", DoubleType()), schema_id=1)
+        >>> x = UnboundReference("x").bind(schema, case_sensitive=True)
+        >>> print(rewrite_not(Not(BoundPredicate(Operation.LT, x, [literal(1.0)]))))
+        ((x >= 1.0 or is_null(x)) or is_nan(x))
+
+    Args:
+        expr (BooleanExpression): An expression
+
+    Returns:
+        BooleanExpression: An equivalent expression without Not above bound predicates
+    """
+    if isinstance(expr, Not):
+        return _negate(expr.child)
+    elif isinstance(expr, And):
+        return And(rewrite_not(expr.left), rewrite_not(expr.right))
+    elif isinstance(expr, Or):
+        return Or(rewrite_not(expr.left), rewrite_not(expr.right))
+    return expr
+
+
+def _negate(expr: BooleanExpression) -> BooleanExpression:
+    if isinstance(expr, Not):
+        return rewrite_not(expr.child)
+    elif isinstance(expr, And):
+        return Or(_negate(expr.left), _negate(expr.right))
+    elif isinstance(expr, Or):
+        return And(_negate(expr.left), _negate(expr.right))
+    elif isinstance(expr, (AlwaysTrue, AlwaysFalse)):
+        return ~expr
+    elif isinstance(expr, Predicate) and expr.op not in _LOWER_BOUNDS | _UPPER_BOUNDS:
+        return ~expr
+    elif isinstance(expr, BoundPredicate):
+        negated: BooleanExpression = ~expr
+        field = expr.term.field
+        if field.is_optional:
+            negated = Or(negated, BoundPredicate(Operation.IS_NULL, expr.term))
+        if isinstance(field.type, (FloatType, DoubleType)):
+            negated = Or(negated, BoundPredicate(Operation.IS_NAN, expr.term))
+        return negated
+    return Not(expr)
+
+
+def _simplify(expr: BooleanExpression) -> BooleanExpression:
+    if isinstance(expr, And):
+        return _simplify_and(_flatten(expr, And))
+    elif isinstance(expr, Or):
+        return _simplify_or(_flatten(expr, Or))
+    return expr
+
+
+def _flatten(expr: BooleanExpression, connective: type) -> List[BooleanExpression]:
+    """Returns the simplified operands of nested conjunctions or disjunctions, without duplicates"""
+    operands: List[BooleanExpression] = []
+    pending = [expr]
+    while pending:
+        operand = pending.pop()
+        if isinstance(operand, connective):
+            pending += [operand.right, operand.left]  # type: ignore
+        else:
+            operands.append(_simplify(operand))
+    return list(dict.fromkeys(operands))
+
+
+def _by_reference(operands: List[BooleanExpression]) -> Tuple[Dict[object, List[BoundPredicate]], List[BooleanExpression]]:
+    """Groups the bound predicates by reference, in the order in which the references first appear"""
+    groups: Dict[object, List[BoundPredicate]] = {}
+    order: List[BooleanExpression] = []
+    for operand in operands:
+        if isinstance(operand, BoundPredicate) and operand.op not in (Operation.IS_NAN, Operation.NOT_NAN):
+            if operand.term not in groups:
+                groups[operand.term] = []
+                order.append(operand.term)  # type: ignore
+            groups[operand.term].append(operand)
+        else:
+            order.append(operand)
+    return groups, order
+
+
+def _simplify_and(operands: List[BooleanExpression]) -> BooleanExpression:
+    if any(isinstance(operand, AlwaysFalse) for operand in operands):
+        return AlwaysFalse()
+    groups, order = _by_reference(operands)
+    conjuncts: List[BooleanExpression] = []
+    for item in order:
+        merged = _intersect(groups[item]) if item in groups else [item]
+        if merged is None:
+            return AlwaysFalse()
+        conjuncts += merged
+    everything: BooleanExpression = AlwaysTrue()
+    return reduce(And, conjuncts, everything)
+
+
+def _simplify_or(operands: List[BooleanExpression]) -> BooleanExpression:
+    if any(isinstance(operand, AlwaysTrue) for operand in operands):
+        return AlwaysTrue()
+    groups, order = _by_reference(operands)
+    disjuncts: List[BooleanExpression] = []
+    for item in order:
+        merged = _unite(groups[item]) if item in groups else [item]
+        if merged is None:
+            return AlwaysTrue()
+        disjuncts += merged
+    nothing: BooleanExpression = AlwaysFalse()
+    return reduce(Or, disjuncts, nothing)
+
+
+def _set_predicate(op: Operation, term, values: List[Literal]) -> BooleanExpression:
+    """Returns IN or NOT_IN over distinct values, as EQ or NOT_EQ for a single value"""
+    if len(values) == 1:
+        return BoundPredicate(Operation.EQ if op == Operation.IN else Operation.NOT_EQ, term, values)
+    return BoundPredicate(op, term, values)
+
+
+def _tightest(predicates: List[BoundPredicate], upper: bool) -> Optional[BoundPredicate]:
+    """Returns the bound that implies the others: the smallest upper or the largest lower bound, exclusive on ties"""
+    tightest = None
+    for predicate in predicates:
+        if tightest is None:
+            tightest = predicate
+        elif predicate.literal == tightest.literal:
+            if predicate.op in (Operation.LT, Operation.GT):
+                tightest = predicate
+        elif (predicate.literal < tightest.literal) == upper:
+            tightest = predicate
+    return tightest
+
+
+def _loosest(predicates: List[BoundPredicate], upper: bool) -> Optional[BoundPredicate]:
+    """Returns the bound that is implied by the others: the largest upper or the smallest lower bound"""
+    loosest = None
+    for predicate in predicates:
+        if loosest is None:
+            loosest = predicate
+        elif predicate.literal == loosest.literal:
+            if predicate.op in (Operation.LT_EQ, Operation.GT_EQ):
+                loosest = predicate
+        elif (predicate.literal > loosest.literal) == upper:
+            loosest = predicate
+    return loosest
+
+
+def _within(value: Literal, lower: Optional[BoundPredicate], upper: Optional[BoundPredicate]) -> bool:
+    if lower is not None and not (value > lower.literal or (value == lower.literal and lower.op == Operation.GT_EQ)):
+        return False
+    if upper is not None and not (value < upper.literal or (value == upper.literal and upper.op == Operation.LT_EQ)):
+        return False
+    return True
+
+
+def _intersect(predicates: List[BoundPredicate]) -> Optional[List[BooleanExpression]]:
+    """Returns the conjuncts that are equivalent to the conjunction of the predicates on a reference, or None when it is
+    a contradiction"""
+    term = predicates[0].term
+    ops = {predicate.op for predicate in predicates}
+    if Operation.IS_NULL in ops:
+        # null values only match IS_NULL and the negations NOT_EQ and NOT_IN, which IS_NULL implies
+        if ops - {Operation.IS_NULL, Operation.NOT_EQ, Operation.NOT_IN}:
+            return None
+        return [BoundPredicate(Operation.IS_NULL, term)]
+
+    lower = _tightest([predicate for predicate in predicates if predicate.op in _LOWER_BOUNDS], upper=False)
+    upper = _tightest([predicate for predicate in predicates if predicate.op in _UPPER_BOUNDS], upper=True)
+    excluded: Set[Literal] = {
+        lit for predicate in predicates if predicate.op in (Operation.NOT_EQ, Operation.NOT_IN) for lit in predicate.literals
+    }
+
+    allowed: Optional[List[Literal]] = None
+    for predicate in predicates:
+        if predicate.op in (Operation.EQ, Operation.IN):
+            values = set(predicate.literals)
+            allowed = list(predicate.literals) if allowed is None else [lit for lit in allowed if lit in values]
+    if allowed is not None:
+        # the values imply every other predicate that they satisfy, including NOT_NULL
+        allowed = [lit for lit in dict.fromkeys(allowed) if lit not in excluded and _within(lit, lower, upper)]
+        return [_set_predicate(Operation.IN, term, allowed)] if allowed else None
+
+    if lower is not None and upper is not None:
+        if lower.literal > upper.literal:
+            return None
+        elif lower.literal == upper.literal:
+            if lower.op == Operation.GT or upper.op == Operation.LT or lower.literal in excluded:
+                return None
+            return [BoundPredicate(Operation.EQ, term, [lower.literal])]
+    conjuncts: List[BooleanExpression] = [bound for bound in (lower, upper) if bound is not None]
+    # the range excludes null values and the values outside of it, so only the exclusions in the range remain
+    exclusions = (
+        lit for predicate in predicates if predicate.op in (Operation.NOT_EQ, Operation.NOT_IN) for lit in predicate.literals
+    )
+    remaining = [lit for lit in dict.fromkeys(exclusions) if _within(lit, lower, upper)]
+    if remaining:
+        conjuncts.append(_set_predicate(Operation.NOT_IN, term, remaining))
+    if Operation.NOT_NULL in ops and lower is None and upper is None:
+        conjuncts.append(BoundPredicate(Operation.NOT_NULL, term))
+    return conjuncts
+
+
+def _unite(predicates: List[BoundPredicate]) -> Optional[List[BooleanExpression]]:
+    """Returns the disjuncts that are equivalent to the disjunction of the predicates on a reference, or None when it is
+    a tautology"""
+    term = predicates[0].term
+    ops = {predicate.op for predicate in predicates}
+    if {Operation.IS_NULL, Operation.NOT_NULL} <= ops:
+        return None
+
+    lower = _loosest([predicate for predicate in predicates if predicate.op in _LOWER_BOUNDS], upper=False)
+    upper = _loosest([predicate for predicate in predicates if predicate.op in _UPPER_BOUNDS], upper=True)
+    included = list(dict.fromkeys(lit for p in predicates if p.op in (Operation.EQ, Operation.IN) for lit in p.literals))
+
+    def in_range(value: Literal) -> bool:
+        return (lower is not None and _within(value, lower, None)) or (upper is not None and _within(value, None, upper))
+
+    excluded: Optional[List[Literal]] = None
+    for predicate in predicates:
+        if predicate.op in (Operation.NOT_EQ, Operation.NOT_IN):
+            values = set(predicate.literals)
+            excluded = list(predicate.literals) if excluded is None else [lit for lit in excluded if lit in values]
+    if excluded is not None:
+        # the negations match null values and every value but the common exclusions, so the other predicates can only
+        # match some of the exclusions
+        if Operation.NOT_NULL in ops:
+            return None
+        excluded = [lit for lit in dict.fromkeys(excluded) if lit not in included and not in_range(lit)]
+        return [_set_predicate(Operation.NOT_IN, term, excluded)] if excluded else None
+    elif Operation.NOT_NULL in ops:
+        # the other predicates only match values that are not null
+        return [BoundPredicate(Operation.NOT_NULL, term)]
+
+    disjuncts: List[BooleanExpression] = [bound for bound in (lower, upper) if bound is not None]
+    included = [lit for lit in included if not in_range(lit)]
+    if included:
+        disjuncts.append(_set_predicate(Operation.IN, term, included))
+    if Operation.IS_NULL in ops:
+        disjuncts.append(BoundPredicate(Operation.IS_NULL, term))
+    return disjuncts
@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Projections of row filters into filters on partition values
+
+An inclusive projection selects every partition that may contain a row that matches the row filter, so the
+partitions and manifests that it rejects can be skipped. A strict projection selects only partitions in which every
+row matches, so the row filter does not have to be evaluated on their rows. Both take a filter that is bound to the
+schema of the partition spec, and return a filter on the partition columns that is not yet bound.
+
+Example:
+    >>> from iceberg.expressions.base import BoundPredicate, Operation, UnboundReference
+    >>> from iceberg.expressions.literals import literal
+    >>> from iceberg.schema import Schema
+    >>> from iceberg.table.partitioning import PartitionField, PartitionSpec
+    >>> from iceberg.transforms import bucket
+    >>> from iceberg.types import LongType, NestedField
+    >>> schema = Schema(NestedField(1, "id", LongType()), schema_id=1)
+    >>> spec = PartitionSpec(schema, 0, [PartitionField(1, 1000, bucket(LongType(), 16), "id_bucket")], 1000)
+    >>> id_ref = UnboundReference("id").bind(schema, case_sensitive=True)
+    >>> print(inclusive_projection(spec, BoundPredicate(Operation.IN, id_ref, [literal(1), literal(2), literal(3)])))
+    id_bucket in (4, 3)
+"""
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    BoundPredicate,
+    Or,
+)
+from iceberg.expressions.optimizer import rewrite_not
+from iceberg.table.partitioning import PartitionSpec
+
+
+def inclusive_projection(spec: PartitionSpec, expr: BooleanExpression) -> BooleanExpression:
+    """Projects a row filter into a filter that is true for every partition that may hold a matching row
+
+    Each predicate becomes the conjunction of its projections through the partition fields of its column, or true
+    when none of them can project it.
+
+    Args:
+        spec (PartitionSpec): The partition spec, whose schema `expr` is bound to
+        expr (BooleanExpression): A bound row filter
+
+    Returns:
+        BooleanExpression: An unbound filter on the partition columns
+    """
+    return _project(spec, rewrite_not(expr), strict=False)
+
+
+def strict_projection(spec: PartitionSpec, expr: BooleanExpression) -> BooleanExpression:
+    """Projects a row filter into a filter that is true only for partitions in which every row matches
+
+    Each predicate becomes the disjunction of its strict projections through the partition fields of its column, or
+    false when none of them can project it.
+
+    Args:
+        spec (PartitionSpec): The partition spec, whose schema `expr` is bound to
+        expr (BooleanExpression): A bound row filter
+
+    Returns:
+        BooleanExpression: An unbound filter on the partition columns
+    """
+    return _project(spec, rewrite_not(expr), strict=True)
+
+
+def _project(spec: PartitionSpec, expr: BooleanExpression, strict: bool) -> BooleanExpression:
+    if isinstance(expr, And):
+        return And(_project(spec, expr.left, strict), _project(spec, expr.right, strict))
+    elif isinstance(expr, Or):
+        return Or(_project(spec, expr.left, strict), _project(spec, expr.right, strict))
+    elif isinstance(expr, (AlwaysTrue, AlwaysFalse)):
+        return expr
+    elif not isinstance(expr, BoundPredicate):
+        raise ValueError(f"Cannot project an expression that is not bound: {expr}")
+
+    result: BooleanExpression = AlwaysFalse() if strict else AlwaysTrue()
+    for field in spec.fields_by_source_id(expr.term.field.field_id):
+        if strict:
+            projected = field.transform.project_strict(field.name, expr)
+            if projected is not None:
+                result = Or(result, projected)
+        else:
+            projected = field.transform.project(field.name, expr)
+            if projected is not None:
+                result = And(result, projected)
+    return result
@@ -0,0 +1,170 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Columnar evaluation of row filters over Arrow record batches with pyarrow.compute
+
+A bound filter is translated into compute kernels that produce a boolean mask for a whole record batch, so residual
+filtering after a scan and filtering of manifest entries run in Arrow's kernels rather than once per row in Python.
+
+The mask has the same semantics as `iceberg.expressions.evaluator.Evaluator` and is never null: comparisons, IN and
+IS_NAN are false for null values, and NOT_EQ, NOT_IN and NOT_NAN are their negations, so they are true for null
+values. NaN is not null, and only IS_NAN and NOT_NAN distinguish it from other values.
+
+Example:
+    >>> from iceberg.expressions.base import Operation, Or, UnboundPredicate, UnboundReference
+    >>> from iceberg.expressions.literals import literal
+    >>> from iceberg.schema import Schema
+    >>> from iceberg.types import DoubleType, NestedField
+    >>> schema = Schema(NestedField(1, "x", DoubleType()), schema_id=1)
+    >>> row_filter = Or(
+    ...     UnboundPredicate(Operation.GT, UnboundReference("x"), [literal(1.0)]),
+    ...     UnboundPredicate(Operation.IS_NAN, UnboundReference("x")),
+    ... )
+    >>> batch = pa.RecordBatch.from_pydict({"x": [0.5, 2.0, None, float("nan")]})
+    >>> ArrowEvaluator(schema, row_filter).mask(batch).to_pylist()
+    [False, True, False, True]
+"""
+
+from typing import Any, Dict
+from uuid import UUID
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    BoundPredicate,
+    Not,
+    Operation,
+    Or,
+    bind,
+)
+from iceberg.schema import Schema
+from iceberg.utils.arrow import field_column
+
+_COMPARISONS = {
+    Operation.LT: pc.less,
+    Operation.LT_EQ: pc.less_equal,
+    Operation.GT: pc.greater,
+    Operation.GT_EQ: pc.greater_equal,
+    Operation.EQ: pc.equal,
+}
+
+
+class ArrowEvaluator:
+    """Evaluates a row filter over record batches whose columns are named as the fields of a schema
+
+    The filter is bound once, when the evaluator is created.
+
+    Args:
+        schema (Schema): The schema of the rows
+        unbound (BooleanExpression): The row filter, which is not yet bound
+        case_sensitive (bool): Whether to consider case when binding references to fields
+    """
+
+    def __init__(self, schema: Schema, unbound: BooleanExpression, case_sensitive: bool = True):
+        self._schema = schema
+        self._bound = bind(schema, unbound, case_sensitive)
+
+    def mask(self, batch: pa.RecordBatch) -> pa.BooleanArray:
+        """Returns whether each row of a record batch matches the filter, as an array without nulls"""
+        return expression_to_mask(self._schema, self._bound, batch)
+
+    def filter(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """Returns the rows of a record batch that match the filter"""
+        return batch.filter(self.mask(batch))
+
+
+def expression_to_mask(schema: Schema, expr: BooleanExpression, batch: pa.RecordBatch) -> pa.BooleanArray:
+    """Evaluates a bound expression over a record batch
+
+    Args:
+        schema (Schema): The schema that the expression is bound to
+        expr (BooleanExpression): An expression of bound predicates
+        batch (pa.RecordBatch): Rows of the schema, with the top-level fields as columns
+
+    Raises:
+        ValueError: If the expression has a predicate that is not bound
+
+    Returns:
+        pa.BooleanArray: Whether each row matches the expression, without nulls
+    """
+    return _MaskBuilder(schema, batch).mask(expr)
+
+
+class _MaskBuilder:
+    """Builds the mask of an expression over one record batch, resolving each referenced column once"""
+
+    def __init__(self, schema: Schema, batch: pa.RecordBatch):
+        self._schema = schema
+        self._batch = batch
+        self._columns: Dict[int, pa.Array] = {}
+
+    def mask(self, expr: BooleanExpression) -> pa.BooleanArray:
+        if isinstance(expr, And):
+            return pc.and_(self.mask(expr.left), self.mask(expr.right))
+        elif isinstance(expr, Or):
+            return pc.or_(self.mask(expr.left), self.mask(expr.right))
+        elif isinstance(expr, Not):
+            return pc.invert(self.mask(expr.child))
+        elif isinstance(expr, (AlwaysTrue, AlwaysFalse)):
+            return pa.array(np.full(self._batch.num_rows, isinstance(expr, AlwaysTrue)))
+        elif isinstance(expr, BoundPredicate):
+            return self._predicate_mask(expr)
+        raise ValueError(f"Cannot evaluate an expression that is not bound: {expr}")
+
+    def _column(self, predicate: BoundPredicate) -> pa.Array:
+        field_id = predicate.term.field.field_id
+        column = self._columns.get(field_id)
+        if column is None:
+            column = self._columns[field_id] = field_column(self._batch, self._schema, field_id)
+        return column
+
+    def _predicate_mask(self, predicate: BoundPredicate) -> pa.BooleanArray:
+        column = self._column(predicate)
+        op = predicate.op
+        if op == Operation.IS_NULL:
+            return pc.is_null(column)
+        elif op == Operation.NOT_NULL:
+            return pc.is_valid(column)
+        elif op in (Operation.IS_NAN, Operation.NOT_NAN):
+            is_nan = pc.fill_null(pc.is_nan(column), False)
+            return is_nan if op == Operation.IS_NAN else pc.invert(is_nan)
+        elif op in (Operation.IN, Operation.NOT_IN):
+            value_set = pa.array([_arrow_value(lit.value) for lit in predicate.literals], type=column.type)
+            is_in = pc.is_in(column, value_set=value_set, skip_nulls=True)
+            return is_in if op == Operation.IN else pc.invert(is_in)
+        elif op == Operation.NOT_EQ:
+            return pc.invert(_fill_false(pc.equal(column, _scalar(predicate, column))))
+        return _fill_false(_COMPARISONS[op](column, _scalar(predicate, column)))
+
+
+def _arrow_value(value: Any) -> Any:
+    # Arrow stores UUIDs as their 16 bytes
+    return value.bytes if isinstance(value, UUID) else value
+
+
+def _scalar(predicate: BoundPredicate, column: pa.Array) -> pa.Scalar:
+    # the literal is converted to the type of the column, so that dates, times and timestamps are compared as such
+    return pa.scalar(_arrow_value(predicate.literal.value), type=column.type)
+
+
+def _fill_false(mask: pa.BooleanArray) -> pa.BooleanArray:
+    return pc.fill_null(mask, False) if mask.null_count > 0 else mask
@@ -0,0 +1,367 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Asyncio counterparts of the FileIO abstraction
+
+Planning that fans out to many metadata files spends most of its time waiting on requests. The classes in this module
+expose the same operations as `iceberg.io.base` as coroutines, so a single event loop can keep many requests in flight.
+`ExecutorFileIO` adapts any synchronous FileIO by running its blocking calls on an executor while limiting the number of
+concurrent requests per host.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlparse
+
+from iceberg.io.base import (
+    DEFAULT_MAX_RANGE_GAP,
+    DEFAULT_MAX_RANGE_SIZE,
+    FileIO,
+    InputFile,
+    InputStream,
+    OutputFile,
+    coalesce_ranges,
+    read_fully,
+    slice_coalesced_ranges,
+)
+
+try:
+    from typing import Protocol, runtime_checkable
+except ImportError:  # pragma: no cover
+    from typing_extensions import Protocol  # type: ignore
+    from typing_extensions import runtime_checkable
+
+T = TypeVar("T")
+
+# The default number of requests that are in flight at the same time for a single host
+DEFAULT_MAX_CONCURRENCY_PER_HOST = 64
+
+# The default number of threads of the executor that ExecutorFileIO creates, which all hosts share
+DEFAULT_MAX_WORKERS = 256
+
+
+@runtime_checkable
+class AsyncInputStream(Protocol):  # pragma: no cover
+    """A protocol for the object returned by AsyncInputFile.open()
+
+    This mirrors InputStream, with the methods that may wait on the underlying storage defined as coroutines.
+    """
+
+    async def read(self, size: int) -> bytes:
+        ...
+
+    def seek(self, offset: int, whence: int) -> None:
+        ...
+
+    def tell(self) -> int:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class AsyncInputFile(ABC):
+    """A base class for asynchronous InputFile implementations
+
+    Args:
+        location(str): A URI or a path to a local file
+
+    Attributes:
+        location(str): The URI or path to a local file for an AsyncInputFile instance
+    """
+
+    def __init__(self, location: str):
+        self._location = location
+
+    @property
+    def location(self) -> str:
+        """The fully-qualified location of the input file"""
+        return self._location
+
+    @abstractmethod
+    async def length(self) -> int:
+        """Returns the total length of the file, in bytes"""
+
+    @abstractmethod
+    async def exists(self) -> bool:
+        """Checks whether the location exists
+
+        Raises:
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+        """
+
+    @abstractmethod
+    async def open(self) -> AsyncInputStream:
+        """Returns an object that matches the AsyncInputStream protocol
+
+        Raises:
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+            FileNotFoundError: If the file at self.location does not exist
+        """
+
+    @abstractmethod
+    async def read_range(self, offset: int, length: int) -> bytes:
+        """Reads `length` bytes starting at `offset`, or until the end of the file is reached
+
+        Raises:
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+            FileNotFoundError: If the file at self.location does not exist
+        """
+
+    async def read(self) -> bytes:
+        """Reads the whole file
+
+        Raises:
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+            FileNotFoundError: If the file at self.location does not exist
+        """
+        return await self.read_range(0, await self.length())
+
+    async def read_ranges(
+        self,
+        ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_RANGE_GAP,
+        max_size: int = DEFAULT_MAX_RANGE_SIZE,
+    ) -> List[memoryview]:
+        """Reads several (offset, length) ranges of the file
+
+        Ranges separated by at most `max_gap` bytes are merged into a single read and the merged reads are awaited
+        concurrently.
+
+        Args:
+            ranges(Sequence[Tuple[int, int]]): The (offset, length) ranges to read
+            max_gap(int): The largest number of unrequested bytes between two ranges that are merged
+            max_size(int): The largest merged range
+
+        Returns:
+            List[memoryview]: A view of the bytes of each range, in the order of `ranges`
+        """
+        merged = coalesce_ranges(ranges, max_gap=max_gap, max_size=max_size)
+        buffers = await asyncio.gather(*[self.read_range(offset, length) for offset, length, _ in merged])
+        return slice_coalesced_ranges(ranges, merged, buffers)
+
+
+class AsyncFileIO(ABC):
+    """A base class for asynchronous FileIO implementations"""
+
+    @abstractmethod
+    def new_input(self, location: str, length: Optional[int] = None) -> AsyncInputFile:
+        """Get an AsyncInputFile instance to read bytes from the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata. It is
+                trusted without being checked, and spares a request for the length of the file
+        """
+
+    @abstractmethod
+    async def delete(self, location: Union[str, InputFile, OutputFile, AsyncInputFile]) -> None:
+        """Delete the file at the given path
+
+        Args:
+            location(str, InputFile, OutputFile, AsyncInputFile): A URI or a path to a local file--if a file instance is
+            provided, the location attribute for that instance is used as the URI to delete
+
+        Raises:
+            PermissionError: If the file at location cannot be accessed due to a permission error
+            FileNotFoundError: When the file at the provided location does not exist
+        """
+
+
+class ExecutorInputStream:
+    """An AsyncInputStream that runs the reads of an InputStream on the executor of an ExecutorFileIO"""
+
+    def __init__(self, file_io: "ExecutorFileIO", location: str, stream: InputStream):
+        self._file_io = file_io
+        self._location = location
+        self._stream = stream
+
+    async def read(self, size: int) -> bytes:
+        return await self._file_io._run(self._location, self._stream.read, size)
+
+    def seek(self, offset: int, whence: int = 0) -> None:
+        self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    async def close(self) -> None:
+        await self._file_io._run(self._location, self._stream.close)
+
+    async def __aenter__(self) -> "ExecutorInputStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+
+class ExecutorInputFile(AsyncInputFile):
+    """An AsyncInputFile that runs the calls of an InputFile on the executor of an ExecutorFileIO
+
+    The InputFile of the adapted FileIO is created on the executor by the first call that needs it, since creating it
+    may block, for example to set up the filesystem of a bucket.
+    """
+
+    def __init__(self, file_io: "ExecutorFileIO", location: str, length: Optional[int] = None):
+        super().__init__(location=location)
+        self._file_io = file_io
+        self._length = length
+        self._input_file: Optional[InputFile] = None
+
+    def _wrapped(self) -> InputFile:
+        if self._input_file is None:
+            self._input_file = self._file_io.file_io.new_input(self.location, length=self._length)
+        return self._input_file
+
+    def _len(self) -> int:
+        return len(self._wrapped())
+
+    def _exists(self) -> bool:
+        return self._wrapped().exists()
+
+    def _open(self) -> InputStream:
+        return self._wrapped().open()
+
+    async def length(self) -> int:
+        return await self._file_io._run(self.location, self._len)
+
+    async def exists(self) -> bool:
+        return await self._file_io._run(self.location, self._exists)
+
+    async def open(self) -> ExecutorInputStream:
+        stream = await self._file_io._run(self.location, self._open)
+        return ExecutorInputStream(self._file_io, self.location, stream)
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        stream = self._open()
+        try:
+            stream.seek(offset, 0)
+            return read_fully(stream, length)
+        finally:
+            stream.close()
+
+    async def read_range(self, offset: int, length: int) -> bytes:
+        return await self._file_io._run(self.location, self._read_range, offset, length)
+
+    def _read(self) -> bytes:
+        input_file = self._wrapped()
+        stream = input_file.open()
+        try:
+            return read_fully(stream, len(input_file))
+        finally:
+            stream.close()
+
+    async def read(self) -> bytes:
+        return await self._file_io._run(self.location, self._read)
+
+
+class ExecutorFileIO(AsyncFileIO):
+    """An AsyncFileIO that adapts a synchronous FileIO by running its blocking calls on an executor
+
+    Each call is a single request against the storage, and at most `max_concurrency_per_host` calls for the same
+    scheme and authority run at the same time. The limits are tied to the event loop that first uses them, so an
+    instance should be used from a single event loop.
+
+    Args:
+        file_io(FileIO): The FileIO to adapt
+        executor(Executor, optional): The executor to run blocking calls on, by default a thread pool with `max_workers`
+            threads that is shut down by `close()`
+        max_concurrency_per_host(int): The largest number of calls in flight for a single host
+        max_workers(int, optional): The number of threads of the default executor, which is the largest number of calls
+            in flight across all hosts; it defaults to the larger of DEFAULT_MAX_WORKERS and `max_concurrency_per_host`
+
+    Examples:
+        >>> import asyncio
+        >>> from iceberg.io.pyarrow import PyArrowFileIO
+        >>> file_io = ExecutorFileIO(PyArrowFileIO())
+        >>> # manifests = asyncio.run(asyncio.gather(*[file_io.new_input(path).read() for path in manifest_paths]))
+        >>> file_io.close()
+    """
+
+    def __init__(
+        self,
+        file_io: FileIO,
+        executor: Optional[Executor] = None,
+        max_concurrency_per_host: int = DEFAULT_MAX_CONCURRENCY_PER_HOST,
+        max_workers: Optional[int] = None,
+    ):
+        if max_concurrency_per_host < 1:
+            raise ValueError(f"Concurrency per host must be positive: {max_concurrency_per_host}")
+        self._file_io = file_io
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers or max(DEFAULT_MAX_WORKERS, max_concurrency_per_host)
+        )
+        self._max_concurrency_per_host = max_concurrency_per_host
+        self._semaphores: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+
+    @property
+    def file_io(self) -> FileIO:
+        """The adapted FileIO"""
+        return self._file_io
+
+    def _semaphore(self, location: str) -> asyncio.Semaphore:
+        parsed_location = urlparse(location)
+        key = (parsed_location.scheme, parsed_location.netloc)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self._max_concurrency_per_host)
+        return semaphore
+
+    async def _run(self, location: str, func: Callable[..., T], *args: Any) -> T:
+        """Runs a blocking call for a location on the executor, within the concurrency limit of its host"""
+        async with self._semaphore(location):
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def new_input(self, location: str, length: Optional[int] = None) -> ExecutorInputFile:
+        """Get an ExecutorInputFile instance to read bytes from the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata
+        """
+        return ExecutorInputFile(self, location, length=length)
+
+    async def delete(self, location: Union[str, InputFile, OutputFile, AsyncInputFile]) -> None:
+        """Delete the file at the given location using the adapted FileIO
+
+        Args:
+            location(str, InputFile, OutputFile, AsyncInputFile): A URI or a path to a local file--if a file instance is
+            provided, the location attribute for that instance is used as the URI to delete
+
+        Raises:
+            PermissionError: If the file at location cannot be accessed due to a permission error
+            FileNotFoundError: When the file at the provided location does not exist
+        """
+        str_path = location.location if isinstance(location, (InputFile, OutputFile, AsyncInputFile)) else location
+        await self._run(str_path, self._file_io.delete, str_path)
+
+    def close(self) -> None:
+        """Shuts down the executor if it was created by this instance"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
@@ -23,8 +23,20 @@ for returning an InputFile instance, an OutputFile instance, and deleting a file
 its location.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Union
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 try:
     from typing import Protocol, runtime_checkable
@@ -75,6 +87,132 @@ class OutputStream(Protocol):  # pragma: no cover
         ...
 
 
+# The largest gap between two ranges that is read instead of issuing a separate request
+DEFAULT_MAX_RANGE_GAP = 8 * 1024
+
+# The largest range that ranges are coalesced into
+DEFAULT_MAX_RANGE_SIZE = 32 * 1024 * 1024
+
+# The number of coalesced ranges that are requested concurrently
+DEFAULT_RANGE_READ_WORKERS = 8
+
+# The number of files that are deleted concurrently by FileIO.delete_many
+DEFAULT_DELETE_WORKERS = 16
+
+# The number of times a throttled delete is retried by FileIO.delete_many
+DEFAULT_DELETE_RETRIES = 3
+
+# The delay before the first retry of a throttled delete, in seconds, it doubles for every further retry
+DEFAULT_RETRY_DELAY = 0.1
+
+
+def coalesce_ranges(
+    ranges: Sequence[Tuple[int, int]], max_gap: int = DEFAULT_MAX_RANGE_GAP, max_size: int = DEFAULT_MAX_RANGE_SIZE
+) -> List[Tuple[int, int, List[int]]]:
+    """Merges (offset, length) ranges that are separated by at most `max_gap` bytes
+
+    Args:
+        ranges(Sequence[Tuple[int, int]]): The (offset, length) ranges to coalesce, in any order
+        max_gap(int): The largest number of unrequested bytes between two ranges that are merged
+        max_size(int): The largest merged range, a single range larger than this is never split
+
+    Returns:
+        List[Tuple[int, int, List[int]]]: The (offset, length) of each merged range, sorted by offset, with
+        the indexes in `ranges` of the ranges it covers
+
+    Raises:
+        ValueError: If a range has a negative offset or length
+
+    Examples:
+        >>> coalesce_ranges([(100, 10), (0, 10), (12, 4)], max_gap=2)
+        [(0, 16, [1, 2]), (100, 10, [0])]
+    """
+    merged: List[Tuple[int, int, List[int]]] = []
+    for index in sorted(range(len(ranges)), key=lambda i: ranges[i]):
+        offset, length = ranges[index]
+        if offset < 0 or length < 0:
+            raise ValueError(f"Cannot read range with a negative offset or length: {(offset, length)}")
+        if merged:
+            start, merged_length, indexes = merged[-1]
+            end = max(start + merged_length, offset + length)
+            if offset - (start + merged_length) <= max_gap and end - start <= max_size:
+                merged[-1] = (start, end - start, indexes + [index])
+                continue
+        merged.append((offset, length, [index]))
+    return merged
+
+
+def read_coalesced_ranges(
+    ranges: Sequence[Tuple[int, int]],
+    read_range: Callable[[int, int], bytes],
+    max_gap: int = DEFAULT_MAX_RANGE_GAP,
+    max_size: int = DEFAULT_MAX_RANGE_SIZE,
+    max_workers: int = DEFAULT_RANGE_READ_WORKERS,
+) -> List[memoryview]:
+    """Reads ranges by coalescing them and issuing the merged reads concurrently
+
+    Args:
+        ranges(Sequence[Tuple[int, int]]): The (offset, length) ranges to read
+        read_range(Callable[[int, int], bytes]): A function that reads `length` bytes at `offset`, it is
+            called from multiple threads when more than one merged range is read
+        max_gap(int): The largest number of unrequested bytes between two ranges that are merged
+        max_size(int): The largest merged range
+        max_workers(int): The largest number of merged ranges read concurrently
+
+    Returns:
+        List[memoryview]: A view of the bytes of each range, in the order of `ranges`. The views share the buffer
+        of the merged read they belong to. A view is shorter than requested when the range extends past the end
+        of the file.
+    """
+    merged = coalesce_ranges(ranges, max_gap=max_gap, max_size=max_size)
+    if len(merged) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(merged))) as executor:
+            buffers = list(executor.map(lambda merged_range: read_range(merged_range[0], merged_range[1]), merged))
+    else:
+        buffers = [read_range(offset, length) for offset, length, _ in merged]
+    return slice_coalesced_ranges(ranges, merged, buffers)
+
+
+def slice_coalesced_ranges(
+    ranges: Sequence[Tuple[int, int]], merged: Sequence[Tuple[int, int, List[int]]], buffers: Sequence[bytes]
+) -> List[memoryview]:
+    """Slices the buffers read for coalesced ranges back into the requested ranges without copying
+
+    Args:
+        ranges(Sequence[Tuple[int, int]]): The (offset, length) ranges that were requested
+        merged(Sequence[Tuple[int, int, List[int]]]): The coalesced ranges returned by `coalesce_ranges`
+        buffers(Sequence[bytes]): The bytes read for each coalesced range
+
+    Returns:
+        List[memoryview]: A view of the bytes of each range, in the order of `ranges`
+    """
+    views: List[memoryview] = [memoryview(b"")] * len(ranges)
+    for (start, _, indexes), buffer in zip(merged, buffers):
+        view = memoryview(buffer)
+        for index in indexes:
+            offset, length = ranges[index]
+            views[index] = view[offset - start : offset - start + length]
+    return views
+
+
+def read_fully(stream: InputStream, length: int) -> bytes:
+    """Reads `length` bytes from a stream, or until the end of the stream is reached
+
+    Args:
+        stream(InputStream): The stream to read from
+        length(int): The number of bytes to read
+    """
+    chunks = []
+    remaining = length
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
 class InputFile(ABC):
     """A base class for InputFile implementations
 
@@ -119,6 +257,43 @@ class InputFile(ABC):
             FileNotFoundError: If the file at self.location does not exist
         """
 
+    def read_ranges(
+        self,
+        ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_RANGE_GAP,
+        max_size: int = DEFAULT_MAX_RANGE_SIZE,
+        max_workers: int = DEFAULT_RANGE_READ_WORKERS,
+    ) -> List[memoryview]:
+        """Reads several (offset, length) ranges of the file
+
+        Ranges separated by at most `max_gap` bytes are merged into a single read and the merged reads are issued
+        concurrently. This implementation opens a stream for each merged read, implementations that support
+        positional reads on a single stream should override it.
+
+        Args:
+            ranges(Sequence[Tuple[int, int]]): The (offset, length) ranges to read
+            max_gap(int): The largest number of unrequested bytes between two ranges that are merged
+            max_size(int): The largest merged range
+            max_workers(int): The largest number of merged ranges read concurrently
+
+        Returns:
+            List[memoryview]: A view of the bytes of each range, in the order of `ranges`
+
+        Raises:
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+            FileNotFoundError: If the file at self.location does not exist
+        """
+
+        def read_range(offset: int, length: int) -> bytes:
+            stream = self.open()
+            try:
+                stream.seek(offset, 0)
+                return read_fully(stream, length)
+            finally:
+                stream.close()
+
+        return read_coalesced_ranges(ranges, read_range, max_gap=max_gap, max_size=max_size, max_workers=max_workers)
+
 
 class OutputFile(ABC):
     """A base class for OutputFile implementations
@@ -177,11 +352,13 @@ class FileIO(ABC):
     """A base class for FileIO implementations"""
 
     @abstractmethod
-    def new_input(self, location: str) -> InputFile:
+    def new_input(self, location: str, length: Optional[int] = None) -> InputFile:
         """Get an InputFile instance to read bytes from the file at the given location
 
         Args:
             location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata. It is
+                trusted without being checked, and spares a request for the length of the file
         """
 
     @abstractmethod
@@ -204,3 +381,67 @@ class FileIO(ABC):
             PermissionError: If the file at location cannot be accessed due to a permission error
             FileNotFoundError: When the file at the provided location does not exist
         """
+
+    def delete_many(
+        self,
+        locations: Iterable[Union[str, InputFile, OutputFile]],
+        max_workers: int = DEFAULT_DELETE_WORKERS,
+        max_retries: int = DEFAULT_DELETE_RETRIES,
+    ) -> Dict[str, Optional[Exception]]:
+        """Delete many files concurrently
+
+        Deletes are issued on a thread pool and at most a few times `max_workers` locations are pending at any time,
+        so `locations` can be a lazy iterable over millions of files. A delete that fails with an error recognized as
+        throttling by the implementation is retried with an exponential backoff. A location that occurs more than once
+        is deleted once.
+
+        Args:
+            locations(Iterable[str | InputFile | OutputFile]): URIs or paths to local files--for InputFile and OutputFile
+                instances the location attribute is used
+            max_workers(int): The largest number of deletes in flight
+            max_retries(int): The largest number of times a throttled delete is retried
+
+        Returns:
+            Dict[str, Optional[Exception]]: The result for each location, None when the file was deleted, otherwise
+            the error that was raised by `delete`
+        """
+
+        def delete(location: str) -> Optional[Exception]:
+            for attempt in range(max_retries + 1):
+                try:
+                    self.delete(location)
+                    return None
+                except Exception as e:  # pylint: disable=broad-except
+                    if attempt == max_retries or not self._is_throttled(e):
+                        return e
+                    time.sleep(DEFAULT_RETRY_DELAY * 2**attempt)
+            return None  # pragma: no cover
+
+        results: Dict[str, Optional[Exception]] = {}
+        submitted: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Dict[Future, str] = {}
+            for location in locations:
+                str_path = location.location if isinstance(location, (InputFile, OutputFile)) else location
+                if str_path in submitted:
+                    continue
+                submitted.add(str_path)
+                pending[executor.submit(delete, str_path)] = str_path
+                if len(pending) >= 2 * max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(done, pending, results)
+            _collect(set(pending), pending, results)
+        return results
+
+    def _is_throttled(self, error: Exception) -> bool:
+        """Returns whether an error raised by `delete` means that the storage is throttling requests
+
+        Implementations should override this to let `delete_many` retry throttled deletes.
+        """
+        return False
+
+
+def _collect(done: Set[Future], pending: Dict[Future, str], results: Dict[str, Optional[Exception]]) -> None:
+    """Moves the results of finished futures from `pending` to `results`"""
+    for future in done:
+        results[pending.pop(future)] = future.result()
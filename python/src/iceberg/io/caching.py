@@ -0,0 +1,491 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A FileIO wrapper that caches immutable files in fixed-size blocks
+
+Iceberg metadata files, manifest lists and manifests are never modified once they are written, so their content can be
+cached by location without any validation. `CachingFileIO` wraps any FileIO and serves reads of such files from a
+`BlockCache` that keeps recently used blocks in memory and, optionally, in a directory on local disk that survives
+restarts. Both tiers evict the least recently used blocks when they exceed their byte budget. File lengths are cached
+in both tiers as well, within their own entry count, so that opening a cached file needs no request at all.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from iceberg.io.base import (
+    DEFAULT_MAX_RANGE_GAP,
+    DEFAULT_MAX_RANGE_SIZE,
+    DEFAULT_RANGE_READ_WORKERS,
+    FileIO,
+    InputFile,
+    InputStream,
+    OutputFile,
+    read_fully,
+)
+
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_LENGTHS = 100_000
+
+
+def is_immutable_metadata(location: str) -> bool:
+    """Returns whether a location is a table metadata file, a manifest list, or a manifest
+
+    Manifest lists and manifests are Avro files in the metadata directory of a table, while Avro data files are under
+    its data directory and are not cached.
+
+    Examples:
+        >>> is_immutable_metadata("s3://bucket/table/metadata/00001-uuid.metadata.json")
+        True
+        >>> is_immutable_metadata("s3://bucket/table/metadata/snap-1-1-uuid.avro")
+        True
+        >>> is_immutable_metadata("s3://bucket/table/metadata/version-hint.text")
+        False
+        >>> is_immutable_metadata("s3://bucket/table/data/00000-0-uuid.avro")
+        False
+    """
+    if location.endswith(".metadata.json"):
+        return True
+    directory, _, name = location.rpartition("/")
+    return name.endswith(".avro") and directory.endswith("/metadata")
+
+
+class BlockCache:
+    """A thread-safe LRU cache of fixed-size file blocks with a memory tier and an optional disk tier
+
+    Blocks are keyed by file location and block index. Every block that is added is kept in memory and, when a
+    directory is configured, written to disk. A block that is only found on disk is promoted back to memory. File
+    lengths are kept the same way, each tier holding at most `max_lengths` of them.
+
+    Args:
+        block_size(int): The size of each block in bytes, the last block of a file may be shorter
+        memory_bytes(int): The byte budget of the memory tier
+        directory(str, optional): The directory of the disk tier, blocks and lengths already in it are reused
+        disk_bytes(int): The byte budget of the disk tier
+        max_lengths(int): The number of file lengths that each tier holds
+    """
+
+    def __init__(
+        self,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        directory: Optional[str] = None,
+        disk_bytes: int = DEFAULT_DISK_BYTES,
+        max_lengths: int = DEFAULT_MAX_LENGTHS,
+    ):
+        if block_size <= 0:
+            raise ValueError(f"Block size must be positive: {block_size}")
+        self._block_size = block_size
+        self._memory_bytes = memory_bytes
+        self._directory = directory
+        self._disk_bytes = disk_bytes
+        self._max_lengths = max_lengths
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._memory_used = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_used = 0
+        self._lengths: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_lengths: "OrderedDict[str, None]" = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._load_disk_index()
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def _load_disk_index(self) -> None:
+        """Indexes the blocks and lengths left on disk by a previous cache, least recently modified first
+
+        Temporary files of writes that a previous cache did not finish are removed.
+        """
+        entries = []
+        for name in os.listdir(self._directory):
+            path = os.path.join(self._directory, name)  # type: ignore
+            try:
+                if name.endswith(".tmp"):
+                    os.remove(path)
+                elif name.endswith((".block", ".length")):
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, name, stat.st_size))
+            except OSError:
+                pass
+        for _, name, size in sorted(entries):
+            if name.endswith(".length"):
+                self._disk_lengths[name] = None
+            else:
+                self._disk[name] = size
+                self._disk_used += size
+        self._evict_disk()
+        self._evict_disk_lengths()
+
+    @staticmethod
+    def _digest(location: str) -> str:
+        return hashlib.sha256(location.encode("utf-8")).hexdigest()
+
+    def _block_name(self, location: str, index: int) -> str:
+        return f"{self._digest(location)}-{self._block_size}-{index}.block"
+
+    def _length_name(self, location: str) -> str:
+        return f"{self._digest(location)}.length"
+
+    def _remove_files(self, names: List[str]) -> None:
+        for name in names:
+            try:
+                os.remove(os.path.join(self._directory, name))  # type: ignore
+            except OSError:
+                pass
+
+    def get(self, location: str, index: int) -> Optional[bytes]:
+        """Returns a cached block, or None if it is not cached"""
+        key = (location, index)
+        with self._lock:
+            block = self._memory.get(key)
+            if block is not None:
+                self._memory.move_to_end(key)
+                return block
+            name = self._block_name(location, index)
+            if name not in self._disk:
+                return None
+            self._disk.move_to_end(name)
+
+        try:
+            with open(os.path.join(self._directory, name), "rb") as f:  # type: ignore
+                block = f.read()
+        except OSError:
+            with self._lock:
+                self._disk_used -= self._disk.pop(name, 0)
+            return None
+
+        with self._lock:
+            self._put_memory(key, block)
+        return block
+
+    def put(self, location: str, index: int, block: bytes) -> None:
+        """Adds a block to the memory tier and, when configured, to the disk tier"""
+        with self._lock:
+            self._put_memory((location, index), block)
+        if self._directory is not None:
+            self._put_disk(self._block_name(location, index), block)
+
+    def _put_memory(self, key: Tuple[str, int], block: bytes) -> None:
+        if len(block) > self._memory_bytes:
+            return
+        self._memory_used -= len(self._memory.pop(key, b""))
+        self._memory[key] = block
+        self._memory_used += len(block)
+        while self._memory_used > self._memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= len(evicted)
+
+    def _write_file(self, name: str, content: bytes) -> bool:
+        """Writes a file of the disk tier and returns whether it was written"""
+        # Write to a temporary file first so that a concurrent reader never sees a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, os.path.join(self._directory, name))  # type: ignore
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        return True
+
+    def _put_disk(self, name: str, block: bytes) -> None:
+        if len(block) > self._disk_bytes or not self._write_file(name, block):
+            return
+        with self._lock:
+            self._disk_used -= self._disk.pop(name, 0)
+            self._disk[name] = len(block)
+            self._disk_used += len(block)
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        evicted = []
+        while self._disk_used > self._disk_bytes:
+            name, size = self._disk.popitem(last=False)
+            self._disk_used -= size
+            evicted.append(name)
+        self._remove_files(evicted)
+
+    def _evict_disk_lengths(self) -> None:
+        evicted = []
+        while len(self._disk_lengths) > self._max_lengths:
+            name, _ = self._disk_lengths.popitem(last=False)
+            evicted.append(name)
+        self._remove_files(evicted)
+
+    def _put_memory_length(self, location: str, length: int) -> None:
+        self._lengths[location] = length
+        self._lengths.move_to_end(location)
+        while len(self._lengths) > self._max_lengths:
+            self._lengths.popitem(last=False)
+
+    def get_length(self, location: str) -> Optional[int]:
+        """Returns the cached length of a file, or None if it is not cached"""
+        with self._lock:
+            length = self._lengths.get(location)
+            if length is not None:
+                self._lengths.move_to_end(location)
+                return length
+            name = self._length_name(location)
+            if name not in self._disk_lengths:
+                return None
+            self._disk_lengths.move_to_end(name)
+
+        try:
+            with open(os.path.join(self._directory, name), "rb") as f:  # type: ignore
+                length = int(f.read())
+        except (OSError, ValueError):
+            with self._lock:
+                self._disk_lengths.pop(name, None)
+            return None
+
+        with self._lock:
+            self._put_memory_length(location, length)
+        return length
+
+    def put_length(self, location: str, length: int) -> None:
+        """Caches the length of a file in memory and, when configured, on disk"""
+        with self._lock:
+            self._put_memory_length(location, length)
+            name = self._length_name(location)
+            if self._directory is None or name in self._disk_lengths:
+                return
+        if self._write_file(name, str(length).encode("ascii")):
+            with self._lock:
+                self._disk_lengths[name] = None
+                self._evict_disk_lengths()
+
+    def invalidate(self, location: str) -> None:
+        """Removes the cached length and all cached blocks of a file"""
+        with self._lock:
+            self._lengths.pop(location, None)
+            for key in [key for key in self._memory if key[0] == location]:
+                self._memory_used -= len(self._memory.pop(key))
+            prefix = self._block_name(location, 0).rsplit("-", 1)[0] + "-"
+            names = [name for name in self._disk if name.startswith(prefix)]
+            for name in names:
+                self._disk_used -= self._disk.pop(name)
+            length_name = self._length_name(location)
+            if length_name in self._disk_lengths:
+                del self._disk_lengths[length_name]
+                names.append(length_name)
+        self._remove_files(names)
+
+    def memory_usage(self) -> int:
+        """The number of bytes held by the memory tier"""
+        with self._lock:
+            return self._memory_used
+
+    def disk_usage(self) -> int:
+        """The number of bytes held by the disk tier"""
+        with self._lock:
+            return self._disk_used
+
+
+class CachingInputStream:
+    """An InputStream that reads through a BlockCache, reading missing blocks from an InputFile
+
+    Args:
+        input_file(InputFile): The file to read missing blocks from
+        length(int): The length of the file
+        cache(BlockCache): The cache of blocks
+    """
+
+    def __init__(self, input_file: InputFile, length: int, cache: BlockCache):
+        self._input_file = input_file
+        self._length = length
+        self._cache = cache
+        self._position = 0
+        self._stream: Optional[InputStream] = None
+        self._closed = False
+
+    def _block(self, index: int) -> bytes:
+        block = self._cache.get(self._input_file.location, index)
+        if block is None:
+            if self._stream is None:
+                self._stream = self._input_file.open()
+            self._stream.seek(index * self._cache.block_size, 0)
+            block = read_fully(self._stream, self._cache.block_size)
+            self._cache.put(self._input_file.location, index, block)
+        return block
+
+    def read(self, size: int = -1) -> bytes:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        end = self._length if size < 0 else min(self._length, self._position + size)
+        if end <= self._position:
+            return b""
+
+        block_size = self._cache.block_size
+        chunks: List[bytes] = []
+        for index in range(self._position // block_size, (end - 1) // block_size + 1):
+            block = self._block(index)
+            start = max(self._position - index * block_size, 0)
+            stop = min(end - index * block_size, len(block))
+            chunks.append(block[start:stop] if start > 0 or stop < len(block) else block)
+        self._position = end
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def seek(self, offset: int, whence: int = 0) -> None:
+        if whence == 0:
+            self._position = offset
+        elif whence == 1:
+            self._position += offset
+        elif whence == 2:
+            self._position = self._length + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if self._position < 0:
+            raise ValueError(f"Cannot seek to a negative position: {self._position}")
+
+    def tell(self) -> int:
+        return self._position
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._closed = True
+
+    def __enter__(self) -> "CachingInputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class CachingInputFile(InputFile):
+    """An InputFile that serves reads of immutable files from a BlockCache
+
+    Args:
+        input_file(InputFile): The wrapped InputFile
+        cache(BlockCache): The cache of blocks
+        cacheable(bool): Whether the file is immutable and may be cached, otherwise every call is delegated
+    """
+
+    def __init__(self, input_file: InputFile, cache: BlockCache, cacheable: bool):
+        super().__init__(location=input_file.location)
+        self._input_file = input_file
+        self._cache = cache
+        self._cacheable = cacheable
+
+    def __len__(self) -> int:
+        if not self._cacheable:
+            return len(self._input_file)
+        length = self._cache.get_length(self.location)
+        if length is None:
+            length = len(self._input_file)
+            self._cache.put_length(self.location, length)
+        return length
+
+    def exists(self) -> bool:
+        if self._cacheable and self._cache.get_length(self.location) is not None:
+            return True
+        return self._input_file.exists()
+
+    def open(self) -> InputStream:
+        if not self._cacheable:
+            return self._input_file.open()
+        return CachingInputStream(self._input_file, len(self), self._cache)
+
+    def read_ranges(
+        self,
+        ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_RANGE_GAP,
+        max_size: int = DEFAULT_MAX_RANGE_SIZE,
+        max_workers: int = DEFAULT_RANGE_READ_WORKERS,
+    ) -> List[memoryview]:
+        if not self._cacheable:
+            return self._input_file.read_ranges(ranges, max_gap=max_gap, max_size=max_size, max_workers=max_workers)
+        return super().read_ranges(ranges, max_gap=max_gap, max_size=max_size, max_workers=max_workers)
+
+
+class CachingFileIO(FileIO):
+    """A FileIO that wraps another FileIO and caches reads of immutable files
+
+    Only locations accepted by `cacheable` are cached, by default table metadata files, manifest lists and manifests.
+    Cached files are never validated against the underlying storage. Writes are delegated, and deleting a file through
+    this FileIO removes it from the cache.
+
+    Args:
+        file_io(FileIO): The wrapped FileIO
+        cache(BlockCache, optional): The cache to use, by default an in-memory BlockCache
+        cacheable(Callable[[str], bool]): Returns whether the file at a location is immutable
+
+    Examples:
+        >>> from iceberg.io.pyarrow import PyArrowFileIO
+        >>> file_io = CachingFileIO(PyArrowFileIO(), BlockCache(block_size=1024 * 1024))
+        >>> # file_io.new_input("s3://bucket/table/metadata/snap-1-uuid.avro").open().read()
+    """
+
+    def __init__(
+        self,
+        file_io: FileIO,
+        cache: Optional[BlockCache] = None,
+        cacheable: Callable[[str], bool] = is_immutable_metadata,
+    ):
+        self._file_io = file_io
+        self._cache = cache or BlockCache()
+        self._cacheable = cacheable
+
+    @property
+    def cache(self) -> BlockCache:
+        return self._cache
+
+    def new_input(self, location: str, length: Optional[int] = None) -> CachingInputFile:
+        """Get a CachingInputFile instance to read bytes from the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata
+        """
+        return CachingInputFile(self._file_io.new_input(location, length=length), self._cache, self._cacheable(location))
+
+    def new_output(self, location: str) -> OutputFile:
+        """Get an OutputFile instance of the wrapped FileIO for the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+        """
+        return self._file_io.new_output(location)
+
+    def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
+        """Delete the file at the given location and remove it from the cache
+
+        Args:
+            location(str, InputFile, OutputFile): A URI or a path to a local file--if an InputFile instance or an
+            OutputFile instance is provided, the location attribute for that instance is used as the location to delete
+        """
+        str_path = location.location if isinstance(location, (InputFile, OutputFile)) else location
+        self._cache.invalidate(str_path)
+        self._file_io.delete(str_path)
+
+    def _is_throttled(self, error: Exception) -> bool:
+        # delete_many is inherited so that each delete invalidates the cache, and retries the errors of the wrapped FileIO
+        return self._file_io._is_throttled(error)  # pylint: disable=protected-access
@@ -0,0 +1,423 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A FileIO wrapper that records the number, size and latency of I/O operations
+
+`InstrumentedFileIO` wraps any FileIO and records every operation in an `IOMetrics` instance, tagged by the scheme of the
+location and the role of the file in the table (metadata, manifest list, manifest or data). The metrics can be
+snapshotted and reset cheaply, for example to attach the I/O done by a scan to its scan report.
+
+Example:
+    >>> from iceberg.io.pyarrow import PyArrowFileIO
+    >>> file_io = InstrumentedFileIO(PyArrowFileIO())
+    >>> # file_io.new_input("s3://bucket/table/metadata/snap-1-uuid.avro").open().read()
+    >>> snapshot = file_io.metrics.snapshot()
+    >>> # snapshot[MetricKey(IOOperation.READ, "s3", FileRole.MANIFEST_LIST)].bytes
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlparse
+
+from iceberg.io.base import (
+    DEFAULT_MAX_RANGE_GAP,
+    DEFAULT_MAX_RANGE_SIZE,
+    DEFAULT_RANGE_READ_WORKERS,
+    FileIO,
+    InputFile,
+    InputStream,
+    OutputFile,
+    OutputStream,
+)
+
+T = TypeVar("T")
+
+
+class IOOperation(Enum):
+    """An enum of the operations recorded by InstrumentedFileIO"""
+
+    OPEN = auto()
+    READ = auto()
+    SEEK = auto()
+    LENGTH = auto()
+    EXISTS = auto()
+    CREATE = auto()
+    WRITE = auto()
+    DELETE = auto()
+
+
+class FileRole(Enum):
+    """An enum of the roles a file plays in a table"""
+
+    METADATA = auto()
+    MANIFEST_LIST = auto()
+    MANIFEST = auto()
+    DATA = auto()
+    OTHER = auto()
+
+
+def infer_file_role(location: str) -> FileRole:
+    """Infers the role of a file from the naming conventions of its location
+
+    Examples:
+        >>> infer_file_role("s3://bucket/table/metadata/00001-uuid.metadata.json")
+        <FileRole.METADATA: 1>
+        >>> infer_file_role("s3://bucket/table/metadata/snap-1-1-uuid.avro")
+        <FileRole.MANIFEST_LIST: 2>
+        >>> infer_file_role("s3://bucket/table/metadata/uuid-m0.avro")
+        <FileRole.MANIFEST: 3>
+        >>> infer_file_role("s3://bucket/table/data/00000-0-uuid.parquet")
+        <FileRole.DATA: 4>
+    """
+    name = location.rsplit("/", 1)[-1]
+    if name.endswith(".metadata.json"):
+        return FileRole.METADATA
+    elif name.endswith(".avro") and "/metadata/" in location:
+        return FileRole.MANIFEST_LIST if name.startswith("snap-") else FileRole.MANIFEST
+    elif name.endswith((".parquet", ".orc", ".avro")):
+        return FileRole.DATA
+    return FileRole.OTHER
+
+
+class MetricKey(NamedTuple):
+    """The tags of a recorded operation"""
+
+    operation: IOOperation
+    scheme: str
+    role: FileRole
+
+
+# Latencies are bucketed by powers of two of microseconds: bucket 0 holds latencies under 1us and bucket i holds
+# latencies in [2^(i-1), 2^i) us, with the last bucket also holding everything above
+HISTOGRAM_BUCKETS = 32
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    """A snapshot of the metrics recorded for one MetricKey
+
+    Attributes:
+        count(int): The number of operations
+        errors(int): The number of operations that raised an error
+        bytes(int): The number of bytes read or written
+        total_seconds(float): The sum of the latencies of all operations
+        histogram(Tuple[int, ...]): The number of operations in each latency bucket
+    """
+
+    count: int
+    errors: int
+    bytes: int
+    total_seconds: float
+    histogram: Tuple[int, ...]
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Returns an upper bound of the latency percentile, in seconds, from the histogram
+
+        Args:
+            percentile(float): The percentile in [0, 100]
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(percentile / 100.0 * self.count)))
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                break
+        return (1 << bucket) / 1_000_000
+
+
+class _Counters:
+    """The mutable metrics of one MetricKey"""
+
+    __slots__ = ("count", "errors", "bytes", "total_seconds", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.total_seconds = 0.0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def snapshot(self) -> OperationStats:
+        return OperationStats(self.count, self.errors, self.bytes, self.total_seconds, tuple(self.histogram))
+
+
+class IOMetrics:
+    """A thread-safe registry of operation counts, byte counts and latency histograms"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[MetricKey, _Counters] = {}
+
+    def record(self, key: MetricKey, seconds: float, num_bytes: int = 0, error: bool = False) -> None:
+        """Records a single operation
+
+        Args:
+            key(MetricKey): The tags of the operation
+            seconds(float): The latency of the operation
+            num_bytes(int): The number of bytes read or written
+            error(bool): Whether the operation raised an error
+        """
+        bucket = min(int(seconds * 1_000_000).bit_length(), HISTOGRAM_BUCKETS - 1)
+        with self._lock:
+            counters = self._counters.get(key)
+            if counters is None:
+                counters = self._counters[key] = _Counters()
+            counters.count += 1
+            counters.errors += error
+            counters.bytes += num_bytes
+            counters.total_seconds += seconds
+            counters.histogram[bucket] += 1
+
+    def snapshot(self) -> Dict[MetricKey, OperationStats]:
+        """Returns a copy of the metrics recorded so far"""
+        with self._lock:
+            return {key: counters.snapshot() for key, counters in self._counters.items()}
+
+    def reset(self) -> Dict[MetricKey, OperationStats]:
+        """Clears the metrics and returns the ones recorded until now"""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+        return {key: value.snapshot() for key, value in counters.items()}
+
+    def total(self, operation: IOOperation) -> OperationStats:
+        """Returns the metrics of an operation summed over all schemes and roles"""
+        stats = [value for key, value in self.snapshot().items() if key.operation == operation]
+        histogram = [0] * HISTOGRAM_BUCKETS
+        for value in stats:
+            histogram = [total + count for total, count in zip(histogram, value.histogram)]
+        return OperationStats(
+            count=sum(value.count for value in stats),
+            errors=sum(value.errors for value in stats),
+            bytes=sum(value.bytes for value in stats),
+            total_seconds=sum(value.total_seconds for value in stats),
+            histogram=tuple(histogram),
+        )
+
+
+class _Recorder:
+    """Records the operations on a single location"""
+
+    __slots__ = ("_metrics", "_keys")
+
+    def __init__(self, metrics: IOMetrics, location: str, role: FileRole):
+        self._metrics = metrics
+        scheme = urlparse(location).scheme or "file"
+        self._keys = {operation: MetricKey(operation, scheme, role) for operation in IOOperation}
+
+    def record(self, operation: IOOperation, start: float, num_bytes: int = 0, error: bool = False) -> None:
+        """Records an operation that started at `start`, as returned by time.perf_counter()"""
+        self._metrics.record(self._keys[operation], time.perf_counter() - start, num_bytes=num_bytes, error=error)
+
+    def timed(self, operation: IOOperation, func: Callable[..., T], *args: Any) -> T:
+        """Calls `func` and records its latency"""
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception:
+            self.record(operation, start, error=True)
+            raise
+        self.record(operation, start)
+        return result
+
+
+class InstrumentedInputStream:
+    """An InputStream that records reads and seeks on the wrapped stream"""
+
+    def __init__(self, stream: InputStream, recorder: _Recorder):
+        self._stream = stream
+        self._recorder = recorder
+
+    def read(self, size: int = -1) -> bytes:
+        start = time.perf_counter()
+        try:
+            data = self._stream.read(size) if size >= 0 else self._stream.read()  # type: ignore
+        except Exception:
+            self._recorder.record(IOOperation.READ, start, error=True)
+            raise
+        self._recorder.record(IOOperation.READ, start, num_bytes=len(data))
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> None:
+        self._recorder.timed(IOOperation.SEEK, self._stream.seek, offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def closed(self) -> bool:
+        # pyarrow and io streams define closed as a property rather than as a method
+        closed = self._stream.closed
+        return closed() if callable(closed) else closed
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __enter__(self) -> "InstrumentedInputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class InstrumentedOutputStream:
+    """An OutputStream that records writes on the wrapped stream"""
+
+    def __init__(self, stream: OutputStream, recorder: _Recorder):
+        self._stream = stream
+        self._recorder = recorder
+
+    def write(self, b: bytes) -> None:
+        start = time.perf_counter()
+        try:
+            self._stream.write(b)
+        except Exception:
+            self._recorder.record(IOOperation.WRITE, start, error=True)
+            raise
+        self._recorder.record(IOOperation.WRITE, start, num_bytes=len(b))
+
+    def closed(self) -> bool:
+        # pyarrow and io streams define closed as a property rather than as a method
+        closed = self._stream.closed
+        return closed() if callable(closed) else closed
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __enter__(self) -> "InstrumentedOutputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class InstrumentedFile(InputFile, OutputFile):
+    """A file of an InstrumentedFileIO that records the operations on the wrapped InputFile or OutputFile"""
+
+    def __init__(self, file: Union[InputFile, OutputFile], recorder: _Recorder):
+        super().__init__(location=file.location)
+        self._file = file
+        self._recorder = recorder
+
+    def __len__(self) -> int:
+        return self._recorder.timed(IOOperation.LENGTH, len, self._file)
+
+    def exists(self) -> bool:
+        return self._recorder.timed(IOOperation.EXISTS, self._file.exists)
+
+    def open(self) -> InstrumentedInputStream:
+        stream = self._recorder.timed(IOOperation.OPEN, self._file.open)  # type: ignore
+        return InstrumentedInputStream(stream, self._recorder)
+
+    def read_ranges(
+        self,
+        ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_RANGE_GAP,
+        max_size: int = DEFAULT_MAX_RANGE_SIZE,
+        max_workers: int = DEFAULT_RANGE_READ_WORKERS,
+    ) -> List[memoryview]:
+        """Reads several ranges with the wrapped InputFile and records them as a single read"""
+        start = time.perf_counter()
+        try:
+            views = self._file.read_ranges(ranges, max_gap=max_gap, max_size=max_size, max_workers=max_workers)  # type: ignore
+        except Exception:
+            self._recorder.record(IOOperation.READ, start, error=True)
+            raise
+        self._recorder.record(IOOperation.READ, start, num_bytes=sum(len(view) for view in views))
+        return views
+
+    def create(self, overwrite: bool = False) -> InstrumentedOutputStream:
+        stream = self._recorder.timed(IOOperation.CREATE, self._file.create, overwrite)  # type: ignore
+        return InstrumentedOutputStream(stream, self._recorder)
+
+    def to_input_file(self) -> "InstrumentedFile":
+        return InstrumentedFile(self._file.to_input_file(), self._recorder)  # type: ignore
+
+
+class InstrumentedFileIO(FileIO):
+    """A FileIO that wraps another FileIO and records every operation in an IOMetrics instance
+
+    Args:
+        file_io(FileIO): The wrapped FileIO
+        metrics(IOMetrics, optional): The metrics to record to, by default a new IOMetrics instance
+        role_of(Callable[[str], FileRole]): Returns the role of the file at a location
+    """
+
+    def __init__(
+        self,
+        file_io: FileIO,
+        metrics: Optional[IOMetrics] = None,
+        role_of: Callable[[str], FileRole] = infer_file_role,
+    ):
+        self._file_io = file_io
+        self._metrics = metrics or IOMetrics()
+        self._role_of = role_of
+
+    @property
+    def metrics(self) -> IOMetrics:
+        return self._metrics
+
+    def _recorder(self, location: str) -> _Recorder:
+        return _Recorder(self._metrics, location, self._role_of(location))
+
+    def new_input(self, location: str, length: Optional[int] = None) -> InstrumentedFile:
+        """Get an InstrumentedFile instance to read bytes from the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata
+        """
+        return InstrumentedFile(self._file_io.new_input(location, length=length), self._recorder(location))
+
+    def new_output(self, location: str) -> InstrumentedFile:
+        """Get an InstrumentedFile instance to write bytes to the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+        """
+        return InstrumentedFile(self._file_io.new_output(location), self._recorder(location))
+
+    def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
+        """Delete the file at the given location using the wrapped FileIO
+
+        Args:
+            location(str, InputFile, OutputFile): A URI or a path to a local file--if an InputFile instance or an
+            OutputFile instance is provided, the location attribute for that instance is used as the location to delete
+        """
+        str_path = location.location if isinstance(location, (InputFile, OutputFile)) else location
+        self._recorder(str_path).timed(IOOperation.DELETE, self._file_io.delete, str_path)
+
+    def _is_throttled(self, error: Exception) -> bool:
+        # delete_many is inherited so that each delete is recorded, and retries the errors of the wrapped FileIO
+        return self._file_io._is_throttled(error)  # pylint: disable=protected-access
@@ -0,0 +1,257 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""FileIO implementation for local files that reads through memory maps
+
+For warehouses on a local disk or a mounted network filesystem, mapping a file into memory lets decoders work on the
+pages of the operating system's page cache directly. The input streams returned by `LocalFileIO` implement the
+InputStream protocol, and additionally return zero-copy `memoryview` slices of the mapped file from `read_view`. A
+slice can be wrapped without copying by `pyarrow.py_buffer`.
+"""
+
+import mmap
+import os
+from typing import Optional, Union
+from urllib.parse import urlparse
+
+from iceberg.io.base import FileIO, InputFile, OutputFile, OutputStream
+
+
+def _local_path(location: str) -> str:
+    """Returns the absolute local path of a location without a scheme or with a `file` scheme
+
+    Raises:
+        ValueError: If the location has another scheme or a network location
+    """
+    parsed_location = urlparse(location)
+    if parsed_location.scheme and parsed_location.scheme != "file":
+        raise ValueError(f"LocalFileIO location must be a local path or have a scheme of `file`: {location}")
+    if parsed_location.netloc:
+        raise ValueError(f"Network location is not allowed for LocalFileIO: {parsed_location.netloc}")
+    return os.path.abspath(parsed_location.path)
+
+
+class MemoryMappedInputStream:
+    """A seekable InputStream over a memory mapped local file
+
+    `read` follows the InputStream protocol and returns a copy of the bytes, `read_view` returns a view of the mapped
+    pages instead. Views must be released before the stream is closed, otherwise the mapping stays open until the last
+    view is garbage collected.
+
+    Args:
+        path(str): The local path of the file to map
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            length = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if length > 0 else None
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        self._length = length
+        self._position = 0
+        self._closed = False
+
+    @property
+    def view(self) -> memoryview:
+        """A view of the whole mapped file"""
+        self._check_open()
+        return self._view
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def read_view(self, size: int = -1) -> memoryview:
+        """Reads up to `size` bytes, or until the end of the file when `size` is negative, without copying
+
+        Returns:
+            memoryview: A view of the mapped pages
+        """
+        self._check_open()
+        end = self._length if size < 0 else min(self._length, self._position + size)
+        start = min(self._position, end)
+        self._position = max(self._position, end)
+        return self._view[start:end]
+
+    def read(self, size: int = -1) -> bytes:
+        return bytes(self.read_view(size))
+
+    def seek(self, offset: int, whence: int = 0) -> None:
+        self._check_open()
+        if whence == 0:
+            position = offset
+        elif whence == 1:
+            position = self._position + offset
+        elif whence == 2:
+            position = self._length + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Cannot seek to a negative position: {position}")
+        self._position = position
+
+    def tell(self) -> int:
+        return self._position
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A slice returned by read_view is still alive, the mapping is closed when it is garbage collected
+                pass
+            self._mmap = None
+
+    def __enter__(self) -> "MemoryMappedInputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class LocalFile(InputFile, OutputFile):
+    """A combined InputFile and OutputFile implementation for local files that reads through memory maps
+
+    Args:
+        location(str): A path to a local file, or a URI with a `file` scheme
+        length(int, optional): The length of the file in bytes, when it is already known from table metadata
+
+    Raises:
+        ValueError: If the location is not local
+    """
+
+    def __init__(self, location: str, length: Optional[int] = None):
+        self._path = _local_path(location)
+        self._length = length
+        super().__init__(location=location)
+
+    @property
+    def path(self) -> str:
+        """The absolute local path of the file"""
+        return self._path
+
+    def __len__(self) -> int:
+        """Returns the total length of the file, in bytes"""
+        if self._length is not None:
+            return self._length
+        try:
+            return os.path.getsize(self._path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cannot get file info, file not found: {self.location}")
+
+    def exists(self) -> bool:
+        """Checks whether the location exists"""
+        return os.path.exists(self._path)
+
+    def open(self) -> MemoryMappedInputStream:
+        """Maps the file into memory
+
+        Returns:
+            MemoryMappedInputStream: A stream over the mapped file
+
+        Raises:
+            FileNotFoundError: If the file at self.location does not exist
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+        """
+        try:
+            return MemoryMappedInputStream(self._path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cannot open file, does not exist: {self.location}")
+        except PermissionError:
+            raise PermissionError(f"Cannot open file, access denied: {self.location}")
+
+    def create(self, overwrite: bool = False) -> OutputStream:
+        """Creates the file, and its parent directories if they do not exist
+
+        Args:
+            overwrite(bool): Whether to overwrite the file if it already exists
+
+        Returns:
+            OutputStream: A writable binary file object
+
+        Raises:
+            FileExistsError: If the file already exists at `self.location` and `overwrite` is False
+            PermissionError: If the file at self.location cannot be accessed due to a permission error
+        """
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            return open(self._path, "wb" if overwrite else "xb")  # type: ignore
+        except FileExistsError:
+            raise FileExistsError(f"Cannot create file, already exists: {self.location}")
+        except PermissionError:
+            raise PermissionError(f"Cannot create file, access denied: {self.location}")
+
+    def to_input_file(self) -> "LocalFile":
+        """Returns this instance, which is also an InputFile"""
+        return self
+
+
+class LocalFileIO(FileIO):
+    """A FileIO implementation for local files that reads through memory maps
+
+    Examples:
+        >>> from iceberg.io.local import LocalFileIO
+        >>> file_io = LocalFileIO()
+        >>> # with file_io.new_input("/warehouse/db/table/metadata/snap-1.avro").open() as f:
+        >>> #     header = f.read_view(4)
+    """
+
+    def new_input(self, location: str, length: Optional[int] = None) -> LocalFile:
+        """Get a LocalFile instance to read bytes from the file at the given location
+
+        Args:
+            location(str): A path to a local file, or a URI with a `file` scheme
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata
+        """
+        return LocalFile(location, length=length)
+
+    def new_output(self, location: str) -> LocalFile:
+        """Get a LocalFile instance to write bytes to the file at the given location
+
+        Args:
+            location(str): A path to a local file, or a URI with a `file` scheme
+        """
+        return LocalFile(location)
+
+    def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
+        """Delete the file at the given location
+
+        Args:
+            location(str, InputFile, OutputFile): A path to a local file--if an InputFile instance or an OutputFile
+            instance is provided, the location attribute for that instance is used as the location to delete
+
+        Raises:
+            FileNotFoundError: When the file at the provided location does not exist
+            PermissionError: If the file at the provided location cannot be accessed due to a permission error
+        """
+        str_path = location.location if isinstance(location, (InputFile, OutputFile)) else location
+        try:
+            os.remove(_local_path(str_path))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Cannot delete file, does not exist: {str_path}")
+        except PermissionError:
+            raise PermissionError(f"Cannot delete file, access denied: {str_path}")
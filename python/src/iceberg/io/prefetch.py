@@ -0,0 +1,207 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A read-ahead InputStream for sequential consumers
+
+Decoders of Avro manifests and metadata JSON read a file front to back in small increments. When every refill is a
+request to an object store, the decoder stalls on each one. `PrefetchingInputStream` keeps the next blocks of the file in
+flight on background threads while the current block is consumed. Blocks start small so that the first bytes arrive
+quickly, and grow while the file is read sequentially.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, List, Optional, Tuple
+
+from iceberg.io.base import InputFile, InputStream, read_fully
+
+DEFAULT_BLOCK_SIZE = 256 * 1024
+DEFAULT_MAX_BLOCK_SIZE = 8 * 1024 * 1024
+DEFAULT_PREFETCH_BLOCKS = 4
+DEFAULT_MAX_BUFFERED_BYTES = 32 * 1024 * 1024
+
+
+class PrefetchingInputStream:
+    """An InputStream that reads the blocks following the current position of an InputFile in the background
+
+    Each background thread reads blocks through its own stream of the InputFile, so up to `prefetch_blocks` requests are
+    in flight at the same time. The block size doubles with every block that is consumed, up to `max_block_size`, and
+    is reset when the stream seeks away from the prefetched blocks. Blocks that are in flight or consumed but not yet
+    read never exceed `max_buffered_bytes`, except for a single block when nothing else is buffered.
+
+    Args:
+        input_file(InputFile): The file to read
+        block_size(int): The size of the first block read after opening or seeking
+        max_block_size(int): The largest block size
+        prefetch_blocks(int): The largest number of blocks in flight
+        max_buffered_bytes(int): The largest number of bytes that are in flight or buffered
+
+    Examples:
+        >>> from iceberg.io.pyarrow import PyArrowFileIO
+        >>> # with PrefetchingInputStream(PyArrowFileIO().new_input("s3://bucket/table/metadata/snap-1.avro")) as f:
+        >>> #     header = f.read(4)
+    """
+
+    def __init__(
+        self,
+        input_file: InputFile,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+        prefetch_blocks: int = DEFAULT_PREFETCH_BLOCKS,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+    ):
+        if block_size <= 0 or max_block_size < block_size:
+            raise ValueError(f"Invalid block sizes: {block_size} and max {max_block_size}")
+        if prefetch_blocks <= 0:
+            raise ValueError(f"Number of prefetched blocks must be positive: {prefetch_blocks}")
+        self._input_file = input_file
+        self._initial_block_size = block_size
+        self._max_block_size = max_block_size
+        self._prefetch_blocks = prefetch_blocks
+        self._max_buffered_bytes = max_buffered_bytes
+
+        self._executor = ThreadPoolExecutor(max_workers=prefetch_blocks)
+        self._local = threading.local()
+        self._streams: List[InputStream] = []
+        self._streams_lock = threading.Lock()
+
+        self._position = 0
+        self._block = b""
+        self._block_offset = 0
+        self._pending: Deque[Tuple[int, int, Future]] = deque()
+        self._next_offset = 0
+        self._block_size = block_size
+        self._eof: Optional[int] = None
+        self._closed = False
+
+    def _read_block(self, offset: int, size: int) -> bytes:
+        """Reads a block through the stream of the current background thread"""
+        stream = getattr(self._local, "stream", None)
+        if stream is None:
+            stream = self._local.stream = self._input_file.open()
+            with self._streams_lock:
+                self._streams.append(stream)
+        stream.seek(offset, 0)
+        return read_fully(stream, size)
+
+    def _pending_bytes(self) -> int:
+        return sum(size for _, size, _ in self._pending)
+
+    def _fill(self) -> None:
+        """Submits blocks until the number of blocks or the number of bytes in flight reaches its limit"""
+        while self._eof is None and len(self._pending) < self._prefetch_blocks:
+            size = self._block_size
+            buffered = self._pending_bytes() + len(self._block)
+            if buffered and buffered + size > self._max_buffered_bytes:
+                break
+            self._pending.append((self._next_offset, size, self._executor.submit(self._read_block, self._next_offset, size)))
+            self._next_offset += size
+            self._block_size = min(self._block_size * 2, self._max_block_size)
+
+    def _reset(self, position: int) -> None:
+        """Drops the prefetched blocks and restarts prefetching from a position"""
+        for _, _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._block = b""
+        self._block_offset = position
+        self._next_offset = position
+        self._block_size = self._initial_block_size
+        self._eof = None
+
+    def _advance(self) -> bool:
+        """Makes the block that contains the current position the current block
+
+        Returns:
+            bool: False if the current position is at or past the end of the file
+        """
+        while not self._block_offset <= self._position < self._block_offset + len(self._block):
+            self._block = b""
+            if self._eof is not None and self._position >= self._eof:
+                return False
+            while self._pending and sum(self._pending[0][:2]) <= self._position:
+                self._pending.popleft()[2].cancel()
+            if (
+                not self._pending
+                and self._position != self._next_offset
+                or self._pending
+                and self._pending[0][0] > self._position
+            ):
+                self._reset(self._position)
+            self._fill()
+            offset, size, future = self._pending.popleft()
+            self._block, self._block_offset = future.result(), offset
+            if len(self._block) < size:
+                self._eof = offset + len(self._block)
+                for _, _, dropped in self._pending:
+                    dropped.cancel()
+                self._pending.clear()
+            self._fill()
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        chunks = []
+        remaining = size
+        while remaining != 0 and self._advance():
+            start = self._position - self._block_offset
+            end = len(self._block) if remaining < 0 else min(len(self._block), start + remaining)
+            chunks.append(self._block[start:end] if start > 0 or end < len(self._block) else self._block)
+            self._position += end - start
+            if remaining > 0:
+                remaining -= end - start
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def seek(self, offset: int, whence: int = 0) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        if whence == 0:
+            position = offset
+        elif whence == 1:
+            position = self._position + offset
+        elif whence == 2:
+            position = len(self._input_file) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Cannot seek to a negative position: {position}")
+        self._position = position
+
+    def tell(self) -> int:
+        return self._position
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for _, _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+        for stream in self._streams:
+            stream.close()
+        self._streams = []
+
+    def __enter__(self) -> "PrefetchingInputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -23,12 +23,23 @@ with the pyarrow library.
 """
 
 import os
-from typing import Union
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from urllib.parse import urlparse
 
 from pyarrow.fs import FileInfo, FileSystem, FileType
 
-from iceberg.io.base import FileIO, InputFile, InputStream, OutputFile, OutputStream
+from iceberg.io.base import (
+    DEFAULT_MAX_RANGE_GAP,
+    DEFAULT_MAX_RANGE_SIZE,
+    DEFAULT_RANGE_READ_WORKERS,
+    FileIO,
+    InputFile,
+    InputStream,
+    OutputFile,
+    OutputStream,
+    read_coalesced_ranges,
+)
 
 
 class PyArrowFile(InputFile, OutputFile):
@@ -36,6 +47,10 @@ class PyArrowFile(InputFile, OutputFile):
 
     Args:
         location(str): A URI or a path to a local file
+        filesystem(pyarrow.fs.FileSystem, optional): An already constructed filesystem to use for the location
+        path(str, optional): The path of the location within `filesystem`, required when `filesystem` is provided
+        length(int, optional): The length of the file in bytes, when it is already known from table metadata. It is
+            trusted without being checked, and spares a request for the length of the file
 
     Attributes:
         location(str): The URI or path to a local file for a PyArrowFile instance
@@ -53,12 +68,14 @@ class PyArrowFile(InputFile, OutputFile):
         >>> # output_file.create().write(b'foobytes')
     """
 
-    def __init__(self, location: str):
-        parsed_location = urlparse(location)  # Create a ParseResult from the URI
-        if not parsed_location.scheme:  # If no scheme, assume the path is to a local file
-            self._filesystem, self._path = FileSystem.from_uri(os.path.abspath(location))
+    def __init__(
+        self, location: str, filesystem: Optional[FileSystem] = None, path: Optional[str] = None, length: Optional[int] = None
+    ):
+        self._length = length
+        if filesystem is not None and path is not None:
+            self._filesystem, self._path = filesystem, path
         else:
-            self._filesystem, self._path = FileSystem.from_uri(location)  # Infer the proper filesystem
+            self._filesystem, self._path = _infer_filesystem(location)
         super().__init__(location=location)
 
     def _file_info(self) -> FileInfo:
@@ -81,6 +98,8 @@ class PyArrowFile(InputFile, OutputFile):
 
     def __len__(self) -> int:
         """Returns the total length of the file, in bytes"""
+        if self._length is not None:
+            return self._length
         file_info = self._file_info()
         return file_info.size
 
@@ -117,6 +136,44 @@ class PyArrowFile(InputFile, OutputFile):
             raise  # pragma: no cover - If some other kind of OSError, raise the raw error
         return input_file
 
+    def read_ranges(
+        self,
+        ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_RANGE_GAP,
+        max_size: int = DEFAULT_MAX_RANGE_SIZE,
+        max_workers: int = DEFAULT_RANGE_READ_WORKERS,
+    ) -> List[memoryview]:
+        """Reads several (offset, length) ranges of the file using positional reads on a single NativeFile
+
+        Ranges separated by at most `max_gap` bytes are merged into a single read and the merged reads are issued
+        concurrently, which is safe because positional reads do not move the position of the NativeFile.
+
+        Args:
+            ranges(Sequence[Tuple[int, int]]): The (offset, length) ranges to read
+            max_gap(int): The largest number of unrequested bytes between two ranges that are merged
+            max_size(int): The largest merged range
+            max_workers(int): The largest number of merged ranges read concurrently
+
+        Returns:
+            List[memoryview]: A view of the bytes of each range, in the order of `ranges`
+
+        Raises:
+            FileNotFoundError: If the file at self.location does not exist
+            PermissionError: If the file at self.location cannot be accessed due to a permission error such as
+                an AWS error code 15
+        """
+        input_file = self.open()
+        try:
+            return read_coalesced_ranges(
+                ranges,
+                lambda offset, length: input_file.read_at(length, offset),  # type: ignore
+                max_gap=max_gap,
+                max_size=max_size,
+                max_workers=max_workers,
+            )
+        finally:
+            input_file.close()
+
     def create(self, overwrite: bool = False) -> OutputStream:
         """Creates a writable pyarrow.lib.NativeFile for this PyArrowFile's location
 
@@ -158,17 +215,118 @@ class PyArrowFile(InputFile, OutputFile):
         return self
 
 
+# Substrings of the errors raised by pyarrow filesystems when the storage throttles requests
+_THROTTLING_ERRORS = ("SLOW_DOWN", "SlowDown", "Throttling", "TooManyRequests", "Too Many Requests", "Reduce your request rate")
+
+# Schemes where pyarrow includes the authority (bucket) as the first component of the path
+_BUCKET_SCHEMES = {"s3", "s3a", "s3n", "gs", "gcs"}
+
+
+def _infer_filesystem(location: str) -> Tuple[FileSystem, str]:
+    """Infers a pyarrow filesystem and the path within it for a location
+
+    If the location has no scheme, it is assumed to be a path to a local file.
+    """
+    if not urlparse(location).scheme:
+        return FileSystem.from_uri(os.path.abspath(location))
+    return FileSystem.from_uri(location)
+
+
+def _filesystem_key(location: str) -> Tuple[Tuple[str, str, str], str]:
+    """Returns the cache key of the filesystem for a location, along with the expected path within that filesystem
+
+    The key is the scheme, authority and query of the location, since the query holds the options that pyarrow
+    builds the filesystem with, such as `region` or `endpoint_override`. Locations without a scheme and `file:`
+    locations share the local filesystem.
+    """
+    parsed_location = urlparse(location)
+    scheme = parsed_location.scheme
+    if not scheme or scheme == "file":
+        return ("file", "", ""), os.path.abspath(parsed_location.path)
+    key = (scheme, parsed_location.netloc, parsed_location.query)
+    if scheme in _BUCKET_SCHEMES:
+        return key, f"{parsed_location.netloc}{parsed_location.path}"
+    return key, parsed_location.path
+
+
 class PyArrowFileIO(FileIO):
-    def new_input(self, location: str) -> PyArrowFile:
+    """A FileIO implementation that uses pyarrow filesystems inferred from each location
+
+    Constructing a filesystem can be expensive, for example an S3 filesystem resolves credentials and the bucket
+    region. Filesystems are therefore pooled per scheme, authority and query options and reused for every file at the
+    same authority with the same options. Settings that pyarrow reads from the environment, such as the AWS region or
+    endpoint variables, are read once when the filesystem of an authority is built; a filesystem must be evicted to
+    pick up changes to them. The pool is safe to use from multiple threads and is reset in a child process after a
+    fork, since the connections of the parent cannot be shared.
+
+    Examples:
+        >>> from iceberg.io.pyarrow import PyArrowFileIO
+        >>> file_io = PyArrowFileIO()
+        >>> # input_file = file_io.new_input("s3://foo/bar.txt")
+        >>> # Files under s3://foo/ reuse the same filesystem until it is evicted or the FileIO is closed
+        >>> # file_io.evict_filesystem("s3://foo/bar.txt")
+        >>> file_io.close()
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._filesystems: Dict[Tuple[str, str, str], FileSystem] = {}
+
+    def _get_filesystem(self, location: str) -> Tuple[FileSystem, str]:
+        """Returns the pooled filesystem for a location, along with the path of the location within it
+
+        A filesystem is only pooled when the path inferred by pyarrow matches the path derived from the location,
+        otherwise a fresh filesystem is inferred every time.
+        """
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        key, path = _filesystem_key(location)
+        with self._lock:
+            filesystem = self._filesystems.get(key)
+        if filesystem is not None:
+            return filesystem, path
+
+        filesystem, inferred_path = _infer_filesystem(location)
+        if inferred_path == path:
+            with self._lock:
+                filesystem = self._filesystems.setdefault(key, filesystem)
+        return filesystem, inferred_path
+
+    def _reset_after_fork(self) -> None:
+        """Drops the filesystems and the lock inherited from the parent process"""
+        self._lock = threading.Lock()
+        self._filesystems = {}
+        self._pid = os.getpid()
+
+    def evict_filesystem(self, location: str) -> None:
+        """Removes the pooled filesystem used for a location, if any
+
+        Args:
+            location(str): A URI or a path to a local file
+        """
+        key, _ = _filesystem_key(location)
+        with self._lock:
+            self._filesystems.pop(key, None)
+
+    def close(self) -> None:
+        """Removes all pooled filesystems"""
+        with self._lock:
+            self._filesystems = {}
+
+    def new_input(self, location: str, length: Optional[int] = None) -> PyArrowFile:
         """Get a PyArrowFile instance to read bytes from the file at the given location
 
         Args:
             location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata. It is
+                trusted without being checked, and spares a request for the length of the file
 
         Returns:
             PyArrowFile: A PyArrowFile instance for the given location
         """
-        return PyArrowFile(location)
+        filesystem, path = self._get_filesystem(location)
+        return PyArrowFile(location, filesystem=filesystem, path=path, length=length)
 
     def new_output(self, location: str) -> PyArrowFile:
         """Get a PyArrowFile instance to write bytes to the file at the given location
@@ -179,7 +337,8 @@ class PyArrowFileIO(FileIO):
         Returns:
             PyArrowFile: A PyArrowFile instance for the given location
         """
-        return PyArrowFile(location)
+        filesystem, path = self._get_filesystem(location)
+        return PyArrowFile(location, filesystem=filesystem, path=path)
 
     def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
         """Delete the file at the given location
@@ -195,7 +354,7 @@ class PyArrowFileIO(FileIO):
                 an AWS error code 15
         """
         str_path = location.location if isinstance(location, (InputFile, OutputFile)) else location
-        filesystem, path = FileSystem.from_uri(str_path)  # Infer the proper filesystem
+        filesystem, path = self._get_filesystem(str_path)
         try:
             filesystem.delete_file(path)
         except FileNotFoundError:
@@ -208,3 +367,7 @@ class PyArrowFileIO(FileIO):
             elif e.errno == 13 or "AWS Error [code 15]" in str(e):
                 raise PermissionError(f"Cannot delete file, access denied: {location}")
             raise  # pragma: no cover - If some other kind of OSError, raise the raw error
+
+    def _is_throttled(self, error: Exception) -> bool:
+        """Returns whether a pyarrow error means that the storage is throttling requests"""
+        return isinstance(error, OSError) and any(message in str(error) for message in _THROTTLING_ERRORS)
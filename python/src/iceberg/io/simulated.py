@@ -0,0 +1,338 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A FileIO that serves local files with the latency, bandwidth and errors of a remote object store
+
+`SimulatedObjectStoreFileIO` wraps a FileIO, by default a PyArrowFileIO, and charges every request against the wrapped
+files the time an object store described by an `ObjectStoreProfile` would take. Latencies, throttling errors and tail
+latency spikes are drawn from a seeded random number generator, so that benchmarks of caching, range coalescing and
+concurrency are repeatable without a real object store.
+
+Example:
+    >>> profile = ObjectStoreProfile(latency=0.03, bandwidth=100 * 1024 * 1024, throttle_rate=0.01, seed=42)
+    >>> file_io = SimulatedObjectStoreFileIO(profile)
+    >>> # file_io.new_input("/tmp/warehouse/db/table/metadata/snap-1.avro").open().read()
+    >>> # file_io.request_count
+"""
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from iceberg.io.base import (
+    DEFAULT_MAX_RANGE_GAP,
+    DEFAULT_MAX_RANGE_SIZE,
+    DEFAULT_RANGE_READ_WORKERS,
+    FileIO,
+    InputFile,
+    InputStream,
+    OutputFile,
+    OutputStream,
+    read_coalesced_ranges,
+    read_fully,
+)
+
+
+class SimulatedThrottlingError(OSError):
+    """Raised by a simulated request that the object store rejects with a SlowDown error"""
+
+
+@dataclass(frozen=True)
+class ObjectStoreProfile:
+    """The performance characteristics of a simulated object store
+
+    Args:
+        latency(float): The median time to first byte of a request, in seconds
+        latency_sigma(float): The standard deviation of the logarithm of the latency, 0 for a constant latency
+        bandwidth(float, optional): The transfer rate of a single request in bytes per second, unlimited if None
+        throttle_rate(float): The probability that a request fails with a SimulatedThrottlingError
+        tail_rate(float): The probability that a request is delayed by an additional `tail_latency`
+        tail_latency(float): The additional time of a delayed request, in seconds
+        seed(int, optional): The seed of the random number generator, None for a different sequence on every run
+    """
+
+    latency: float = 0.0
+    latency_sigma: float = 0.0
+    bandwidth: Optional[float] = None
+    throttle_rate: float = 0.0
+    tail_rate: float = 0.0
+    tail_latency: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency < 0 or self.latency_sigma < 0 or self.tail_latency < 0:
+            raise ValueError(f"Latencies must not be negative: {self}")
+        if self.bandwidth is not None and self.bandwidth <= 0:
+            raise ValueError(f"Bandwidth must be positive: {self.bandwidth}")
+        if not 0 <= self.throttle_rate <= 1 or not 0 <= self.tail_rate <= 1:
+            raise ValueError(f"Rates must be between 0 and 1: {self}")
+
+
+class _Simulator:
+    """Draws the outcome of simulated requests and sleeps for their duration"""
+
+    def __init__(self, profile: ObjectStoreProfile, sleep: Callable[[float], None]):
+        self._profile = profile
+        self._sleep = sleep
+        self._random = random.Random(profile.seed)
+        self._lock = threading.Lock()
+        self.request_count = 0
+
+    def _draw(self) -> Tuple[float, bool]:
+        profile = self._profile
+        with self._lock:
+            self.request_count += 1
+            latency = profile.latency
+            if latency > 0 and profile.latency_sigma > 0:
+                latency = self._random.lognormvariate(math.log(latency), profile.latency_sigma)
+            if profile.tail_rate > 0 and self._random.random() < profile.tail_rate:
+                latency += profile.tail_latency
+            throttled = profile.throttle_rate > 0 and self._random.random() < profile.throttle_rate
+        return latency, throttled
+
+    def transfer(self, num_bytes: int) -> None:
+        """Sleeps for the time to transfer a number of bytes within a request"""
+        if self._profile.bandwidth is not None and num_bytes > 0:
+            self._sleep(num_bytes / self._profile.bandwidth)
+
+    def request(self, location: str, num_bytes: int = 0) -> None:
+        """Sleeps for the duration of a request that transfers a number of bytes
+
+        Raises:
+            SimulatedThrottlingError: If the request is throttled, after the latency of the request
+        """
+        latency, throttled = self._draw()
+        if latency > 0:
+            self._sleep(latency)
+        if throttled:
+            raise SimulatedThrottlingError(f"Simulated SlowDown, reduce your request rate: {location}")
+        self.transfer(num_bytes)
+
+
+class SimulatedInputStream:
+    """An InputStream where every read is a ranged request against the object store"""
+
+    def __init__(self, stream: InputStream, simulator: _Simulator, location: str):
+        self._stream = stream
+        self._simulator = simulator
+        self._location = location
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size) if size >= 0 else self._stream.read()  # type: ignore
+        self._simulator.request(self._location, len(data))
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> None:
+        self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def closed(self) -> bool:
+        # pyarrow and io streams define closed as a property rather than as a method
+        closed = self._stream.closed
+        return closed() if callable(closed) else closed
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __enter__(self) -> "SimulatedInputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class SimulatedOutputStream:
+    """An OutputStream that is uploaded at the bandwidth of the object store and committed by a request on close
+
+    Like a failed upload, a throttled commit leaves no file behind: the wrapped stream is closed and the file is deleted
+    with `discard` before the error is raised.
+    """
+
+    def __init__(self, stream: OutputStream, simulator: _Simulator, location: str, discard: Callable[[], None]):
+        self._stream = stream
+        self._simulator = simulator
+        self._location = location
+        self._discard = discard
+        self._closed = False
+
+    def write(self, b: bytes) -> None:
+        self._simulator.transfer(len(b))
+        self._stream.write(b)
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._simulator.request(self._location)
+        except Exception:
+            try:
+                self._stream.close()
+            finally:
+                self._discard()
+            raise
+        self._stream.close()
+
+    def __enter__(self) -> "SimulatedOutputStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class SimulatedFile(InputFile, OutputFile):
+    """A file of a SimulatedObjectStoreFileIO
+
+    Args:
+        file(InputFile, OutputFile): The wrapped file
+        simulator(_Simulator): The simulator of the SimulatedObjectStoreFileIO
+        file_io(FileIO): The wrapped FileIO, which deletes the files whose commit fails
+        length(int, optional): The length of the file in bytes, when it is already known from table metadata
+    """
+
+    def __init__(self, file: Union[InputFile, OutputFile], simulator: _Simulator, file_io: FileIO, length: Optional[int] = None):
+        super().__init__(location=file.location)
+        self._file = file
+        self._simulator = simulator
+        self._file_io = file_io
+        self._length = length
+
+    def __len__(self) -> int:
+        if self._length is not None:
+            return self._length
+        self._simulator.request(self.location)
+        return len(self._file)
+
+    def exists(self) -> bool:
+        self._simulator.request(self.location)
+        return self._file.exists()
+
+    def open(self) -> SimulatedInputStream:
+        self._simulator.request(self.location)
+        return SimulatedInputStream(self._file.open(), self._simulator, self.location)  # type: ignore
+
+    def _read_range(self, offset: int, length: int) -> bytes:
+        stream = self._file.open()  # type: ignore
+        try:
+            stream.seek(offset, 0)
+            data = read_fully(stream, length)
+        finally:
+            stream.close()
+        self._simulator.request(self.location, len(data))
+        return data
+
+    def read_ranges(
+        self,
+        ranges: Sequence[Tuple[int, int]],
+        max_gap: int = DEFAULT_MAX_RANGE_GAP,
+        max_size: int = DEFAULT_MAX_RANGE_SIZE,
+        max_workers: int = DEFAULT_RANGE_READ_WORKERS,
+    ) -> List[memoryview]:
+        """Reads several (offset, length) ranges of the file with one request per coalesced range"""
+        return read_coalesced_ranges(ranges, self._read_range, max_gap=max_gap, max_size=max_size, max_workers=max_workers)
+
+    def create(self, overwrite: bool = False) -> SimulatedOutputStream:
+        stream = self._file.create(overwrite)  # type: ignore
+        return SimulatedOutputStream(stream, self._simulator, self.location, self._discard)
+
+    def _discard(self) -> None:
+        try:
+            self._file_io.delete(self.location)
+        except FileNotFoundError:
+            pass
+
+    def to_input_file(self) -> "SimulatedFile":
+        return SimulatedFile(self._file.to_input_file(), self._simulator, self._file_io)  # type: ignore
+
+
+class SimulatedObjectStoreFileIO(FileIO):
+    """A FileIO that serves the files of a wrapped FileIO with the performance of a simulated object store
+
+    Every request sleeps for a latency drawn from the profile, and transfers bytes at the bandwidth of the profile.
+    Opening a file, getting its length or checking its existence, every read of a stream, committing a written file and
+    deleting a file are requests. Throttled requests raise a SimulatedThrottlingError, which `delete_many` retries.
+
+    Args:
+        profile(ObjectStoreProfile): The performance characteristics of the simulated object store
+        file_io(FileIO, optional): The FileIO that serves the files, by default a PyArrowFileIO
+        sleep(Callable[[float], None]): Called with the duration of every simulated delay, by default time.sleep
+    """
+
+    def __init__(
+        self,
+        profile: ObjectStoreProfile = ObjectStoreProfile(),
+        file_io: Optional[FileIO] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if file_io is None:
+            from iceberg.io.pyarrow import PyArrowFileIO
+
+            file_io = PyArrowFileIO()
+        self._file_io = file_io
+        self._profile = profile
+        self._simulator = _Simulator(profile, sleep)
+
+    @property
+    def profile(self) -> ObjectStoreProfile:
+        return self._profile
+
+    @property
+    def request_count(self) -> int:
+        """The number of requests made so far, including throttled requests"""
+        return self._simulator.request_count
+
+    def new_input(self, location: str, length: Optional[int] = None) -> SimulatedFile:
+        """Get a SimulatedFile instance to read bytes from the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+            length(int, optional): The length of the file in bytes, when it is already known from table metadata
+        """
+        return SimulatedFile(self._file_io.new_input(location, length=length), self._simulator, self._file_io, length)
+
+    def new_output(self, location: str) -> SimulatedFile:
+        """Get a SimulatedFile instance to write bytes to the file at the given location
+
+        Args:
+            location(str): A URI or a path to a local file
+        """
+        return SimulatedFile(self._file_io.new_output(location), self._simulator, self._file_io)
+
+    def delete(self, location: Union[str, InputFile, OutputFile]) -> None:
+        """Delete the file at the given location after a simulated request
+
+        Args:
+            location(str, InputFile, OutputFile): A URI or a path to a local file--if an InputFile instance or an
+            OutputFile instance is provided, the location attribute for that instance is used as the location to delete
+
+        Raises:
+            SimulatedThrottlingError: If the request is throttled
+            FileNotFoundError: When the file at the provided location does not exist
+        """
+        str_location = location.location if isinstance(location, (InputFile, OutputFile)) else location
+        self._simulator.request(str_location)
+        self._file_io.delete(str_location)
+
+    def _is_throttled(self, error: Exception) -> bool:
+        return isinstance(error, SimulatedThrottlingError)
@@ -19,8 +19,21 @@ from __future__ import annotations
 
 import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar
+from dataclasses import dataclass, field
+from operator import methodcaller
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from weakref import WeakValueDictionary
 
 from iceberg.files import StructProtocol
 
@@ -44,20 +57,42 @@ T = TypeVar("T")
 class Schema:
     """A table Schema
 
+    Schemas are interned: constructing a schema with the same fields, schema ID and identifier field IDs as a schema that
+    is still referenced returns that instance, so that the schemas repeated across snapshots, manifests and tasks share
+    their indexes.
+
     Example:
         >>> from iceberg import schema
         >>> from iceberg import types
     """
 
+    _instances: "WeakValueDictionary[Tuple[StructType, int, Tuple[int, ...]], Schema]" = WeakValueDictionary()
+    _initialized = False
+
+    def __new__(cls, *columns: Iterable[NestedField], schema_id: int, identifier_field_ids: Optional[List[int]] = None):
+        key = (StructType(*columns), schema_id, tuple(identifier_field_ids or ()))  # type: ignore
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = object.__new__(cls)
+        return instance
+
     def __init__(self, *columns: Iterable[NestedField], schema_id: int, identifier_field_ids: Optional[List[int]] = None):
+        if self._initialized:
+            return
         self._struct = StructType(*columns)  # type: ignore
         self._schema_id = schema_id
         self._identifier_field_ids = identifier_field_ids or []
-        self._name_to_id: Dict[str, int] = index_by_name(self)
-        self._name_to_id_lower: Dict[str, int] = {}  # Should be accessed through self._lazy_name_to_id_lower()
+        # the names are indexed when the schema is created, which also rejects duplicate names
+        names = _IndexByName()
+        visit(self, names)
+        self._name_to_id: Dict[str, int] = names.by_name()
+        self._id_to_name: Dict[int, str] = names.by_id()
+        self._indexed = False  # Whether the indexes below have been built by self._build_indexes()
         self._id_to_field: Dict[int, NestedField] = {}  # Should be accessed through self._lazy_id_to_field()
-        self._id_to_name: Dict[int, str] = {}  # Should be accessed through self._lazy_id_to_name()
         self._id_to_accessor: Dict[int, Accessor] = {}  # Should be accessed through self._lazy_id_to_accessor()
+        self._name_to_id_lower: Dict[str, int] = {}  # Should be accessed through self._lazy_name_to_id_lower()
+        self._selections: Dict[Tuple[Tuple[str, ...], bool], Schema] = {}  # Projections cached by select()
+        self._initialized = True
 
     def __str__(self):
         return "table {\n" + "\n".join(["  " + str(field) for field in self.columns]) + "\n}"
@@ -81,13 +116,24 @@ class Schema:
     def identifier_field_ids(self) -> List[int]:
         return self._identifier_field_ids
 
+    def _build_indexes(self) -> None:
+        """Builds the indexes of field IDs to fields and to accessors in a single traversal of the schema
+
+        This is done once, when one of the indexes is needed for the first time.
+        """
+        if self._indexed:
+            return
+        indexes = _BuildIndexes()
+        self._id_to_accessor = visit(self, indexes)
+        self._id_to_field = indexes.id_to_field
+        self._indexed = True
+
     def _lazy_id_to_field(self) -> Dict[int, NestedField]:
         """Returns an index of field ID to NestedField instance
 
-        This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
+        This is built together with the index of accessors when one of them is needed for the first time.
         """
-        if not self._id_to_field:
-            self._id_to_field = index_by_id(self)
+        self._build_indexes()
         return self._id_to_field
 
     def _lazy_name_to_id_lower(self) -> Dict[str, int]:
@@ -102,19 +148,16 @@ class Schema:
     def _lazy_id_to_name(self) -> Dict[int, str]:
         """Returns an index of field ID to full name
 
-        This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
+        The index is built together with the index of names when the schema is created.
         """
-        if not self._id_to_name:
-            self._id_to_name = index_name_by_id(self)
         return self._id_to_name
 
     def _lazy_id_to_accessor(self) -> Dict[int, Accessor]:
         """Returns an index of field ID to accessor
 
-        This is calculated once when called for the first time. Subsequent calls to this method will use a cached index.
+        This is built together with the index of fields when one of them is needed for the first time.
         """
-        if not self._id_to_accessor:
-            self._id_to_accessor = build_position_accessors(self)
+        self._build_indexes()
         return self._id_to_accessor
 
     def as_struct(self) -> StructType:
@@ -178,26 +221,45 @@ class Schema:
     def select(self, names: List[str], case_sensitive: bool = True) -> "Schema":
         """Return a new schema instance pruned to a subset of columns
 
+        Selecting a nested field keeps its parents, and selecting a struct, list or map keeps all of its children. The
+        result is cached, so selecting the same names again returns the same Schema instance.
+
         Args:
             names (List[str]): A list of column names
             case_sensitive (bool, optional): Whether to perform a case-sensitive lookup for each column name. Defaults to True.
 
         Returns:
             Schema: A new schema with pruned columns
+
+        Raises:
+            ValueError: If a name does not match a field of the schema
         """
-        if case_sensitive:
-            return self._case_sensitive_select(schema=self, names=names)
-        return self._case_insensitive_select(schema=self, names=names)
+        key = (tuple(names), case_sensitive)
+        selection = self._selections.get(key)
+        if selection is None:
+            if case_sensitive:
+                selection = self._case_sensitive_select(schema=self, names=names)
+            else:
+                selection = self._case_insensitive_select(schema=self, names=names)
+            self._selections[key] = selection
+        return selection
 
     @classmethod
-    def _case_sensitive_select(cls, schema: "Schema", names: List[str]):
-        # TODO: Add a PruneColumns schema visitor and use it here
-        raise NotImplementedError()
+    def _case_sensitive_select(cls, schema: "Schema", names: List[str]) -> "Schema":
+        name_to_id = schema._name_to_id
+        return prune_columns(schema, {_id_for_name(name_to_id, name, name) for name in names})
 
     @classmethod
-    def _case_insensitive_select(cls, schema: "Schema", names: List[str]):
-        # TODO: Add a PruneColumns schema visitor and use it here
-        raise NotImplementedError()
+    def _case_insensitive_select(cls, schema: "Schema", names: List[str]) -> "Schema":
+        name_to_id = schema._lazy_name_to_id_lower()
+        return prune_columns(schema, {_id_for_name(name_to_id, name.lower(), name) for name in names})
+
+
+def _id_for_name(name_to_id: Dict[str, int], key: str, name: str) -> int:
+    field_id = name_to_id.get(key)
+    if field_id is None:
+        raise ValueError(f"Cannot select column, not found: {name}")
+    return field_id
 
 
 class SchemaVisitor(Generic[T], ABC):
@@ -264,10 +326,21 @@ class SchemaVisitor(Generic[T], ABC):
 
 @dataclass(init=True, eq=True, frozen=True)
 class Accessor:
-    """An accessor for a specific position in a container that implements the StructProtocol"""
+    """An accessor for a specific position in a container that implements the StructProtocol
+
+    The chain of nested accessors is compiled into a tuple of positions and a getter function when the accessor is
+    created, so that `get` does not walk the chain for every row.
+    """
 
     position: int
     inner: Optional["Accessor"] = None
+    _positions: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _getter: Callable[[StructProtocol], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        positions = (self.position,) + (self.inner.positions if self.inner else ())
+        object.__setattr__(self, "_positions", positions)
+        object.__setattr__(self, "_getter", _compile_getter(positions))
 
     def __str__(self):
         return f"Accessor(position={self.position},inner={self.inner})"
@@ -284,21 +357,48 @@ class Accessor:
         Returns:
             Any: The value at position `self.position` in the container
         """
-        pos = self.position
-        val = container.get(pos)
-        inner = self
-        while inner.inner:
-            inner = inner.inner
-            val = val.get(inner.position)
+        return self._getter(container)
+
+    def get_many(self, containers: Iterable[StructProtocol]) -> List[Any]:
+        """Returns the values at self.position in each of the containers
+
+        Args:
+            containers(Iterable[StructProtocol]): The containers to access, for example the rows of a manifest
+
+        Returns:
+            List[Any]: The value in each container, in the order of the containers
+        """
+        return list(map(self._getter, containers))
 
+    @property
+    def positions(self) -> Tuple[int, ...]:
+        """The positions of the value in the nested containers, from the outermost to the innermost"""
+        return self._positions
+
+
+def _compile_getter(positions: Tuple[int, ...]) -> Callable[[StructProtocol], Any]:
+    """Returns a function that gets the value at a path of positions in nested containers"""
+    if len(positions) == 1:
+        return methodcaller("get", positions[0])
+    if len(positions) == 2:
+        outer, inner = positions
+        return lambda container: container.get(outer).get(inner)
+
+    def get(container: StructProtocol) -> Any:
+        val: Any = container
+        for pos in positions:
+            val = val.get(pos)
         return val
 
+    return get
+
 
 @singledispatch
 def visit(obj, visitor: SchemaVisitor[T]) -> T:
     """A generic function for applying a schema visitor to any point within a schema
 
-    The function traverses the schema in post-order fashion
+    The function traverses the schema in post-order fashion. Schemas and Iceberg types are traversed without recursion by
+    `_visit_iteratively`, so the depth and width of a schema are not limited by the recursion limit
 
     Args:
         obj(Schema | IcebergType): An instance of a Schema or an IcebergType
@@ -311,54 +411,116 @@ def visit(obj, visitor: SchemaVisitor[T]) -> T:
 
 
 @visit.register(Schema)
-def _(obj: Schema, visitor: SchemaVisitor[T]) -> T:
-    """Visit a Schema with a concrete SchemaVisitor"""
-    return visitor.schema(obj, visit(obj.as_struct(), visitor))
-
-
 @visit.register(StructType)
-def _(obj: StructType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a StructType with a concrete SchemaVisitor"""
-    results = []
-
-    for field in obj.fields:
-        visitor.before_field(field)
-        result = visit(field.type, visitor)
-        visitor.after_field(field)
-        results.append(visitor.field(field, result))
-
-    return visitor.struct(obj, results)
-
-
 @visit.register(ListType)
-def _(obj: ListType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a ListType with a concrete SchemaVisitor"""
-
-    visitor.before_list_element(obj.element)
-    result = visit(obj.element.type, visitor)
-    visitor.after_list_element(obj.element)
+@visit.register(MapType)
+@visit.register(PrimitiveType)
+def _(obj: Schema | IcebergType, visitor: SchemaVisitor[T]) -> T:
+    """Visit a Schema or an IcebergType with a concrete SchemaVisitor"""
+    return _visit_iteratively(obj, visitor)
 
-    return visitor.list(obj, result)
 
+# Tags of the visited types, computed once per class
+_SCHEMA, _STRUCT, _LIST, _MAP, _PRIMITIVE, _OTHER = range(6)
+_TYPE_TAGS: Dict[type, int] = {Schema: _SCHEMA, StructType: _STRUCT, ListType: _LIST, MapType: _MAP}
 
-@visit.register(MapType)
-def _(obj: MapType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a MapType with a concrete SchemaVisitor"""
-    visitor.before_map_key(obj.key)
-    key_result = visit(obj.key.type, visitor)
-    visitor.after_map_key(obj.key)
 
-    visitor.before_map_value(obj.value)
-    value_result = visit(obj.value.type, visitor)
-    visitor.after_list_element(obj.value)
+def _type_tag(obj: Any) -> int:
+    """Returns the tag of the class of an object"""
+    cls = type(obj)
+    tag = _TYPE_TAGS.get(cls)
+    if tag is None:
+        tag = _TYPE_TAGS[cls] = _PRIMITIVE if issubclass(cls, PrimitiveType) else _OTHER
+    return tag
 
-    return visitor.map(obj, key_result, value_result)
 
+def _visit_iteratively(obj: Schema | IcebergType, visitor: SchemaVisitor[T]) -> T:
+    """Applies a schema visitor with an explicit stack of frames instead of recursion
 
-@visit.register(PrimitiveType)
-def _(obj: PrimitiveType, visitor: SchemaVisitor[T]) -> T:
-    """Visit a PrimitiveType with a concrete SchemaVisitor"""
-    return visitor.primitive(obj)
+    The visitor callbacks are called in the same order as by a recursive post-order traversal. Each schema, struct, list
+    or map that is being visited has a frame on the stack, which receives the results of its children one by one. The
+    primitive fields of a struct are visited by the frame of the struct directly. Objects of other classes are handed
+    back to `visit`, so that types registered with `visit` are supported.
+    """
+    tags = _TYPE_TAGS
+    frames: List[List[Any]] = []
+    current: Any = obj
+    value: Any = None
+    while True:
+        # Descend into the current object until it is finished or a frame is waiting for its first child
+        tag = tags.get(type(current))
+        if tag is None:
+            tag = _type_tag(current)
+        if tag == _PRIMITIVE:
+            value = visitor.primitive(current)
+        elif tag == _STRUCT:
+            frames.append([_STRUCT, current, -1, []])
+        elif tag == _LIST:
+            visitor.before_list_element(current.element)
+            frames.append([_LIST, current])
+            current = current.element.type
+            continue
+        elif tag == _MAP:
+            visitor.before_map_key(current.key)
+            frames.append([_MAP, current, None, False])
+            current = current.key.type
+            continue
+        elif tag == _SCHEMA:
+            frames.append([_SCHEMA, current])
+            current = current.as_struct()
+            continue
+        else:
+            value = visit(current, visitor)
+
+        # Hand the value to the enclosing frames until one of them has another child to visit
+        while frames:
+            frame = frames[-1]
+            tag = frame[0]
+            if tag == _STRUCT:
+                struct, index, results = frame[1], frame[2], frame[3]
+                fields = struct.fields
+                if index >= 0:
+                    field = fields[index]
+                    visitor.after_field(field)
+                    results.append(visitor.field(field, value))
+                index += 1
+                while index < len(fields):
+                    field = fields[index]
+                    visitor.before_field(field)
+                    current = field.type
+                    if tags.get(type(current)) != _PRIMITIVE:
+                        break
+                    result = visitor.primitive(current)
+                    visitor.after_field(field)
+                    results.append(visitor.field(field, result))
+                    index += 1
+                else:
+                    frames.pop()
+                    value = visitor.struct(struct, results)
+                    continue
+                frame[2] = index
+                break
+            elif tag == _LIST:
+                frames.pop()
+                list_type = frame[1]
+                visitor.after_list_element(list_type.element)
+                value = visitor.list(list_type, value)
+            elif tag == _MAP:
+                map_type = frame[1]
+                if not frame[3]:
+                    visitor.after_map_key(map_type.key)
+                    frame[2], frame[3] = value, True
+                    visitor.before_map_value(map_type.value)
+                    current = map_type.value.type
+                    break
+                frames.pop()
+                visitor.after_map_value(map_type.value)
+                value = visitor.map(map_type, frame[2], value)
+            else:
+                frames.pop()
+                value = visitor.schema(frame[1], value)
+        else:
+            return value
 
 
 class _IndexById(SchemaVisitor[Dict[int, NestedField]]):
@@ -596,6 +758,42 @@ class _BuildPositionAccessors(SchemaVisitor[Dict[Position, Accessor]]):
         return {}
 
 
+class _BuildIndexes(SchemaVisitor[Dict[Position, Accessor]]):
+    """A schema visitor that builds the ID and accessor indexes of a schema in a single traversal
+
+    Field IDs are indexed to NestedField instances as in `_IndexById`. The result of the traversal is the index of
+    field IDs to accessors, as built by `_BuildPositionAccessors`.
+    """
+
+    def __init__(self) -> None:
+        self.id_to_field: Dict[int, NestedField] = {}
+        self._accessors = _BuildPositionAccessors()
+
+    def schema(self, schema: Schema, struct_result: Dict[Position, Accessor]) -> Dict[Position, Accessor]:
+        return struct_result
+
+    def struct(self, struct: StructType, field_results: List[Dict[Position, Accessor]]) -> Dict[Position, Accessor]:
+        return self._accessors.struct(struct, field_results)
+
+    def field(self, field: NestedField, field_result: Dict[Position, Accessor]) -> Dict[Position, Accessor]:
+        self.id_to_field[field.field_id] = field
+        return field_result
+
+    def list(self, list_type: ListType, element_result: Dict[Position, Accessor]) -> Dict[Position, Accessor]:
+        self.id_to_field[list_type.element.field_id] = list_type.element
+        return {}
+
+    def map(
+        self, map_type: MapType, key_result: Dict[Position, Accessor], value_result: Dict[Position, Accessor]
+    ) -> Dict[Position, Accessor]:
+        self.id_to_field[map_type.key.field_id] = map_type.key
+        self.id_to_field[map_type.value.field_id] = map_type.value
+        return {}
+
+    def primitive(self, primitive: PrimitiveType) -> Dict[Position, Accessor]:
+        return {}
+
+
 def build_position_accessors(schema_or_type: Schema | IcebergType) -> Dict[int, Accessor]:
     """Generate an index of field IDs to schema position accessors
 
@@ -606,3 +804,95 @@ def build_position_accessors(schema_or_type: Schema | IcebergType) -> Dict[int,
         Dict[int, Accessor]: An index of field IDs to accessors
     """
     return visit(schema_or_type, _BuildPositionAccessors())
+
+
+class _PruneColumns(SchemaVisitor[Optional[IcebergType]]):
+    """A schema visitor that prunes each visited type to a set of field IDs, returning None when nothing is selected
+
+    A selected field keeps its full type. A struct keeps the fields that are selected or contain a selected field, a
+    list is kept if its element is selected or contains a selected field, and a map is kept if its key or its value is
+    selected, or if its value contains a selected field.
+    """
+
+    def __init__(self, selected: Set[int]):
+        self._selected = selected
+
+    def schema(self, schema: Schema, struct_result: Optional[IcebergType]) -> Optional[IcebergType]:
+        return struct_result
+
+    def struct(self, struct: StructType, field_results: List[Optional[IcebergType]]) -> Optional[IcebergType]:
+        fields = []
+        for field, projected_type in zip(struct.fields, field_results):
+            if projected_type is field.type:
+                fields.append(field)
+            elif projected_type is not None:
+                fields.append(NestedField(field.field_id, field.name, projected_type, field.is_optional, field.doc))
+        return StructType(*fields) if fields else None
+
+    def field(self, field: NestedField, field_result: Optional[IcebergType]) -> Optional[IcebergType]:
+        if field.field_id in self._selected:
+            return field.type
+        return field_result
+
+    def list(self, list_type: ListType, element_result: Optional[IcebergType]) -> Optional[IcebergType]:
+        element = list_type.element
+        if element.field_id in self._selected:
+            return list_type
+        if element_result is not None:
+            return ListType(element.field_id, element_result, element.is_optional)
+        return None
+
+    def map(
+        self, map_type: MapType, key_result: Optional[IcebergType], value_result: Optional[IcebergType]
+    ) -> Optional[IcebergType]:
+        key, value = map_type.key, map_type.value
+        if value.field_id in self._selected:
+            return map_type
+        if value_result is not None:
+            return MapType(key.field_id, key.type, value.field_id, value_result, value.is_optional)
+        if key.field_id in self._selected:
+            return map_type
+        return None
+
+    def primitive(self, primitive: PrimitiveType) -> Optional[IcebergType]:
+        return None
+
+
+def prune_columns(schema: Schema, selected: Set[int]) -> Schema:
+    """Prune a schema to a set of field IDs, keeping the parents of the selected fields
+
+    Args:
+        schema (Schema): The schema to prune
+        selected (Set[int]): The IDs of the fields to keep
+
+    Returns:
+        Schema: A schema with the same ID that only contains the selected fields and their parents
+
+    Example:
+        >>> from iceberg.types import *
+        >>> schema = Schema(
+        ...     NestedField(field_id=1, name="id", field_type=LongType(), is_optional=False),
+        ...     NestedField(
+        ...         field_id=2,
+        ...         name="location",
+        ...         field_type=StructType(
+        ...             NestedField(field_id=3, name="latitude", field_type=FloatType(), is_optional=False),
+        ...             NestedField(field_id=4, name="longitude", field_type=FloatType(), is_optional=False),
+        ...         ),
+        ...     ),
+        ...     schema_id=1,
+        ... )
+        >>> print(prune_columns(schema, {3}))
+        table {
+          2: location: optional struct<3: latitude: required float>
+        }
+    """
+    result = visit(schema, _PruneColumns(selected))
+    if not isinstance(result, StructType):
+        return Schema(schema_id=schema.schema_id)
+    remaining = index_by_id(result) if schema.identifier_field_ids else {}
+    return Schema(
+        *result.fields,  # type: ignore
+        schema_id=schema.schema_id,
+        identifier_field_ids=[field_id for field_id in schema.identifier_field_ids if field_id in remaining],
+    )
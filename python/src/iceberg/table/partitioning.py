@@ -14,7 +14,24 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from iceberg.transforms import Transform
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+from urllib.parse import unquote
+
+from iceberg.conversions import codec_for, partition_to_py
+from iceberg.schema import Schema
+from iceberg.transforms import TimeTransform, Transform
+from iceberg.types import (
+    IcebergType,
+    NestedField,
+    StructType,
+    UUIDType,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+_NULL_PARTITION_VALUES = ("null", "__HIVE_DEFAULT_PARTITION__")
 
 
 class PartitionField:
@@ -64,3 +81,252 @@ class PartitionField:
 
     def __repr__(self):
         return f"PartitionField(field_id={self.field_id}, name={self.name}, transform={repr(self.transform)}, source_id={self.source_id})"
+
+
+class PartitionSpec:
+    """
+    PartitionSpec captures the transformation from table data to partition values
+
+    It also computes the partition keys of Arrow record batches and groups their rows by partition, which is the core
+    of a partitioned writer. All transforms are evaluated column-wise with `Transform.apply_array`, and the rows are
+    grouped with Arrow's hash aggregation, so no Python object is created per row: a key tuple is built once for each
+    distinct partition. Grouping requires the arrow extra, which provides numpy and pyarrow.
+
+    Attributes:
+        schema(Schema): The schema of the table that the spec partitions
+        spec_id(int): The id of this partition spec
+        fields(Tuple[PartitionField, ...]): The fields of this partition spec, in the order of partition keys
+        last_assigned_field_id(int): The highest partition field id assigned across the partition specs of the table
+
+    Example:
+        >>> import pyarrow as pa
+        >>> from iceberg.transforms import identity
+        >>> from iceberg.types import IntegerType, StringType
+        >>> table_schema = Schema(
+        ...     NestedField(1, "id", IntegerType()), NestedField(2, "category", StringType()), schema_id=1
+        ... )
+        >>> spec = PartitionSpec(table_schema, 0, [PartitionField(2, 1000, identity(StringType()), "category")], 1000)
+        >>> batch = pa.RecordBatch.from_pydict({"id": [1, 2, 3], "category": ["a", "b", "a"]})
+        >>> [(key, rows.tolist()) for key, rows in spec.partition_indices(batch)]
+        [(('a',), [0, 2]), (('b',), [1])]
+    """
+
+    def __init__(self, schema: Schema, spec_id: int, fields: Iterable[PartitionField], last_assigned_field_id: int):
+        self._schema = schema
+        self._spec_id = spec_id
+        self._fields = tuple(fields)
+        self._last_assigned_field_id = last_assigned_field_id
+
+    @property
+    def schema(self) -> Schema:
+        return self._schema
+
+    @property
+    def spec_id(self) -> int:
+        return self._spec_id
+
+    @property
+    def fields(self) -> Tuple[PartitionField, ...]:
+        return self._fields
+
+    @property
+    def last_assigned_field_id(self) -> int:
+        return self._last_assigned_field_id
+
+    def __eq__(self, other):
+        return isinstance(other, PartitionSpec) and self.spec_id == other.spec_id and self.fields == other.fields
+
+    def __str__(self):
+        fields = "".join(f"\n  {field}" for field in self.fields)
+        return f"[{fields}\n]" if fields else "[]"
+
+    def __repr__(self):
+        return f"PartitionSpec(spec_id={self.spec_id}, fields={repr(list(self.fields))})"
+
+    def is_unpartitioned(self) -> bool:
+        return len(self.fields) == 0
+
+    def fields_by_source_id(self, source_id: int) -> List[PartitionField]:
+        return [field for field in self.fields if field.source_id == source_id]
+
+    def partition_type(self) -> StructType:
+        """Returns the struct of partition values, with a field for each partition field"""
+        return StructType(
+            *[
+                NestedField(field.field_id, field.name, field.transform.result_type(self.schema.find_type(field.source_id)))
+                for field in self.fields
+            ]
+        )
+
+    def _source_column(self, batch: "pa.RecordBatch", source_id: int) -> "pa.Array":
+        from iceberg.utils.arrow import field_column
+
+        return field_column(batch, self.schema, source_id)
+
+    def partition_keys(self, batch: "pa.RecordBatch") -> List["pa.Array"]:
+        """Evaluates the partition transforms over a record batch
+
+        Args:
+            batch (pyarrow.RecordBatch): Rows of the table, with the source columns under their names in the schema
+
+        Returns:
+            List[pyarrow.Array]: The partition values of each partition field, for every row
+        """
+        return [field.transform.apply_array(self._source_column(batch, field.source_id)) for field in self.fields]
+
+    def partition_indices(self, batch: "pa.RecordBatch") -> List[Tuple[tuple, "np.ndarray"]]:
+        """Groups the rows of a record batch by partition
+
+        Args:
+            batch (pyarrow.RecordBatch): Rows of the table, with the source columns under their names in the schema
+
+        Returns:
+            List[Tuple[tuple, numpy.ndarray]]: The partition key of each distinct partition, in the order in which the
+                partitions first appear, and the ascending indices of its rows. Partition values are in their internal
+                representation, so dates are days from 1970-01-01 and timestamps are microseconds.
+        """
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if batch.num_rows == 0:
+            return []
+        elif self.is_unpartitioned():
+            return [((), np.arange(batch.num_rows))]
+
+        # each key column is dictionary-encoded, which puts equal values, nulls and NaNs each under a single code, and the rows
+        # are grouped by their codes with numpy rather than by a hash aggregation, whose results vary across pyarrow versions
+        keys = self.partition_keys(batch)
+        codes = np.stack([pc.fill_null(key.dictionary_encode().indices, -1).to_numpy() for key in keys], axis=1)
+        _, first_rows, groups = np.unique(codes, axis=0, return_index=True, return_inverse=True)
+        groups = groups.reshape(-1)
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(groups))])
+        rows = np.argsort(groups, kind="stable")
+        partitions = list(zip(*[_internal_values(key.take(pa.array(first_rows))) for key in keys]))
+        # the groups are sorted by their codes, so they are put in the order of their first rows
+        return [(partitions[group], rows[bounds[group] : bounds[group + 1]]) for group in np.argsort(first_rows)]
+
+    def partition_batch(self, batch: "pa.RecordBatch") -> List[Tuple[tuple, "pa.RecordBatch"]]:
+        """Splits a record batch into a record batch per partition
+
+        Rows keep their order within each partition. The rows are gathered into partition order with a single take,
+        and the batches of the partitions are zero-copy slices of it. When the rows are already clustered by
+        partition, the input batch is sliced without copying.
+
+        Args:
+            batch (pyarrow.RecordBatch): Rows of the table, with the source columns under their names in the schema
+
+        Returns:
+            List[Tuple[tuple, pyarrow.RecordBatch]]: The partition key of each distinct partition, as returned by
+                `partition_indices`, and its rows
+        """
+        import numpy as np
+
+        groups = self.partition_indices(batch)
+        if not groups:
+            return []
+        order = np.concatenate([indices for _, indices in groups])
+        clustered = batch if np.array_equal(order, np.arange(len(order))) else batch.take(order)
+
+        split = []
+        start = 0
+        for key, indices in groups:
+            split.append((key, clustered.slice(start, len(indices))))
+            start += len(indices)
+        return split
+
+    def parse_partition_paths(self, paths: Iterable[str]) -> "pa.Table":
+        """Parses Hive-style partition paths, such as `category=a/ts_day=2022-01-01`, into a column per partition field
+
+        Each path has a `name=value` segment for every partition field, in the order of the fields, and values are
+        URL-escaped as Hive and Iceberg write them. `null` and `__HIVE_DEFAULT_PARTITION__` are null values, and the
+        values of time transforms are human-readable, such as `ts_month=2022-01`, and parse to their ordinals.
+
+        Paths are split and dictionary-encoded by Arrow, so each distinct segment of a field is parsed only once: the
+        paths of existing tables repeat a few values per field across millions of files, and the typed column of a
+        field is gathered from its parsed distinct values with a single take.
+
+        Example:
+            >>> from iceberg.transforms import identity
+            >>> from iceberg.types import DateType, StringType
+            >>> table_schema = Schema(NestedField(1, "dt", DateType()), NestedField(2, "category", StringType()), schema_id=1)
+            >>> spec = PartitionSpec(
+            ...     table_schema,
+            ...     0,
+            ...     [PartitionField(1, 1000, identity(DateType()), "dt"), PartitionField(2, 1001, identity(StringType()), "category")],
+            ...     1001,
+            ... )
+            >>> spec.parse_partition_paths(["dt=2022-01-01/category=a%2Fb", "dt=2022-01-02/category=null"]).to_pydict()
+            {'dt': [datetime.date(2022, 1, 1), datetime.date(2022, 1, 2)], 'category': ['a/b', None]}
+
+        Args:
+            paths (Iterable[str]): Partition paths relative to the table data location, without file names
+
+        Returns:
+            pyarrow.Table: A column for each partition field, named after the field, with a row for each path. Columns
+                have the Arrow type that `conversions.from_bytes_many` decodes the result type of the field to.
+
+        Raises:
+            ValueError: If a path does not have a segment for every field, a segment is not named after its field, or a
+                value cannot be parsed
+        """
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        num_fields = len(self.fields)
+        path_array = pa.array(paths if isinstance(paths, (list, tuple)) else list(paths), type=pa.string())
+        if path_array.null_count > 0:
+            raise ValueError("Invalid partition path: None")
+        segments = pc.split_pattern(path_array, "/")
+        invalid = pc.not_equal(pc.list_value_length(segments), num_fields)
+        if pc.any(invalid).as_py():
+            path = path_array.filter(invalid)[0].as_py()
+            raise ValueError(f"Invalid partition path, expected {num_fields} fields: {path}")
+
+        # every path has the same number of segments, so the flattened segments of a field are a strided selection
+        flattened = segments.flatten()
+        columns = []
+        for position, field in enumerate(self.fields):
+            result_type = field.transform.result_type(self.schema.find_type(field.source_id))
+            encoded = flattened.take(np.arange(position, len(flattened), num_fields)).dictionary_encode()
+            distinct = [_parse_partition_segment(field, result_type, segment) for segment in encoded.dictionary.to_pylist()]
+            columns.append(_typed_array(result_type, distinct).take(encoded.indices))
+        return pa.Table.from_arrays(columns, names=[field.name for field in self.fields])
+
+
+def _internal_values(column: "pa.ChunkedArray") -> list:
+    import pyarrow as pa
+
+    data_type = column.type
+    if pa.types.is_date32(data_type):
+        column = column.cast(pa.int32())
+    elif pa.types.is_timestamp(data_type) or pa.types.is_time64(data_type):
+        column = column.cast(pa.int64())
+    return column.to_pylist()
+
+
+def _parse_partition_segment(field: PartitionField, result_type: IcebergType, segment: str):
+    segment_name, separator, value = segment.partition("=")
+    if not separator or segment_name != field.name:
+        raise ValueError(f"Invalid partition path segment, expected field {field.name}: {segment}")
+    if "%" in value:
+        value = unquote(value)
+    if value in _NULL_PARTITION_VALUES:
+        return None
+    try:
+        # time transforms write human-readable values, such as 2022-01 for a month, rather than their ordinals
+        if isinstance(field.transform, TimeTransform):
+            return field.transform.from_human_string(value)
+        return partition_to_py(result_type, value)
+    except ValueError as e:
+        raise ValueError(f"Invalid partition path segment {segment}: {e}") from e
+
+
+def _typed_array(result_type: IcebergType, values: list) -> "pa.Array":
+    import pyarrow as pa
+
+    if isinstance(result_type, UUIDType):
+        # Arrow stores UUIDs as their 16 bytes
+        values = [None if value is None else value.bytes for value in values]
+    return pa.array(values, type=codec_for(result_type).arrow_type())  # type: ignore
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import base64
 import struct
 from abc import ABC
 from decimal import Decimal
@@ -23,6 +24,16 @@ from uuid import UUID
 
 import mmh3  # type: ignore
 
+from iceberg.expressions.base import (
+    LITERAL_OPERATIONS,
+    SET_OPERATIONS,
+    UNARY_OPERATIONS,
+    BoundPredicate,
+    Operation,
+    UnboundPredicate,
+    UnboundReference,
+)
+from iceberg.expressions.literals import literal
 from iceberg.types import (
     BinaryType,
     DateType,
@@ -37,7 +48,24 @@ from iceberg.types import (
     TimeType,
     UUIDType,
 )
-from iceberg.utils.decimal import decimal_to_bytes
+from iceberg.utils.datetime import (
+    EPOCH_YEAR,
+    MICROS_PER_HOUR,
+    date_to_days,
+    days_to_date,
+    days_to_months,
+    days_to_years,
+    micros_to_days,
+    micros_to_hours,
+    micros_to_time,
+    micros_to_timestamp,
+    micros_to_timestamptz,
+)
+from iceberg.utils.decimal import (
+    decimal_to_bytes,
+    decimal_to_unscaled,
+    unscaled_to_decimal,
+)
 
 S = TypeVar("S")
 T = TypeVar("T")
@@ -64,18 +92,76 @@ class Transform(ABC, Generic[S, T]):
     def __str__(self):
         return self._transform_string
 
+    def __eq__(self, other):
+        return type(self) is type(other) and self._repr_string == other._repr_string
+
+    def __hash__(self):
+        return hash(self._repr_string)
+
     def __call__(self, value: Optional[S]) -> Optional[T]:
         return self.apply(value)
 
     def apply(self, value: Optional[S]) -> Optional[T]:
         ...
 
+    def apply_array(self, values):
+        """Transforms every value of a pyarrow array, with the same results as `apply` and with null values kept null
+
+        The values are read from the buffers of the array rather than converted to Python objects one by one. Requires
+        the arrow extra, which provides numpy and pyarrow.
+
+        Args:
+            values (pyarrow.Array | pyarrow.ChunkedArray): The values to transform
+
+        Returns:
+            pyarrow.Array | pyarrow.ChunkedArray: The transformed values, chunked like `values`
+        """
+        import pyarrow as pa
+
+        if isinstance(values, pa.ChunkedArray):
+            chunks = values.chunks or [pa.array([], type=values.type)]
+            return pa.chunked_array([self._apply_array(chunk) for chunk in chunks])
+        return self._apply_array(values)
+
+    def _apply_array(self, values):
+        raise NotImplementedError()
+
     def can_transform(self, source: IcebergType) -> bool:
         return False
 
     def result_type(self, source: IcebergType) -> IcebergType:
         ...
 
+    def project(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        """Projects a predicate on the source column into an inclusive predicate on the partition column
+
+        The projected predicate is true for every partition that may contain a row that satisfies `predicate`.
+
+        Args:
+            name (str): The name of the partition column
+            predicate (BoundPredicate): A predicate on the source column
+
+        Returns:
+            Optional[UnboundPredicate]: The projected predicate, or None if the predicate cannot be projected and no
+                partition can be excluded
+        """
+        return None
+
+    def project_strict(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        """Projects a predicate on the source column into a strict predicate on the partition column
+
+        The projected predicate is true only for partitions in which every row satisfies `predicate`.
+
+        Args:
+            name (str): The name of the partition column
+            predicate (BoundPredicate): A predicate on the source column
+
+        Returns:
+            Optional[UnboundPredicate]: The projected predicate, or None if the predicate cannot be projected and no
+                partition is known to match entirely
+        """
+        return None
+
     @property
     def preserves_order(self) -> bool:
         return False
@@ -118,11 +204,43 @@ class BaseBucketTransform(Transform[S, int]):
         raise NotImplementedError()
 
     def apply(self, value: Optional[S]) -> Optional[int]:
-        return (self.hash(value) & IntegerType.max) % self._num_buckets if value else None
+        return (self.hash(value) & IntegerType.max) % self._num_buckets if value is not None else None
+
+    def hash_array(self, values):
+        raise NotImplementedError()
+
+    def _apply_array(self, values):
+        import numpy as np
+        import pyarrow as pa
+
+        from iceberg.utils.arrow import from_numpy
+
+        hashes = self.hash_array(values).view(np.uint32)
+        buckets = ((hashes & np.uint32(IntegerType.max)) % np.uint32(self._num_buckets)).astype(np.int32)
+        return from_numpy(buckets, pa.int32(), values)
 
     def result_type(self, source: IcebergType) -> IcebergType:
         return IntegerType()
 
+    def project(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        if predicate.op in UNARY_OPERATIONS:
+            return UnboundPredicate(predicate.op, UnboundReference(name))
+        elif predicate.op == Operation.EQ:
+            return UnboundPredicate(Operation.EQ, UnboundReference(name), [literal(self.apply(predicate.literal.value))])
+        elif predicate.op == Operation.IN:
+            return _project_set(name, predicate, self)
+        # bucketing does not preserve order, so ranges and inequalities select every bucket
+        return None
+
+    def project_strict(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        if predicate.op in UNARY_OPERATIONS:
+            return UnboundPredicate(predicate.op, UnboundReference(name))
+        elif predicate.op == Operation.NOT_EQ:
+            return UnboundPredicate(Operation.NOT_EQ, UnboundReference(name), [literal(self.apply(predicate.literal.value))])
+        elif predicate.op == Operation.NOT_IN:
+            return _project_set(name, predicate, self)
+        return None
+
 
 class BucketNumberTransform(BaseBucketTransform):
     """Transforms a value of IntegerType, LongType, DateType, TimeType, TimestampType, or TimestamptzType
@@ -140,6 +258,11 @@ class BucketNumberTransform(BaseBucketTransform):
     def hash(self, value) -> int:
         return mmh3.hash(struct.pack("<q", value))
 
+    def hash_array(self, values):
+        from iceberg.utils.murmur3 import hash_long_array
+
+        return hash_long_array(values)
+
 
 class BucketDecimalTransform(BaseBucketTransform):
     """Transforms a value of DecimalType into a bucket partition value.
@@ -156,6 +279,11 @@ class BucketDecimalTransform(BaseBucketTransform):
     def hash(self, value: Decimal) -> int:
         return mmh3.hash(decimal_to_bytes(value))
 
+    def hash_array(self, values):
+        from iceberg.utils.murmur3 import hash_decimal_array
+
+        return hash_decimal_array(values)
+
 
 class BucketStringTransform(BaseBucketTransform):
     """Transforms a value of StringType into a bucket partition value.
@@ -175,6 +303,11 @@ class BucketStringTransform(BaseBucketTransform):
     def hash(self, value: str) -> int:
         return mmh3.hash(value)
 
+    def hash_array(self, values):
+        from iceberg.utils.murmur3 import hash_binary_array
+
+        return hash_binary_array(values)
+
 
 class BucketBytesTransform(BaseBucketTransform):
     """Transforms a value of FixedType or BinaryType into a bucket partition value.
@@ -191,6 +324,11 @@ class BucketBytesTransform(BaseBucketTransform):
     def hash(self, value: bytes) -> int:
         return mmh3.hash(value)
 
+    def hash_array(self, values):
+        from iceberg.utils.murmur3 import hash_binary_array
+
+        return hash_binary_array(values)
+
 
 class BucketUUIDTransform(BaseBucketTransform):
     """Transforms a value of UUIDType into a bucket partition value.
@@ -216,6 +354,476 @@ class BucketUUIDTransform(BaseBucketTransform):
             )
         )
 
+    def hash_array(self, values):
+        from iceberg.utils.murmur3 import hash_binary_array
+
+        return hash_binary_array(values)
+
+
+class IdentityTransform(Transform[S, S]):
+    """Transforms a value into itself.
+
+    Example:
+        >>> transform = IdentityTransform(StringType())
+        >>> transform.apply("hello-world")
+        'hello-world'
+    """
+
+    def __init__(self, source_type: IcebergType):
+        super().__init__("identity", f"transforms.identity(source_type={repr(source_type)})")
+        self._type = source_type
+
+    def apply(self, value: Optional[S]) -> Optional[S]:
+        return value
+
+    def _apply_array(self, values):
+        return values
+
+    def can_transform(self, source: IcebergType) -> bool:
+        return source.is_primitive
+
+    def result_type(self, source: IcebergType) -> IcebergType:
+        return source
+
+    @property
+    def preserves_order(self) -> bool:
+        return True
+
+    def satisfies_order_of(self, other) -> bool:
+        return other.preserves_order
+
+    def project(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        return self.project_strict(name, predicate)
+
+    def project_strict(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        return UnboundPredicate(predicate.op, UnboundReference(name), predicate.literals)
+
+    def to_human_string(self, value: Optional[S]) -> str:
+        return _human_string(self._type, value)
+
+
+class TimeTransform(Transform[int, int]):
+    """Base Transform class to transform a date or a timestamp into a time partition value
+
+    Dates are days from 1970-01-01 and timestamps are microseconds from 1970-01-01T00:00:00, and both are converted
+    with integer arithmetic only, so the columnar path works directly on the buffers of date32 and timestamp[us]
+    arrays.
+
+    Args:
+      source_type (Type): An Iceberg Type of DateType, TimestampType or TimestamptzType.
+      name (str): The name of the transform, which is also its granularity.
+    """
+
+    _granularity: int
+
+    def __init__(self, source_type: IcebergType, name: str):
+        super().__init__(name, f"transforms.{name}(source_type={repr(source_type)})")
+        self._type = source_type
+
+    def from_days(self, days: int) -> int:
+        raise NotImplementedError()
+
+    def from_micros(self, micros: int) -> int:
+        raise NotImplementedError()
+
+    def from_human_string(self, value_str: str) -> int:
+        """Parses a partition value as written by `to_human_string`, which is how partition paths hold it
+
+        Raises:
+            ValueError: If the string is not a value of this transform
+        """
+        raise NotImplementedError()
+
+    def apply(self, value: Optional[int]) -> Optional[int]:
+        if value is None:
+            return None
+        return self.from_days(value) if isinstance(self._type, DateType) else self.from_micros(value)
+
+    def _apply_array(self, values):
+        import numpy as np
+        import pyarrow as pa
+
+        from iceberg.utils.arrow import from_numpy, integer_values
+
+        data_type = values.type
+        if pa.types.is_date32(data_type) and isinstance(self._type, DateType):
+            result = self.from_days(integer_values(values).astype(np.int64))
+        elif pa.types.is_timestamp(data_type) and data_type.unit == "us" and not isinstance(self._type, DateType):
+            result = self.from_micros(integer_values(values))
+        else:
+            raise ValueError(f"Cannot apply {self} to array of type {data_type}")
+        return from_numpy(
+            result.astype(np.int32), pa.date32() if self.result_type(self._type) == DateType() else pa.int32(), values
+        )
+
+    def can_transform(self, source: IcebergType) -> bool:
+        return type(source) in {DateType, TimestampType, TimestamptzType}
+
+    def result_type(self, source: IcebergType) -> IcebergType:
+        return IntegerType()
+
+    @property
+    def preserves_order(self) -> bool:
+        return True
+
+    def satisfies_order_of(self, other) -> bool:
+        return isinstance(other, TimeTransform) and self._granularity <= other._granularity
+
+    def project(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        if predicate.op in UNARY_OPERATIONS:
+            return UnboundPredicate(predicate.op, UnboundReference(name))
+        elif predicate.op in LITERAL_OPERATIONS:
+            return _truncate_number(name, predicate, self)
+        elif predicate.op == Operation.IN:
+            return _project_set(name, predicate, self)
+        return None
+
+    def project_strict(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        if predicate.op in UNARY_OPERATIONS:
+            return UnboundPredicate(predicate.op, UnboundReference(name))
+        elif predicate.op in LITERAL_OPERATIONS:
+            return _truncate_number_strict(name, predicate, self)
+        elif predicate.op == Operation.NOT_IN:
+            return _project_set(name, predicate, self)
+        return None
+
+    @property
+    def dedup_name(self) -> str:
+        return "time"
+
+
+class YearTransform(TimeTransform):
+    """Transforms a date or a timestamp into years from 1970.
+
+    Example:
+        >>> transform = YearTransform(DateType())
+        >>> transform.apply(17501)
+        47
+        >>> transform.to_human_string(47)
+        '2017'
+        >>> transform.from_human_string('2017')
+        47
+    """
+
+    _granularity = 3
+
+    def __init__(self, source_type: IcebergType):
+        super().__init__(source_type, "year")
+
+    def from_days(self, days: int) -> int:
+        return days_to_years(days)
+
+    def from_micros(self, micros: int) -> int:
+        return days_to_years(micros_to_days(micros))
+
+    def to_human_string(self, value: Optional[int]) -> str:
+        return f"{EPOCH_YEAR + value:04d}" if value is not None else "null"
+
+    def from_human_string(self, value_str: str) -> int:
+        return int(value_str) - EPOCH_YEAR
+
+
+class MonthTransform(TimeTransform):
+    """Transforms a date or a timestamp into months from 1970-01.
+
+    Example:
+        >>> transform = MonthTransform(DateType())
+        >>> transform.apply(17501)
+        575
+        >>> transform.to_human_string(575)
+        '2017-12'
+        >>> transform.from_human_string('2017-12')
+        575
+    """
+
+    _granularity = 2
+
+    def __init__(self, source_type: IcebergType):
+        super().__init__(source_type, "month")
+
+    def from_days(self, days: int) -> int:
+        return days_to_months(days)
+
+    def from_micros(self, micros: int) -> int:
+        return days_to_months(micros_to_days(micros))
+
+    def to_human_string(self, value: Optional[int]) -> str:
+        if value is None:
+            return "null"
+        years, month = divmod(value, 12)
+        return f"{EPOCH_YEAR + years:04d}-{month + 1:02d}"
+
+    def from_human_string(self, value_str: str) -> int:
+        year, _, month = value_str.rpartition("-")
+        if not year or not 1 <= int(month) <= 12:
+            raise ValueError(f"Invalid month: {value_str}")
+        return (int(year) - EPOCH_YEAR) * 12 + int(month) - 1
+
+
+class DayTransform(TimeTransform):
+    """Transforms a date or a timestamp into days from 1970-01-01, as a date.
+
+    Example:
+        >>> transform = DayTransform(TimestampType())
+        >>> transform.apply(1512151975038194)
+        17501
+        >>> transform.to_human_string(17501)
+        '2017-12-01'
+        >>> transform.from_human_string('2017-12-01')
+        17501
+    """
+
+    _granularity = 1
+
+    def __init__(self, source_type: IcebergType):
+        super().__init__(source_type, "day")
+
+    def from_days(self, days: int) -> int:
+        return days
+
+    def from_micros(self, micros: int) -> int:
+        return micros_to_days(micros)
+
+    def result_type(self, source: IcebergType) -> IcebergType:
+        return DateType()
+
+    def to_human_string(self, value: Optional[int]) -> str:
+        return days_to_date(value).isoformat() if value is not None else "null"
+
+    def from_human_string(self, value_str: str) -> int:
+        return date_to_days(value_str)
+
+
+class HourTransform(TimeTransform):
+    """Transforms a timestamp into hours from 1970-01-01T00:00.
+
+    Example:
+        >>> transform = HourTransform(TimestampType())
+        >>> transform.apply(1512151975038194)
+        420042
+        >>> transform.to_human_string(420042)
+        '2017-12-01-18'
+        >>> transform.from_human_string('2017-12-01-18')
+        420042
+    """
+
+    _granularity = 0
+
+    def __init__(self, source_type: IcebergType):
+        super().__init__(source_type, "hour")
+
+    def from_micros(self, micros: int) -> int:
+        return micros_to_hours(micros)
+
+    def can_transform(self, source: IcebergType) -> bool:
+        return type(source) in {TimestampType, TimestamptzType}
+
+    def to_human_string(self, value: Optional[int]) -> str:
+        return micros_to_timestamp(value * MICROS_PER_HOUR).strftime("%Y-%m-%d-%H") if value is not None else "null"
+
+    def from_human_string(self, value_str: str) -> int:
+        date_str, _, hour = value_str.rpartition("-")
+        if not date_str or not 0 <= int(hour) <= 23:
+            raise ValueError(f"Invalid hour: {value_str}")
+        return date_to_days(date_str) * 24 + int(hour)
+
+
+class TruncateTransform(Transform[S, S]):
+    """Transforms a value into the value truncated to a width
+
+    Integers and the unscaled values of decimals are truncated down to a multiple of the width, and strings and
+    binary values are truncated to their first `width` code points or bytes.
+
+    Args:
+      source_type (Type): An Iceberg Type of IntegerType, LongType, DecimalType, StringType or BinaryType.
+      width (int): The width to truncate to.
+
+    Example:
+        >>> transform = TruncateTransform(IntegerType(), 10)
+        >>> transform.apply(-1)
+        -10
+        >>> TruncateTransform(DecimalType(9, 2), 50).apply(Decimal("10.65"))
+        Decimal('10.50')
+        >>> TruncateTransform(StringType(), 3).apply("iceberg")
+        'ice'
+    """
+
+    def __init__(self, source_type: IcebergType, width: int):
+        super().__init__(f"truncate[{width}]", f"transforms.truncate(source_type={repr(source_type)}, width={width})")
+        self._type = source_type
+        self._width = width
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    def apply(self, value: Optional[S]) -> Optional[S]:
+        if value is None:
+            return None
+        elif isinstance(value, (str, bytes)):
+            return value[: self._width]  # type: ignore
+        elif isinstance(value, Decimal):
+            unscaled = decimal_to_unscaled(value)
+            return unscaled_to_decimal(unscaled - unscaled % self._width, -value.as_tuple().exponent)  # type: ignore
+        return value - value % self._width  # type: ignore
+
+    def _apply_array(self, values):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        from iceberg.utils.arrow import (
+            binary_prefixes,
+            decimal_values,
+            from_decimal_values,
+            from_numpy,
+            integer_values,
+        )
+
+        data_type = values.type
+        if pa.types.is_integer(data_type):
+            storage = integer_values(values)
+            return from_numpy(storage - storage % self._width, data_type, values)
+        elif pa.types.is_decimal128(data_type) and data_type.precision <= 18:
+            unscaled = decimal_values(values)
+            return from_decimal_values(unscaled - unscaled % self._width, data_type, values)
+        elif pa.types.is_decimal(data_type):
+            # unscaled values that do not fit in 64 bits are truncated with Python integers
+            return pa.array([self.apply(value) for value in values.to_pylist()], type=data_type)
+        elif pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+            return pc.utf8_slice_codeunits(values, 0, self._width)
+        elif pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type):
+            return binary_prefixes(values, self._width)
+        raise ValueError(f"Cannot apply {self} to array of type {data_type}")
+
+    def can_transform(self, source: IcebergType) -> bool:
+        return type(source) in {IntegerType, LongType, StringType, BinaryType} or isinstance(source, DecimalType)
+
+    def result_type(self, source: IcebergType) -> IcebergType:
+        return source
+
+    @property
+    def preserves_order(self) -> bool:
+        return True
+
+    def satisfies_order_of(self, other) -> bool:
+        if self == other:
+            return True
+        elif isinstance(self._type, (StringType, BinaryType)) and isinstance(other, TruncateTransform):
+            return other._type == self._type and self._width >= other._width
+        return False
+
+    def project(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        if predicate.op in UNARY_OPERATIONS:
+            return UnboundPredicate(predicate.op, UnboundReference(name))
+        elif predicate.op in LITERAL_OPERATIONS:
+            if isinstance(self._type, (StringType, BinaryType)):
+                return _truncate_array(name, predicate, self)
+            return _truncate_number(name, predicate, self)
+        elif predicate.op == Operation.IN:
+            return _project_set(name, predicate, self)
+        return None
+
+    def project_strict(self, name: str, predicate: BoundPredicate) -> Optional[UnboundPredicate]:
+        if predicate.op in UNARY_OPERATIONS:
+            return UnboundPredicate(predicate.op, UnboundReference(name))
+        elif predicate.op in LITERAL_OPERATIONS:
+            if isinstance(self._type, (StringType, BinaryType)):
+                return _truncate_array_strict(name, predicate, self)
+            return _truncate_number_strict(name, predicate, self)
+        elif predicate.op == Operation.NOT_IN:
+            return _project_set(name, predicate, self)
+        return None
+
+    def to_human_string(self, value: Optional[S]) -> str:
+        return _human_string(self._type, value)
+
+
+def _human_string(source_type: IcebergType, value) -> str:
+    if value is None:
+        return "null"
+    elif isinstance(source_type, DateType):
+        return days_to_date(value).isoformat()
+    elif isinstance(source_type, TimeType):
+        return micros_to_time(value).isoformat()
+    elif isinstance(source_type, TimestampType):
+        return micros_to_timestamp(value).isoformat()
+    elif isinstance(source_type, TimestamptzType):
+        return micros_to_timestamptz(value).isoformat()
+    elif isinstance(source_type, (BinaryType, FixedType)):
+        return base64.b64encode(value).decode("ascii")
+    return str(value)
+
+
+def _adjacent(value, step: int):
+    """Returns the value `step` units of the last place away, which is the next or previous value of its type"""
+    if isinstance(value, Decimal):
+        return unscaled_to_decimal(decimal_to_unscaled(value) + step, -value.as_tuple().exponent)  # type: ignore
+    return value + step
+
+
+def _predicate(op: Operation, name: str, value) -> UnboundPredicate:
+    return UnboundPredicate(op, UnboundReference(name), [literal(value)])
+
+
+def _project_set(name: str, predicate: BoundPredicate, transform: Transform) -> UnboundPredicate:
+    values = dict.fromkeys(transform.apply(lit.value) for lit in predicate.literals)
+    return UnboundPredicate(predicate.op, UnboundReference(name), [literal(value) for value in values])
+
+
+def _truncate_number(name: str, predicate: BoundPredicate, transform: Transform) -> Optional[UnboundPredicate]:
+    boundary = predicate.literal.value
+    if predicate.op == Operation.LT:
+        return _predicate(Operation.LT_EQ, name, transform.apply(_adjacent(boundary, -1)))
+    elif predicate.op == Operation.LT_EQ:
+        return _predicate(Operation.LT_EQ, name, transform.apply(boundary))
+    elif predicate.op == Operation.GT:
+        return _predicate(Operation.GT_EQ, name, transform.apply(_adjacent(boundary, 1)))
+    elif predicate.op == Operation.GT_EQ:
+        return _predicate(Operation.GT_EQ, name, transform.apply(boundary))
+    elif predicate.op == Operation.EQ:
+        return _predicate(Operation.EQ, name, transform.apply(boundary))
+    # NOT_EQ: the partition of the boundary also holds other values
+    return None
+
+
+def _truncate_number_strict(name: str, predicate: BoundPredicate, transform: Transform) -> Optional[UnboundPredicate]:
+    boundary = predicate.literal.value
+    if predicate.op == Operation.LT:
+        return _predicate(Operation.LT, name, transform.apply(boundary))
+    elif predicate.op == Operation.LT_EQ:
+        return _predicate(Operation.LT, name, transform.apply(_adjacent(boundary, 1)))
+    elif predicate.op == Operation.GT:
+        return _predicate(Operation.GT, name, transform.apply(boundary))
+    elif predicate.op == Operation.GT_EQ:
+        return _predicate(Operation.GT, name, transform.apply(_adjacent(boundary, -1)))
+    elif predicate.op == Operation.NOT_EQ:
+        return _predicate(Operation.NOT_EQ, name, transform.apply(boundary))
+    # EQ: no partition holds only the boundary, because adjacent values share partitions
+    return None
+
+
+def _truncate_array(name: str, predicate: BoundPredicate, transform: Transform) -> Optional[UnboundPredicate]:
+    # a truncated value is a prefix, which sorts at or before every value that it is the prefix of
+    boundary = predicate.literal.value
+    if predicate.op in {Operation.LT, Operation.LT_EQ}:
+        return _predicate(Operation.LT_EQ, name, transform.apply(boundary))
+    elif predicate.op in {Operation.GT, Operation.GT_EQ}:
+        return _predicate(Operation.GT_EQ, name, transform.apply(boundary))
+    elif predicate.op == Operation.EQ:
+        return _predicate(Operation.EQ, name, transform.apply(boundary))
+    return None
+
+
+def _truncate_array_strict(name: str, predicate: BoundPredicate, transform: Transform) -> Optional[UnboundPredicate]:
+    boundary = predicate.literal.value
+    if predicate.op in {Operation.LT, Operation.LT_EQ}:
+        return _predicate(Operation.LT, name, transform.apply(boundary))
+    elif predicate.op in {Operation.GT, Operation.GT_EQ}:
+        return _predicate(Operation.GT, name, transform.apply(boundary))
+    elif predicate.op == Operation.NOT_EQ:
+        return _predicate(Operation.NOT_EQ, name, transform.apply(boundary))
+    return None
+
 
 class UnknownTransform(Transform):
     """A transform that represents when an unknown transform is provided
@@ -237,6 +845,9 @@ class UnknownTransform(Transform):
     def apply(self, value: Optional[S]):
         raise AttributeError(f"Cannot apply unsupported transform: {self}")
 
+    def _apply_array(self, values):
+        raise AttributeError(f"Cannot apply unsupported transform: {self}")
+
     def can_transform(self, target: IcebergType) -> bool:
         return self._type == target
 
@@ -260,6 +871,11 @@ class VoidTransform(Transform):
     def apply(self, value: Optional[S]) -> None:
         return None
 
+    def _apply_array(self, values):
+        import pyarrow as pa
+
+        return pa.nulls(len(values), type=values.type)
+
     def can_transform(self, target: IcebergType) -> bool:
         return True
 
@@ -287,5 +903,41 @@ def bucket(source_type: IcebergType, num_buckets: int) -> BaseBucketTransform:
         raise ValueError(f"Cannot bucket by type: {source_type}")
 
 
+def identity(source_type: IcebergType) -> IdentityTransform:
+    return IdentityTransform(source_type)
+
+
+def year(source_type: IcebergType) -> YearTransform:
+    if type(source_type) in {DateType, TimestampType, TimestamptzType}:
+        return YearTransform(source_type)
+    raise ValueError(f"Cannot partition type {source_type} by year")
+
+
+def month(source_type: IcebergType) -> MonthTransform:
+    if type(source_type) in {DateType, TimestampType, TimestamptzType}:
+        return MonthTransform(source_type)
+    raise ValueError(f"Cannot partition type {source_type} by month")
+
+
+def day(source_type: IcebergType) -> DayTransform:
+    if type(source_type) in {DateType, TimestampType, TimestamptzType}:
+        return DayTransform(source_type)
+    raise ValueError(f"Cannot partition type {source_type} by day")
+
+
+def hour(source_type: IcebergType) -> HourTransform:
+    if type(source_type) in {TimestampType, TimestamptzType}:
+        return HourTransform(source_type)
+    raise ValueError(f"Cannot partition type {source_type} by hour")
+
+
+def truncate(source_type: IcebergType, width: int) -> TruncateTransform:
+    if width <= 0:
+        raise ValueError(f"Invalid truncate width: {width} (must be > 0)")
+    if type(source_type) in {IntegerType, LongType, StringType, BinaryType} or isinstance(source_type, DecimalType):
+        return TruncateTransform(source_type, width)
+    raise ValueError(f"Cannot truncate type: {source_type}")
+
+
 def always_null() -> Transform:
     return VoidTransform()
@@ -19,6 +19,10 @@
 This module implements the data types described in the Iceberg specification for Iceberg schemas. To
 describe an Iceberg table schema, these classes can be used in the construction of a StructType instance.
 
+Parameterized types and fields are interned: constructing one with the same parameters as an instance that is still
+referenced returns that instance. Instances that are no longer referenced are released, so that long-running processes
+that load many table versions do not accumulate types.
+
 Example:
     >>> str(StructType(
     ...     NestedField(1, "required_field", StringType(), True),
@@ -30,7 +34,8 @@ Notes:
   - https://iceberg.apache.org/#spec/#primitive-types
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
+from weakref import WeakValueDictionary
 
 
 class Singleton:
@@ -77,11 +82,13 @@ class FixedType(PrimitiveType):
         True
     """
 
-    _instances: Dict[int, "FixedType"] = {}
+    _instances: "WeakValueDictionary[int, FixedType]" = WeakValueDictionary()
 
     def __new__(cls, length: int):
-        cls._instances[length] = cls._instances.get(length) or object.__new__(cls)
-        return cls._instances[length]
+        instance = cls._instances.get(length)
+        if instance is None:
+            instance = cls._instances[length] = object.__new__(cls)
+        return instance
 
     def __init__(self, length: int):
         if not self._initialized:
@@ -103,12 +110,14 @@ class DecimalType(PrimitiveType):
         True
     """
 
-    _instances: Dict[Tuple[int, int], "DecimalType"] = {}
+    _instances: "WeakValueDictionary[Tuple[int, int], DecimalType]" = WeakValueDictionary()
 
     def __new__(cls, precision: int, scale: int):
         key = (precision, scale)
-        cls._instances[key] = cls._instances.get(key) or object.__new__(cls)
-        return cls._instances[key]
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = object.__new__(cls)
+        return instance
 
     def __init__(self, precision: int, scale: int):
         if not self._initialized:
@@ -134,7 +143,7 @@ class NestedField(IcebergType):
     This is where field IDs, names, docs, and nullability are tracked.
     """
 
-    _instances: Dict[Tuple[bool, int, str, IcebergType, Optional[str]], "NestedField"] = {}
+    _instances: "WeakValueDictionary[Tuple[bool, int, str, IcebergType, Optional[str]], NestedField]" = WeakValueDictionary()
 
     def __new__(
         cls,
@@ -145,8 +154,10 @@ class NestedField(IcebergType):
         doc: Optional[str] = None,
     ):
         key = (is_optional, field_id, name, field_type, doc)
-        cls._instances[key] = cls._instances.get(key) or object.__new__(cls)
-        return cls._instances[key]
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = object.__new__(cls)
+        return instance
 
     def __init__(
         self,
@@ -209,11 +220,13 @@ class StructType(IcebergType):
         'struct<1: required_field: optional string, 2: optional_field: optional int>'
     """
 
-    _instances: Dict[Tuple[NestedField, ...], "StructType"] = {}
+    _instances: "WeakValueDictionary[Tuple[NestedField, ...], StructType]" = WeakValueDictionary()
 
     def __new__(cls, *fields: NestedField):
-        cls._instances[fields] = cls._instances.get(fields) or object.__new__(cls)
-        return cls._instances[fields]
+        instance = cls._instances.get(fields)
+        if instance is None:
+            instance = cls._instances[fields] = object.__new__(cls)
+        return instance
 
     def __init__(self, *fields: NestedField):
         if not self._initialized:
@@ -236,7 +249,7 @@ class ListType(IcebergType):
         ListType(element_id=3, element_type=StringType(), element_is_optional=True)
     """
 
-    _instances: Dict[Tuple[bool, int, IcebergType], "ListType"] = {}
+    _instances: "WeakValueDictionary[Tuple[bool, int, IcebergType], ListType]" = WeakValueDictionary()
 
     def __new__(
         cls,
@@ -245,8 +258,10 @@ class ListType(IcebergType):
         element_is_optional: bool = True,
     ):
         key = (element_is_optional, element_id, element_type)
-        cls._instances[key] = cls._instances.get(key) or object.__new__(cls)
-        return cls._instances[key]
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = object.__new__(cls)
+        return instance
 
     def __init__(
         self,
@@ -280,7 +295,7 @@ class MapType(IcebergType):
         MapType(key_id=1, key_type=StringType(), value_id=2, value_type=IntegerType(), value_is_optional=True)
     """
 
-    _instances: Dict[Tuple[int, IcebergType, int, IcebergType, bool], "MapType"] = {}
+    _instances: "WeakValueDictionary[Tuple[int, IcebergType, int, IcebergType, bool], MapType]" = WeakValueDictionary()
 
     def __new__(
         cls,
@@ -291,8 +306,10 @@ class MapType(IcebergType):
         value_is_optional: bool = True,
     ):
         impl_key = (key_id, key_type, value_id, value_type, value_is_optional)
-        cls._instances[impl_key] = cls._instances.get(impl_key) or object.__new__(cls)
-        return cls._instances[impl_key]
+        instance = cls._instances.get(impl_key)
+        if instance is None:
+            instance = cls._instances[impl_key] = object.__new__(cls)
+        return instance
 
     def __init__(
         self,
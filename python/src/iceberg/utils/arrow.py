@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Helpers for the columnar paths of transforms, which work on the buffers of pyarrow arrays with numpy
+
+Values are read from the buffers of an array without creating a Python object per value, and results are wrapped
+back into arrays that take their nulls from the input. Slots that are null in the input hold arbitrary values in
+the buffers, so the computations on them are wasted but harmless.
+
+Example:
+    >>> import pyarrow as pa
+    >>> values = pa.array([1, None, 3], type=pa.int32())
+    >>> from_numpy(integer_values(values) * 2, pa.int32(), values).to_pylist()
+    [2, None, 6]
+"""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+if TYPE_CHECKING:
+    from iceberg.schema import Schema
+
+_INTEGER_STORAGE_TYPES = (pa.types.is_integer, pa.types.is_date, pa.types.is_time, pa.types.is_timestamp)
+
+
+def buffer_values(buffer: pa.Buffer, dtype: str) -> np.ndarray:
+    """Returns a zero-copy numpy view of a buffer, which may be missing when an array has no values"""
+    return np.frombuffer(buffer, dtype=dtype) if buffer is not None else np.zeros(0, dtype=dtype)
+
+
+def integer_values(values: pa.Array) -> np.ndarray:
+    """Returns the integer storage of an array of integers, dates, times or timestamps as a zero-copy numpy view
+
+    Args:
+        values (pa.Array): An array with an integer storage type, such as int32, date32, time64 or timestamp
+
+    Returns:
+        np.ndarray: The stored integer of every slot, including null slots
+
+    Raises:
+        ValueError: If the array is not stored as integers
+    """
+    data_type = values.type
+    if not any(check(data_type) for check in _INTEGER_STORAGE_TYPES):
+        raise ValueError(f"Cannot read array of type {data_type} as integers")
+    storage = buffer_values(
+        values.buffers()[1], f"<{'u' if pa.types.is_unsigned_integer(data_type) else 'i'}{data_type.bit_width // 8}"
+    )
+    return storage[values.offset : values.offset + len(values)]
+
+
+def from_numpy(result: np.ndarray, data_type: pa.DataType, nulls_of: pa.Array) -> pa.Array:
+    """Wraps the result of a columnar computation into an array that is null wherever `nulls_of` is null
+
+    Args:
+        result (np.ndarray): One value for every slot of `nulls_of`
+        data_type (pa.DataType): The type of the returned array
+        nulls_of (pa.Array): The input of the computation
+
+    Returns:
+        pa.Array: The result as an array of `data_type`
+    """
+    mask = nulls_of.is_null().to_numpy(zero_copy_only=False) if nulls_of.null_count > 0 else None
+    return pa.array(result, type=data_type, mask=mask)
+
+
+def decimal_values(values: pa.Array) -> np.ndarray:
+    """Returns the unscaled values of an array of decimals that fit in 64 bits
+
+    Args:
+        values (pa.Array): A decimal128 array with a precision of at most 18
+
+    Returns:
+        np.ndarray: The int64 unscaled value of every slot, including null slots
+
+    Raises:
+        ValueError: If the array does not hold decimals that fit in 64 bits
+    """
+    data_type = values.type
+    if not pa.types.is_decimal128(data_type) or data_type.precision > 18:
+        raise ValueError(f"Cannot read array of type {data_type} as 64-bit unscaled values")
+    # the low word of a little-endian decimal128 is the whole value when the high word only extends its sign
+    storage = buffer_values(values.buffers()[1], "<i8")[2 * values.offset : 2 * (values.offset + len(values))]
+    return storage[::2]
+
+
+def from_decimal_values(unscaled: np.ndarray, data_type: pa.DataType, nulls_of: pa.Array) -> pa.Array:
+    """Wraps 64-bit unscaled values into a decimal128 array that is null wherever `nulls_of` is null
+
+    Args:
+        unscaled (np.ndarray): One unscaled value for every slot of `nulls_of`
+        data_type (pa.DataType): The decimal128 type of the returned array
+        nulls_of (pa.Array): The input of the computation
+
+    Returns:
+        pa.Array: The values as an array of `data_type`
+    """
+    # the values start at the offset of `nulls_of`, so that its validity bitmap is shared as is
+    offset = nulls_of.offset
+    words = np.empty((offset + len(unscaled), 2), dtype="<i8")
+    words[offset:, 0] = unscaled
+    words[offset:, 1] = unscaled >> 63
+    validity = nulls_of.buffers()[0] if nulls_of.null_count > 0 else None
+    return pa.Array.from_buffers(
+        data_type, len(unscaled), [validity, pa.py_buffer(words)], null_count=nulls_of.null_count, offset=offset
+    )
+
+
+def binary_prefixes(values: pa.Array, width: int) -> pa.Array:
+    """Returns the first `width` bytes of every value of a binary array, which are all of the bytes of shorter values
+
+    Args:
+        values (pa.Array): A binary or large_binary array
+        width (int): The maximum length of the returned values
+
+    Returns:
+        pa.Array: The prefixes, as an array of the type of `values` that is null wherever `values` is null
+    """
+    offset_dtype = "<i8" if pa.types.is_large_binary(values.type) else "<i4"
+    offset, num_values = values.offset, len(values)
+    offsets = buffer_values(values.buffers()[1], offset_dtype)[offset : offset + num_values + 1]
+    starts = offsets[:-1]
+    lengths = np.minimum(offsets[1:] - starts, width)
+    # the offsets of the prefixes also start at the offset of `values`, so that its validity bitmap is shared as is
+    prefix_offsets = np.zeros(offset + num_values + 1, dtype=offset_dtype)
+    np.cumsum(lengths, out=prefix_offsets[offset + 1 :])
+    # each byte of a prefix is gathered from the start of its value plus its position within the prefix
+    gather = np.arange(prefix_offsets[-1]) + np.repeat(starts - prefix_offsets[offset:-1], lengths)
+    data = buffer_values(values.buffers()[2], "u1")[gather]
+    validity = values.buffers()[0] if values.null_count > 0 else None
+    return pa.Array.from_buffers(
+        values.type,
+        num_values,
+        [validity, pa.py_buffer(prefix_offsets), pa.py_buffer(data)],
+        null_count=values.null_count,
+        offset=offset,
+    )
+
+
+def field_column(batch: pa.RecordBatch, schema: "Schema", field_id: int) -> pa.Array:
+    """Returns the column of a field of a schema in a record batch, where the columns are named as in the schema
+
+    Nested fields are resolved through the struct columns that hold them, by walking the accessor positions of the
+    field in the schema.
+
+    Args:
+        batch (pa.RecordBatch): Rows of the schema, with the top-level fields as columns
+        schema (Schema): The schema of the rows
+        field_id (int): The id of a field that is not in a list or a map
+
+    Returns:
+        pa.Array: The values of the field
+    """
+    struct = schema.as_struct()
+    names = []
+    for position in schema.accessor_for_field(field_id).positions:
+        field = struct.fields[position]
+        names.append(field.name)
+        struct = field.type  # type: ignore
+    column = batch.column(names[0])
+    for name in names[1:]:
+        # the child is selected by its index in the struct, since older pyarrow releases do not take field names
+        column = pc.struct_field(column, [column.type.get_field_index(name)])
+    return column
@@ -17,18 +17,75 @@
 """Helper methods for working with date/time representations
 """
 import re
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
+from typing import Tuple
 
 EPOCH_DATE = date.fromisoformat("1970-01-01")
 EPOCH_TIMESTAMP = datetime.fromisoformat("1970-01-01T00:00:00.000000")
 ISO_TIMESTAMP = re.compile(r"\d\d\d\d-\d\d-\d\dT\d\d:\d\d:\d\d(.\d{1,6})?")
 EPOCH_TIMESTAMPTZ = datetime.fromisoformat("1970-01-01T00:00:00.000000+00:00")
 ISO_TIMESTAMPTZ = re.compile(r"\d\d\d\d-\d\d-\d\dT\d\d:\d\d:\d\d(.\d{1,6})?[-+]\d\d:\d\d")
+EPOCH_YEAR = 1970
+MICROS_PER_HOUR = 3_600_000_000
+MICROS_PER_DAY = 86_400_000_000
+
+# The conversions between days, months, years and hours below only use integer arithmetic, so that they also
+# work elementwise on numpy integer arrays, which the columnar paths of the transforms pass to them.
 
 
 def micros_to_days(timestamp: int) -> int:
     """Converts a timestamp in microseconds to a date in days"""
-    return (datetime.fromtimestamp(timestamp / 1_000_000) - EPOCH_TIMESTAMP).days
+    return timestamp // MICROS_PER_DAY
+
+
+def micros_to_hours(timestamp: int) -> int:
+    """Converts a timestamp in microseconds to hours from 1970-01-01T00:00"""
+    return timestamp // MICROS_PER_HOUR
+
+
+def days_to_year_month(days: int) -> Tuple[int, int]:
+    """Converts days from 1970-01-01 to the year and the month (1 to 12) of the date, in the proleptic Gregorian calendar"""
+    # shifts the epoch to 0000-03-01, so that leap days fall at the end of each 400-year era and 4-year cycle
+    shifted = days + 719468
+    era = shifted // 146097
+    day_of_era = shifted - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_from_march = (5 * day_of_year + 2) // 153
+    month = month_from_march + 3 - 12 * (month_from_march >= 10)
+    return year_of_era + era * 400 + (month <= 2), month
+
+
+def days_to_years(days: int) -> int:
+    """Converts days from 1970-01-01 to years from 1970"""
+    year, _ = days_to_year_month(days)
+    return year - EPOCH_YEAR
+
+
+def days_to_months(days: int) -> int:
+    """Converts days from 1970-01-01 to months from 1970-01"""
+    year, month = days_to_year_month(days)
+    return (year - EPOCH_YEAR) * 12 + month - 1
+
+
+def days_to_date(days: int) -> date:
+    """Converts days from 1970-01-01 to a date"""
+    return EPOCH_DATE + timedelta(days=days)
+
+
+def micros_to_time(micros: int) -> time:
+    """Converts microseconds from midnight to a time"""
+    return (EPOCH_TIMESTAMP + timedelta(microseconds=micros)).time()
+
+
+def micros_to_timestamp(timestamp: int) -> datetime:
+    """Converts microseconds from 1970-01-01T00:00:00.000000 to a timestamp without zone"""
+    return EPOCH_TIMESTAMP + timedelta(microseconds=timestamp)
+
+
+def micros_to_timestamptz(timestamp: int) -> datetime:
+    """Converts microseconds from 1970-01-01T00:00:00.000000+00:00 to a timestamp in UTC"""
+    return EPOCH_TIMESTAMPTZ + timedelta(microseconds=timestamp)
 
 
 def date_to_days(date_str: str) -> int:
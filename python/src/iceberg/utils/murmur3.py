@@ -0,0 +1,216 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Vectorized 32-bit Murmur3 hashing over numpy and pyarrow arrays
+
+The functions in this module produce the same hashes as `mmh3.hash` with a seed of 0, which the bucket transforms
+use for single values, but hash every value of an array in a fixed number of numpy operations. Values are read
+directly from the buffers of pyarrow arrays, so no Python object is created per value. The hashes of null slots are
+computed from whatever the buffers hold there, and callers are expected to mask them with the validity bitmap.
+
+Example:
+    >>> import pyarrow as pa
+    >>> hash_long_array(pa.array([34, None], type=pa.int64()))[:1]
+    array([2017239379], dtype=int32)
+    >>> hash_binary_array(pa.array(["iceberg"]))
+    array([1210000089], dtype=int32)
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from iceberg.utils.arrow import buffer_values, integer_values
+
+_C1 = np.uint32(0xCC9E2D51)
+_C2 = np.uint32(0x1B873593)
+_N = np.uint32(0xE6546B64)
+_F1 = np.uint32(0x85EBCA6B)
+_F2 = np.uint32(0xC2B2AE35)
+_FIVE = np.uint32(5)
+
+
+def _rotl(value: np.ndarray, bits: int) -> np.ndarray:
+    return (value << np.uint32(bits)) | (value >> np.uint32(32 - bits))
+
+
+def _mix_k(k: np.ndarray) -> np.ndarray:
+    k *= _C1
+    k = _rotl(k, 15)
+    k *= _C2
+    return k
+
+
+def _mix_h(h: np.ndarray, k: np.ndarray) -> np.ndarray:
+    h ^= k
+    h = _rotl(h, 13)
+    h *= _FIVE
+    h += _N
+    return h
+
+
+def _fmix(h: np.ndarray) -> np.ndarray:
+    h ^= h >> np.uint32(16)
+    h *= _F1
+    h ^= h >> np.uint32(13)
+    h *= _F2
+    h ^= h >> np.uint32(16)
+    return h
+
+
+def hash_longs(values: np.ndarray) -> np.ndarray:
+    """Hashes each value as 8 little-endian bytes, like `mmh3.hash(struct.pack("<q", value))`
+
+    Args:
+        values (np.ndarray): Integer values, which are widened to 64 bits
+
+    Returns:
+        np.ndarray: The int32 hash of every value
+    """
+    words = np.ascontiguousarray(values, dtype="<i8").view("<u4").reshape(-1, 2)
+    h = _mix_h(np.zeros(len(words), dtype=np.uint32), _mix_k(words[:, 0].astype(np.uint32)))
+    h = _mix_h(h, _mix_k(words[:, 1].astype(np.uint32)))
+    h ^= np.uint32(8)
+    return _fmix(h).view(np.int32)
+
+
+def _unaligned_words(data: np.ndarray) -> np.ndarray:
+    """Returns a view of `data` in which element p is the little-endian word that starts at byte p"""
+    return np.ndarray(shape=(len(data) - 3,), dtype="<u4", buffer=data, strides=(1,))
+
+
+def hash_bytes(data: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Hashes byte strings that are laid out in one buffer, like `mmh3.hash(data[start:start + length])`
+
+    The 4-byte blocks are hashed one block index at a time across every value that is long enough to have it, so
+    the number of numpy operations grows with the length of the longest value rather than with the number of values.
+
+    Args:
+        data (np.ndarray): A uint8 buffer that holds the values
+        starts (np.ndarray): The offset of each value in `data`
+        lengths (np.ndarray): The length of each value in bytes
+
+    Returns:
+        np.ndarray: The int32 hash of every value
+    """
+    count = len(starts)
+    if count == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    # pad so that the tail of the last value can be read as a whole word
+    data = np.concatenate([np.asarray(data, dtype=np.uint8), np.zeros(3, dtype=np.uint8)])
+    words = _unaligned_words(data)
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    blocks = lengths >> 2
+
+    # order the values by descending number of blocks, so that the values that have block i form a prefix
+    order = None
+    if blocks.min() != blocks.max():
+        order = np.argsort(-blocks, kind="stable")
+        starts, lengths, blocks = starts[order], lengths[order], blocks[order]
+    negated_blocks = -blocks
+
+    h = np.zeros(count, dtype=np.uint32)
+    for block in range(int(blocks.max())):
+        active = int(np.searchsorted(negated_blocks, -block, side="left"))
+        positions = starts[:active] + 4 * block
+        h[:active] = _mix_h(h[:active], _mix_k(words[positions]))
+
+    tails = lengths & 3
+    with_tail = np.flatnonzero(tails)
+    if len(with_tail) > 0:
+        positions = starts[with_tail] + (blocks[with_tail] << 2)
+        k = words[positions] & (np.uint32(0xFFFFFFFF) >> (np.uint32(32) - (tails[with_tail] << 3).astype(np.uint32)))
+        h[with_tail] ^= _mix_k(k)
+
+    h ^= lengths.astype(np.uint32)
+    h = _fmix(h)
+    if order is not None:
+        unordered = np.empty_like(h)
+        unordered[order] = h
+        h = unordered
+    return h.view(np.int32)
+
+
+def hash_long_array(values: pa.Array) -> np.ndarray:
+    """Hashes an array of integers, dates, times or timestamps as longs
+
+    Args:
+        values (pa.Array): An array with an integer storage type, such as int32, date32, time64 or timestamp
+
+    Returns:
+        np.ndarray: The int32 hash of every slot, including null slots
+
+    Raises:
+        ValueError: If the array is not stored as integers
+    """
+    return hash_longs(integer_values(values))
+
+
+def hash_binary_array(values: pa.Array) -> np.ndarray:
+    """Hashes an array of strings or bytes, either variable-length or fixed-size
+
+    Args:
+        values (pa.Array): A string, binary, large_string, large_binary or fixed_size_binary array
+
+    Returns:
+        np.ndarray: The int32 hash of every slot, including null slots
+
+    Raises:
+        ValueError: If the array does not hold strings or bytes
+    """
+    data_type = values.type
+    if pa.types.is_fixed_size_binary(data_type):
+        width = data_type.byte_width
+        starts = (np.arange(len(values), dtype=np.int64) + values.offset) * width
+        return hash_bytes(buffer_values(values.buffers()[1], "u1"), starts, np.full(len(values), width, dtype=np.int64))
+    elif pa.types.is_string(data_type) or pa.types.is_binary(data_type):
+        offset_type = "<i4"
+    elif pa.types.is_large_string(data_type) or pa.types.is_large_binary(data_type):
+        offset_type = "<i8"
+    else:
+        raise ValueError(f"Cannot hash array of type {data_type} as bytes")
+
+    offsets = buffer_values(values.buffers()[1], offset_type)[values.offset : values.offset + len(values) + 1].astype(np.int64)
+    return hash_bytes(buffer_values(values.buffers()[2], "u1"), offsets[:-1], np.diff(offsets))
+
+
+def hash_decimal_array(values: pa.Array) -> np.ndarray:
+    """Hashes an array of decimals by the minimal two's-complement big-endian bytes of their unscaled values
+
+    Args:
+        values (pa.Array): A decimal128 or decimal256 array
+
+    Returns:
+        np.ndarray: The int32 hash of every slot, including null slots
+
+    Raises:
+        ValueError: If the array does not hold decimals
+    """
+    data_type = values.type
+    if not pa.types.is_decimal(data_type):
+        raise ValueError(f"Cannot hash array of type {data_type} as decimals")
+    width = data_type.byte_width
+    storage = buffer_values(values.buffers()[1], "u1")[values.offset * width : (values.offset + len(values)) * width]
+    big_endian = np.ascontiguousarray(storage.reshape(-1, width)[:, ::-1])
+
+    # a leading byte is redundant when it only repeats the sign, which the byte after it already carries
+    sign = np.where(big_endian[:, :1] >= 0x80, 0xFF, 0x00).astype(np.uint8)
+    redundant = (big_endian[:, :-1] == sign) & ((big_endian[:, 1:] & 0x80) == (sign & 0x80))
+    skipped = np.cumprod(redundant, axis=1).sum(axis=1)
+
+    starts = np.arange(len(values), dtype=np.int64) * width + skipped
+    return hash_bytes(big_endian.ravel(), starts, width - skipped)
@@ -0,0 +1,167 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import gc
+import math
+import struct
+import weakref
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    Not,
+    Operation,
+    Or,
+    UnboundPredicate,
+    UnboundReference,
+)
+from iceberg.expressions.evaluator import Evaluator, compile_expression
+from iceberg.expressions.literals import literal
+from iceberg.schema import Schema
+from iceberg.types import (
+    BooleanType,
+    DecimalType,
+    DoubleType,
+    FloatType,
+    IntegerType,
+    NestedField,
+    StringType,
+    StructType,
+)
+
+SCHEMA = Schema(
+    NestedField(1, "id", IntegerType(), is_optional=False),
+    NestedField(2, "data", StringType()),
+    NestedField(3, "location", StructType(NestedField(4, "lat", DoubleType()), NestedField(5, "alt", FloatType()))),
+    schema_id=1,
+)
+
+
+class Row:
+    def __init__(self, *values: Any):
+        self.values = values
+
+    def get(self, pos: int) -> Any:
+        return self.values[pos]
+
+
+def predicate(op: Operation, name: str, *values: Any) -> UnboundPredicate:
+    return UnboundPredicate(op, UnboundReference(name), [literal(value) for value in values])
+
+
+# float values are read from 32-bit storage
+ALT = struct.unpack("<f", struct.pack("<f", 10.1))[0]
+
+ROWS = [
+    Row(1, "a", Row(1.5, ALT)),
+    Row(5, None, Row(math.nan, None)),
+    Row(7, "c", Row(None, 0.0)),
+    Row(9, "d", None),
+]
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        (AlwaysTrue(), [True, True, True, True]),
+        (AlwaysFalse(), [False, False, False, False]),
+        (predicate(Operation.LT, "id", 5), [True, False, False, False]),
+        (predicate(Operation.LT_EQ, "id", 5), [True, True, False, False]),
+        (predicate(Operation.GT, "id", 5), [False, False, True, True]),
+        (predicate(Operation.GT_EQ, "id", 5), [False, True, True, True]),
+        (predicate(Operation.EQ, "id", 5), [False, True, False, False]),
+        (predicate(Operation.NOT_EQ, "id", 5), [True, False, True, True]),
+        (predicate(Operation.IN, "id", 1, 7, 8), [True, False, True, False]),
+        (predicate(Operation.NOT_IN, "id", 1, 7, 8), [False, True, False, True]),
+        # comparisons and IN are false for nulls, and their negations are true
+        (predicate(Operation.LT, "data", "b"), [True, False, False, False]),
+        (predicate(Operation.GT_EQ, "data", "b"), [False, False, True, True]),
+        (predicate(Operation.EQ, "data", "a"), [True, False, False, False]),
+        (predicate(Operation.NOT_EQ, "data", "a"), [False, True, True, True]),
+        (predicate(Operation.IN, "data", "a", "c"), [True, False, True, False]),
+        (predicate(Operation.NOT_IN, "data", "a", "c"), [False, True, False, True]),
+        (predicate(Operation.IS_NULL, "data"), [False, True, False, False]),
+        (predicate(Operation.NOT_NULL, "data"), [True, False, True, True]),
+        # nested fields, NaN and 32-bit floats, with fields of a null struct read as null
+        (predicate(Operation.IS_NAN, "location.lat"), [False, True, False, False]),
+        (predicate(Operation.NOT_NAN, "location.lat"), [True, False, True, True]),
+        (predicate(Operation.GT, "location.lat", 1.0), [True, False, False, False]),
+        (predicate(Operation.EQ, "location.alt", 10.1), [True, False, False, False]),
+        (predicate(Operation.IN, "location.alt", 10.1, 0.0), [True, False, True, False]),
+        # short-circuiting connectives
+        (And(predicate(Operation.GT, "id", 1), predicate(Operation.NOT_NULL, "data")), [False, False, True, True]),
+        (Or(predicate(Operation.EQ, "id", 1), predicate(Operation.IS_NULL, "data")), [True, True, False, False]),
+        (Not(Or(predicate(Operation.EQ, "id", 1), predicate(Operation.IS_NULL, "data"))), [False, False, True, True]),
+        (And(predicate(Operation.GT, "id", 1), Not(predicate(Operation.EQ, "id", 7))), [False, True, False, True]),
+    ],
+)
+def test_evaluator(expr, expected):
+    evaluator = Evaluator(SCHEMA, expr)
+    assert [evaluator.eval(row) for row in ROWS] == expected
+
+
+def test_evaluator_is_cached_per_expression_and_schema():
+    first = Evaluator(SCHEMA, And(predicate(Operation.GT, "id", 1), predicate(Operation.EQ, "data", "a")))
+    second = Evaluator(SCHEMA, And(predicate(Operation.GT, "id", 1), predicate(Operation.EQ, "data", "a")))
+    assert first.eval is second.eval
+
+    other_schema = Schema(NestedField(2, "data", StringType()), NestedField(1, "id", IntegerType()), schema_id=2)
+    other = Evaluator(other_schema, And(predicate(Operation.GT, "id", 1), predicate(Operation.EQ, "data", "a")))
+    assert other.eval is not first.eval
+    assert other.eval(Row("a", 2)) is True
+
+
+def test_evaluator_cache_tells_literal_types_apart():
+    schema = Schema(NestedField(1, "d", DecimalType(9, 2)), NestedField(2, "b", BooleanType()), schema_id=1)
+    assert Evaluator(schema, predicate(Operation.EQ, "d", Decimal("1.00"))).eval(Row(Decimal("1.00"), True)) is True
+    with pytest.raises(ValueError) as exc_info:
+        Evaluator(schema, predicate(Operation.EQ, "d", Decimal("1.0")))
+    assert "Invalid value for conversion to type decimal(9, 2)" in str(exc_info.value)
+
+    assert Evaluator(schema, predicate(Operation.EQ, "b", True)).eval(Row(None, True)) is True
+    with pytest.raises(ValueError):
+        Evaluator(schema, predicate(Operation.EQ, "b", 1))
+
+
+def test_evaluator_cache_does_not_keep_schemas_alive():
+    schema = Schema(NestedField(1, "id", IntegerType()), schema_id=1)
+    Evaluator(schema, predicate(Operation.EQ, "id", 1))
+    schema_ref = weakref.ref(schema)
+    del schema
+    gc.collect()
+    assert schema_ref() is None
+
+
+def test_case_insensitive_evaluator():
+    evaluator = Evaluator(SCHEMA, predicate(Operation.EQ, "DATA", "a"), case_sensitive=False)
+    assert evaluator.eval(ROWS[0]) is True
+
+
+def test_compile_unbound_expression():
+    with pytest.raises(ValueError) as exc_info:
+        compile_expression(predicate(Operation.EQ, "id", 1))
+    assert "Cannot compile an expression that is not bound: id == 1" in str(exc_info.value)
+
+
+def test_evaluator_out_of_range_comparison_is_false_for_null():
+    schema = Schema(NestedField(1, "id", IntegerType()), schema_id=1)
+    evaluator = Evaluator(schema, predicate(Operation.LT, "id", 2**40))
+    assert [evaluator.eval(Row(value)) for value in (5, None)] == [True, False]
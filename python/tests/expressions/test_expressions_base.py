@@ -21,7 +21,16 @@ from decimal import Decimal
 import pytest
 
 from iceberg.expressions import base
-from iceberg.types import NestedField, Singleton, StringType
+from iceberg.expressions.literals import literal
+from iceberg.schema import Schema
+from iceberg.types import (
+    DateType,
+    DecimalType,
+    FloatType,
+    NestedField,
+    Singleton,
+    StringType,
+)
 
 
 @pytest.mark.parametrize(
@@ -257,3 +266,183 @@ def test_bound_reference(table_schema_simple, foo_struct):
     assert bound_ref1.eval(foo_struct) == "foovalue"
     assert bound_ref2.eval(foo_struct) == 123
     assert bound_ref3.eval(foo_struct) == True
+
+
+def test_bound_reference_eval_many(table_schema_simple):
+    """Test evaluating a BoundReference on many objects that abide by the StructProtocol"""
+
+    class Row:
+        def __init__(self, value):
+            self.value = value
+
+        def get(self, pos):
+            return self.value if pos == 1 else None
+
+    structs = [Row(value) for value in range(3)]
+
+    bound_ref = base.BoundReference(field=table_schema_simple.find_field(2), accessor=base.Accessor(position=1))
+    assert bound_ref.eval_many(structs) == [0, 1, 2]
+
+
+def test_predicates(table_schema_simple):
+    """Test the operations, literals, negation and strings of predicates"""
+    foo = base.UnboundReference("foo")
+    predicate = base.UnboundPredicate(base.Operation.LT, foo, [literal("a")])
+    assert predicate.op == base.Operation.LT
+    assert predicate.term == base.UnboundReference("foo")
+    assert predicate.literal == literal("a")
+    assert str(predicate) == "foo < a"
+    assert repr(predicate) == "UnboundPredicate(Operation.LT, UnboundReference(name='foo'), [StringLiteral(a)])"
+    assert ~predicate == base.UnboundPredicate(base.Operation.GT_EQ, foo, [literal("a")])
+    assert predicate != base.UnboundPredicate(base.Operation.LT, foo, [literal("b")])
+
+    in_predicate = base.UnboundPredicate(base.Operation.IN, foo, [literal("a"), literal("b")])
+    assert str(in_predicate) == "foo in (a, b)"
+    assert str(~in_predicate) == "foo not in (a, b)"
+    assert str(base.UnboundPredicate(base.Operation.IS_NULL, foo)) == "is_null(foo)"
+
+    bound = base.BoundPredicate(base.Operation.NOT_NULL, foo.bind(table_schema_simple, case_sensitive=True))
+    assert str(bound) == "not_null(foo)"
+    assert ~bound == base.BoundPredicate(base.Operation.IS_NULL, foo.bind(table_schema_simple, case_sensitive=True))
+    assert bound != base.UnboundPredicate(base.Operation.NOT_NULL, foo)
+
+
+@pytest.mark.parametrize(
+    "op,num_literals",
+    [
+        (base.Operation.IS_NULL, 1),
+        (base.Operation.EQ, 0),
+        (base.Operation.LT, 2),
+        (base.Operation.IN, 0),
+        (base.Operation.AND, 0),
+    ],
+)
+def test_invalid_predicates(op, num_literals):
+    with pytest.raises(ValueError):
+        base.UnboundPredicate(op, base.UnboundReference("foo"), [literal(i) for i in range(num_literals)])
+
+
+def test_literal_of_non_comparison():
+    with pytest.raises(ValueError) as exc_info:
+        base.UnboundPredicate(base.Operation.IS_NULL, base.UnboundReference("foo")).literal
+    assert "does not have a single literal" in str(exc_info.value)
+
+
+def test_expressions_are_hashable(table_schema_simple):
+    ref = base.UnboundReference("foo")
+    lt = base.UnboundPredicate(base.Operation.LT, ref, [literal("a")])
+    expressions = {
+        base.And(lt, base.Not(lt)): 1,
+        base.Or(lt, base.UnboundPredicate(base.Operation.IS_NULL, ref)): 2,
+        base.UnboundPredicate(base.Operation.IN, ref, [literal("a"), literal("b")]): 3,
+        base.BoundPredicate(base.Operation.EQ, ref.bind(table_schema_simple, True), [literal("a")]): 4,
+    }
+    assert (
+        expressions[
+            base.And(base.UnboundPredicate(base.Operation.LT, base.UnboundReference("foo"), [literal("a")]), base.Not(lt))
+        ]
+        == 1
+    )
+    assert expressions[base.Or(lt, base.UnboundPredicate(base.Operation.IS_NULL, base.UnboundReference("foo")))] == 2
+    assert expressions[base.UnboundPredicate(base.Operation.IN, ref, [literal("a"), literal("b")])] == 3
+    assert expressions[base.BoundPredicate(base.Operation.EQ, ref.bind(table_schema_simple, True), [literal("a")])] == 4
+    assert hash(literal(1.5).to(FloatType())) == hash(literal(1.5).to(FloatType()))
+
+
+@pytest.mark.parametrize(
+    "unbound,expected",
+    [
+        # literals are converted to the type of the field
+        (base.UnboundPredicate(base.Operation.LT, base.UnboundReference("bar"), [literal(10)]), "bar < 10"),
+        # IN with a single distinct literal is a comparison
+        (base.UnboundPredicate(base.Operation.IN, base.UnboundReference("bar"), [literal(3), literal(3)]), "bar == 3"),
+        (base.UnboundPredicate(base.Operation.NOT_IN, base.UnboundReference("bar"), [literal(3)]), "bar != 3"),
+        (
+            base.UnboundPredicate(base.Operation.IN, base.UnboundReference("bar"), [literal(3), literal(2**40), literal(4)]),
+            "bar in (3, 4)",
+        ),
+        # literals out of the range of the type decide the predicate, except that comparisons are false for null
+        (base.UnboundPredicate(base.Operation.LT, base.UnboundReference("bar"), [literal(2**40)]), "not_null(bar)"),
+        (base.UnboundPredicate(base.Operation.GT_EQ, base.UnboundReference("bar"), [literal(2**40)]), "false"),
+        (base.UnboundPredicate(base.Operation.GT, base.UnboundReference("bar"), [literal(-(2**40))]), "not_null(bar)"),
+        (base.UnboundPredicate(base.Operation.NOT_EQ, base.UnboundReference("bar"), [literal(2**40)]), "true"),
+        (base.UnboundPredicate(base.Operation.EQ, base.UnboundReference("bar"), [literal(-(2**40))]), "false"),
+        (base.UnboundPredicate(base.Operation.IN, base.UnboundReference("bar"), [literal(2**40)]), "false"),
+        (base.UnboundPredicate(base.Operation.NOT_IN, base.UnboundReference("bar"), [literal(2**40)]), "true"),
+        # null checks of required fields are decided by the schema
+        (base.UnboundPredicate(base.Operation.IS_NULL, base.UnboundReference("foo")), "false"),
+        (base.UnboundPredicate(base.Operation.NOT_NULL, base.UnboundReference("foo")), "true"),
+        (base.UnboundPredicate(base.Operation.IS_NULL, base.UnboundReference("bar")), "is_null(bar)"),
+    ],
+)
+def test_bind_predicate(table_schema_simple, unbound, expected):
+    bound = unbound.bind(table_schema_simple)
+    assert str(bound) == expected
+    if isinstance(bound, base.BoundPredicate):
+        assert bound.term == base.UnboundReference("bar").bind(table_schema_simple, True)
+        assert all(type(lit).__name__ == "LongLiteral" for lit in bound.literals)
+
+
+@pytest.mark.parametrize(
+    "op,value,expected",
+    [
+        (base.Operation.LT, 1e300, "(not_null(x) and not_nan(x))"),
+        (base.Operation.GT_EQ, -1e300, "(not_null(x) and not_nan(x))"),
+        (base.Operation.GT, 1e300, "false"),
+    ],
+)
+def test_bind_out_of_range_float_comparison(op, value, expected):
+    schema = Schema(NestedField(1, "x", FloatType()), NestedField(2, "y", FloatType(), is_optional=False), schema_id=1)
+    assert str(base.UnboundPredicate(op, base.UnboundReference("x"), [literal(value)]).bind(schema)) == expected
+    assert str(base.UnboundPredicate(op, base.UnboundReference("y"), [literal(value)]).bind(schema)) == expected.replace(
+        "(not_null(x) and not_nan(x))", "not_nan(y)"
+    )
+
+
+def test_bind_converts_literals():
+    schema = Schema(NestedField(1, "d", DateType()), NestedField(2, "price", DecimalType(9, 2)), schema_id=1)
+    bound = base.UnboundPredicate(base.Operation.EQ, base.UnboundReference("d"), [literal("2017-11-16")]).bind(schema)
+    assert bound.literal == literal(17486) and type(bound.literal).__name__ == "DateLiteral"
+    bound = base.UnboundPredicate(base.Operation.GT, base.UnboundReference("price"), [literal(Decimal("1.25"))]).bind(schema)
+    assert bound.literal.value == Decimal("1.25")
+
+
+@pytest.mark.parametrize(
+    "unbound,message",
+    [
+        (
+            base.UnboundPredicate(base.Operation.EQ, base.UnboundReference("bar"), [literal("abc")]),
+            "Invalid value for conversion to type int: abc (StringLiteral)",
+        ),
+        (
+            base.UnboundPredicate(base.Operation.IS_NAN, base.UnboundReference("bar")),
+            "Operation.IS_NAN cannot be used with a non-floating-point column",
+        ),
+        (base.UnboundPredicate(base.Operation.EQ, base.UnboundReference("missing"), [literal(1)]), "Cannot find field 'missing'"),
+    ],
+)
+def test_bind_invalid_predicate(table_schema_simple, unbound, message):
+    with pytest.raises(ValueError) as exc_info:
+        unbound.bind(table_schema_simple)
+    assert message in str(exc_info.value)
+
+
+def test_bind_expression(table_schema_simple):
+    ref = base.UnboundReference("bar")
+    expr = base.And(
+        base.Not(base.UnboundPredicate(base.Operation.EQ, ref, [literal(1)])),
+        base.Or(
+            base.UnboundPredicate(base.Operation.IS_NULL, base.UnboundReference("foo")),
+            base.UnboundPredicate(base.Operation.GT, ref, [literal(5)]),
+        ),
+    )
+    bound_ref = ref.bind(table_schema_simple, True)
+    assert base.bind(table_schema_simple, expr) == base.And(
+        base.Not(base.BoundPredicate(base.Operation.EQ, bound_ref, [literal(1)])),
+        base.BoundPredicate(base.Operation.GT, bound_ref, [literal(5)]),
+    )
+    assert base.bind(table_schema_simple, base.AlwaysTrue()) == base.AlwaysTrue()
+
+    with pytest.raises(ValueError) as exc_info:
+        base.bind(table_schema_simple, base.BoundPredicate(base.Operation.IS_NULL, bound_ref))
+    assert "Found already bound predicate: is_null(bar)" in str(exc_info.value)
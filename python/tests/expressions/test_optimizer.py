@@ -0,0 +1,182 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import itertools
+import math
+import random
+from typing import Any
+
+import pytest
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BooleanExpression,
+    BoundPredicate,
+    Not,
+    Operation,
+    Or,
+    UnboundPredicate,
+    UnboundReference,
+    bind,
+)
+from iceberg.expressions.evaluator import compile_expression
+from iceberg.expressions.literals import literal
+from iceberg.expressions.optimizer import optimize, rewrite_not
+from iceberg.schema import Schema
+from iceberg.types import DoubleType, IntegerType, NestedField
+
+SCHEMA = Schema(
+    NestedField(1, "a", IntegerType()),
+    NestedField(2, "b", IntegerType(), is_optional=False),
+    NestedField(3, "x", DoubleType()),
+    schema_id=1,
+)
+DOMAINS = {"a": [None, 0, 1, 2, 3], "b": [0, 1, 2, 3], "x": [None, math.nan, 0.0, 1.0, 2.0, 3.0]}
+COMPARISONS = [Operation.LT, Operation.LT_EQ, Operation.GT, Operation.GT_EQ, Operation.EQ, Operation.NOT_EQ]
+
+
+class Row:
+    def __init__(self, *values: Any):
+        self.values = values
+
+    def get(self, pos: int) -> Any:
+        return self.values[pos]
+
+
+ROWS = [Row(*values) for values in itertools.product(*DOMAINS.values())]
+
+
+def predicate(op: Operation, name: str, *values: Any) -> BooleanExpression:
+    return bind(SCHEMA, UnboundPredicate(op, UnboundReference(name), [literal(value) for value in values]))
+
+
+def random_predicate(rng: random.Random) -> BooleanExpression:
+    name = rng.choice(list(DOMAINS))
+    values = [value for value in DOMAINS[name] if value is not None and value == value]
+    kind = rng.random()
+    if kind < 0.1:
+        return predicate(rng.choice([Operation.IS_NULL, Operation.NOT_NULL]), name)
+    elif kind < 0.15 and name == "x":
+        return predicate(rng.choice([Operation.IS_NAN, Operation.NOT_NAN]), name)
+    elif kind < 0.35:
+        return predicate(rng.choice([Operation.IN, Operation.NOT_IN]), name, *rng.sample(values, rng.randint(2, 3)))
+    return predicate(rng.choice(COMPARISONS), name, rng.choice(values))
+
+
+def random_expression(rng: random.Random, depth: int) -> BooleanExpression:
+    kind = rng.random()
+    if depth == 0 or kind < 0.3:
+        return random_predicate(rng)
+    elif kind < 0.45:
+        return Not(random_expression(rng, depth - 1))
+    elif kind < 0.75:
+        return And(random_expression(rng, depth - 1), random_expression(rng, depth - 1))
+    return Or(random_expression(rng, depth - 1), random_expression(rng, depth - 1))
+
+
+def predicates_of(expr: BooleanExpression) -> int:
+    if isinstance(expr, (And, Or)):
+        return predicates_of(expr.left) + predicates_of(expr.right)
+    elif isinstance(expr, Not):
+        return predicates_of(expr.child)
+    return 1 if isinstance(expr, BoundPredicate) else 0
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_optimized_expressions_are_equivalent(seed):
+    rng = random.Random(seed)
+    for _ in range(25):
+        expr = random_expression(rng, depth=4)
+        optimized = optimize(expr)
+        evaluate, evaluate_optimized = compile_expression(expr), compile_expression(optimized)
+        assert [evaluate(row) for row in ROWS] == [evaluate_optimized(row) for row in ROWS], (str(expr), str(optimized))
+
+
+def test_rewrite_not():
+    lt_b = predicate(Operation.LT, "b", 5)
+    eq_a = predicate(Operation.EQ, "a", 7)
+    # the negation of a comparison of a required field needs no null check
+    assert rewrite_not(Not(And(lt_b, Not(eq_a)))) == Or(predicate(Operation.GT_EQ, "b", 5), eq_a)
+    assert rewrite_not(Not(Or(lt_b, eq_a))) == And(predicate(Operation.GT_EQ, "b", 5), predicate(Operation.NOT_EQ, "a", 7))
+    assert rewrite_not(Not(predicate(Operation.LT, "a", 5))) == Or(
+        predicate(Operation.GT_EQ, "a", 5), predicate(Operation.IS_NULL, "a")
+    )
+    assert rewrite_not(Not(Not(eq_a))) == eq_a
+    assert rewrite_not(Not(AlwaysTrue())) == AlwaysFalse()
+
+    unbound = UnboundPredicate(Operation.LT, UnboundReference("a"), [literal(5)])
+    assert rewrite_not(Not(unbound)) == Not(unbound)
+    assert rewrite_not(Not(UnboundPredicate(Operation.IN, UnboundReference("a"), [literal(1), literal(2)]))) == UnboundPredicate(
+        Operation.NOT_IN, UnboundReference("a"), [literal(1), literal(2)]
+    )
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        # equality disjunctions are merged into IN
+        (
+            Or(predicate(Operation.EQ, "a", 1), Or(predicate(Operation.EQ, "a", 2), predicate(Operation.IN, "a", 2, 3))),
+            "a in (1, 2, 3)",
+        ),
+        # duplicates are dropped
+        (And(predicate(Operation.LT, "a", 1), predicate(Operation.LT, "a", 1)), "a < 1"),
+        # ranges are intersected
+        (
+            And(predicate(Operation.GT, "a", 1), And(predicate(Operation.GT_EQ, "a", 2), predicate(Operation.LT, "a", 5))),
+            "(a >= 2 and a < 5)",
+        ),
+        (And(predicate(Operation.GT_EQ, "a", 2), predicate(Operation.LT_EQ, "a", 2)), "a == 2"),
+        (And(predicate(Operation.IN, "a", 1, 2, 3), predicate(Operation.GT, "a", 1)), "a in (2, 3)"),
+        (And(predicate(Operation.NOT_EQ, "a", 1), predicate(Operation.NOT_EQ, "a", 2)), "a not in (1, 2)"),
+        (And(predicate(Operation.NOT_EQ, "a", 1), predicate(Operation.GT, "a", 3)), "a > 3"),
+        # contradictions and tautologies
+        (And(predicate(Operation.EQ, "a", 1), predicate(Operation.EQ, "a", 2)), "false"),
+        (And(predicate(Operation.GT, "a", 3), predicate(Operation.LT, "a", 2)), "false"),
+        (And(predicate(Operation.IS_NULL, "a"), predicate(Operation.GT, "a", 3)), "false"),
+        (And(predicate(Operation.IS_NULL, "a"), predicate(Operation.NOT_EQ, "a", 3)), "is_null(a)"),
+        (Or(predicate(Operation.EQ, "a", 1), predicate(Operation.NOT_EQ, "a", 1)), "true"),
+        (Or(predicate(Operation.IS_NULL, "a"), predicate(Operation.NOT_NULL, "a")), "true"),
+        (Or(predicate(Operation.LT, "a", 1), predicate(Operation.LT_EQ, "a", 4)), "a <= 4"),
+        (Or(predicate(Operation.EQ, "a", 1), predicate(Operation.LT, "a", 4)), "a < 4"),
+        (Or(predicate(Operation.NOT_IN, "a", 1, 2), predicate(Operation.EQ, "a", 1)), "a != 2"),
+        # double negations and negations of conjunctions
+        (Not(Not(And(predicate(Operation.EQ, "b", 1), predicate(Operation.EQ, "b", 1)))), "b == 1"),
+        (Not(Or(predicate(Operation.EQ, "b", 1), predicate(Operation.EQ, "b", 2))), "b not in (1, 2)"),
+        # predicates on other references are kept in order
+        (
+            And(predicate(Operation.LT, "a", 3), And(predicate(Operation.EQ, "b", 1), predicate(Operation.LT, "a", 2))),
+            "(a < 2 and b == 1)",
+        ),
+    ],
+)
+def test_optimize(expr, expected):
+    assert str(optimize(expr)) == expected
+
+
+def test_optimize_makes_expressions_smaller():
+    rng = random.Random(7)
+    expressions = [random_expression(rng, depth=5) for _ in range(200)]
+    original = sum(predicates_of(rewrite_not(expr)) for expr in expressions)
+    optimized = sum(predicates_of(optimize(expr)) for expr in expressions)
+    assert optimized < original
+
+
+def test_optimize_unbound_expression():
+    eq = UnboundPredicate(Operation.EQ, UnboundReference("a"), [literal(1)])
+    assert optimize(And(eq, Or(eq, eq))) == eq
@@ -0,0 +1,213 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import itertools
+import operator
+from decimal import Decimal
+
+import pytest
+
+from iceberg import transforms
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BoundPredicate,
+    Not,
+    Operation,
+    Or,
+    UnboundPredicate,
+    UnboundReference,
+)
+from iceberg.expressions.literals import literal
+from iceberg.expressions.projections import (
+    inclusive_projection,
+    rewrite_not,
+    strict_projection,
+)
+from iceberg.schema import Schema
+from iceberg.table.partitioning import PartitionField, PartitionSpec
+from iceberg.types import (
+    DateType,
+    DecimalType,
+    IntegerType,
+    LongType,
+    NestedField,
+    StringType,
+    TimestampType,
+)
+from iceberg.utils.datetime import date_to_days, timestamp_to_micros
+
+COMPARISONS = {
+    Operation.LT: operator.lt,
+    Operation.LT_EQ: operator.le,
+    Operation.GT: operator.gt,
+    Operation.GT_EQ: operator.ge,
+    Operation.EQ: operator.eq,
+    Operation.NOT_EQ: operator.ne,
+}
+
+
+def matches(op, value, literal_values) -> bool:
+    """Evaluates a predicate on a single value, where comparisons with null are false"""
+    if op == Operation.IS_NULL:
+        return value is None
+    elif op == Operation.NOT_NULL:
+        return value is not None
+    elif value is None:
+        return False
+    elif op == Operation.IN:
+        return value in literal_values
+    elif op == Operation.NOT_IN:
+        return value not in literal_values
+    return COMPARISONS[op](value, literal_values[0])
+
+
+def predicates(field_type, boundaries):
+    ref = UnboundReference("col").bind(Schema(NestedField(1, "col", field_type), schema_id=1), case_sensitive=True)
+    yield BoundPredicate(Operation.IS_NULL, ref)
+    yield BoundPredicate(Operation.NOT_NULL, ref)
+    for op, boundary in itertools.product(COMPARISONS, boundaries):
+        yield BoundPredicate(op, ref, [literal(boundary)])
+    for op, pair in itertools.product([Operation.IN, Operation.NOT_IN], itertools.combinations(boundaries[::3], 2)):
+        yield BoundPredicate(op, ref, [literal(value) for value in pair])
+
+
+DAY = 86_400_000_000
+TIMESTAMPS = [
+    timestamp_to_micros(ts) + offset
+    for ts in ["1969-12-31T23:00:00", "1970-01-01T00:00:00", "1970-01-01T01:00:00", "2017-12-01T00:00:00", "2018-01-01T00:00:00"]
+    for offset in [-DAY, -1, 0, 1, DAY]
+]
+DATES = [date_to_days(d) + offset for d in ["1969-12-01", "1970-01-01", "2017-12-31"] for offset in [-1, 0, 1, 31, 365]]
+
+
+@pytest.mark.parametrize(
+    "transform,field_type,values",
+    [
+        (transforms.identity(IntegerType()), IntegerType(), list(range(-3, 4))),
+        (transforms.bucket(IntegerType(), 4), IntegerType(), list(range(-12, 13))),
+        (transforms.truncate(IntegerType(), 10), IntegerType(), list(range(-25, 26, 3))),
+        (transforms.truncate(LongType(), 7), LongType(), list(range(-15, 16, 2))),
+        (transforms.truncate(DecimalType(9, 2), 50), DecimalType(9, 2), [Decimal(i).scaleb(-2) for i in range(-120, 121, 13)]),
+        (transforms.truncate(StringType(), 2), StringType(), ["", "a", "ab", "abc", "abd", "ac", "b", "ba", "bab"]),
+        (transforms.bucket(StringType(), 3), StringType(), ["", "a", "ab", "abc", "b", "ba"]),
+        (transforms.year(DateType()), DateType(), DATES),
+        (transforms.month(DateType()), DateType(), DATES),
+        (transforms.day(DateType()), DateType(), DATES),
+        (transforms.year(TimestampType()), TimestampType(), TIMESTAMPS),
+        (transforms.month(TimestampType()), TimestampType(), TIMESTAMPS),
+        (transforms.day(TimestampType()), TimestampType(), TIMESTAMPS),
+        (transforms.hour(TimestampType()), TimestampType(), TIMESTAMPS),
+        (transforms.always_null(), IntegerType(), list(range(-3, 4))),
+    ],
+)
+def test_projections_are_sound(transform, field_type, values):
+    """Test that inclusive projections keep every matching row and that strict projections keep only matching rows"""
+    for predicate in predicates(field_type, values):
+        literal_values = [lit.value for lit in predicate.literals]
+        inclusive = transform.project("part", predicate)
+        strict = transform.project_strict("part", predicate)
+        for value in values + [None]:
+            partition = transform.apply(value)
+            row_matches = matches(predicate.op, value, literal_values)
+            if inclusive is not None and row_matches:
+                assert matches(inclusive.op, partition, [lit.value for lit in inclusive.literals]), (predicate, value)
+            if strict is not None and matches(strict.op, partition, [lit.value for lit in strict.literals]):
+                assert row_matches, (predicate, value)
+
+
+def test_projections_are_not_trivial():
+    ref = UnboundReference("col").bind(Schema(NestedField(1, "col", TimestampType()), schema_id=1), case_sensitive=True)
+    boundary = timestamp_to_micros("2017-12-01T10:00:00")
+    day_transform = transforms.day(TimestampType())
+    assert day_transform.project("ts_day", BoundPredicate(Operation.LT, ref, [literal(boundary)])) == UnboundPredicate(
+        Operation.LT_EQ, UnboundReference("ts_day"), [literal(17501)]
+    )
+    assert day_transform.project_strict("ts_day", BoundPredicate(Operation.LT, ref, [literal(boundary)])) == UnboundPredicate(
+        Operation.LT, UnboundReference("ts_day"), [literal(17501)]
+    )
+    assert day_transform.project("ts_day", BoundPredicate(Operation.NOT_EQ, ref, [literal(boundary)])) is None
+    assert day_transform.project_strict("ts_day", BoundPredicate(Operation.EQ, ref, [literal(boundary)])) is None
+
+    string_ref = UnboundReference("col").bind(Schema(NestedField(1, "col", StringType()), schema_id=1), case_sensitive=True)
+    truncate_transform = transforms.truncate(StringType(), 3)
+    assert truncate_transform.project(
+        "prefix", BoundPredicate(Operation.GT, string_ref, [literal("iceberg")])
+    ) == UnboundPredicate(Operation.GT_EQ, UnboundReference("prefix"), [literal("ice")])
+    bucket_transform = transforms.bucket(StringType(), 100)
+    assert bucket_transform.project("b", BoundPredicate(Operation.IN, string_ref, [literal("iceberg"), literal("a")])) == (
+        UnboundPredicate(Operation.IN, UnboundReference("b"), [literal(89), literal(bucket_transform.apply("a"))])
+    )
+    assert bucket_transform.project("b", BoundPredicate(Operation.LT, string_ref, [literal("iceberg")])) is None
+
+
+SCHEMA = Schema(NestedField(1, "id", LongType()), NestedField(2, "ts", TimestampType()), schema_id=1)
+SPEC = PartitionSpec(
+    SCHEMA,
+    0,
+    [
+        PartitionField(2, 1000, transforms.day(TimestampType()), "ts_day"),
+        PartitionField(2, 1001, transforms.hour(TimestampType()), "ts_hour"),
+        PartitionField(1, 1002, transforms.bucket(LongType(), 16), "id_bucket"),
+    ],
+    1002,
+)
+
+
+def bound(op, name, *values):
+    return BoundPredicate(op, UnboundReference(name).bind(SCHEMA, case_sensitive=True), [literal(value) for value in values])
+
+
+def unbound(op, name, *values):
+    return UnboundPredicate(op, UnboundReference(name), [literal(value) for value in values])
+
+
+def test_rewrite_not():
+    lt = bound(Operation.LT, "id", 5)
+    eq = bound(Operation.EQ, "id", 7)
+    # id is optional, so the negated range keeps the rows in which it is null
+    gt_eq = Or(bound(Operation.GT_EQ, "id", 5), bound(Operation.IS_NULL, "id"))
+    assert rewrite_not(Not(And(lt, Not(eq)))) == Or(gt_eq, eq)
+    assert rewrite_not(Not(Or(lt, eq))) == And(gt_eq, bound(Operation.NOT_EQ, "id", 7))
+    assert rewrite_not(Not(AlwaysTrue())) == AlwaysFalse()
+
+
+def test_inclusive_projection():
+    hour = 3_600_000_000
+    expr = And(bound(Operation.GT_EQ, "ts", 17501 * DAY + 2 * hour), Not(bound(Operation.NOT_EQ, "id", 1)))
+    assert inclusive_projection(SPEC, expr) == And(
+        And(unbound(Operation.GT_EQ, "ts_day", 17501), unbound(Operation.GT_EQ, "ts_hour", 17501 * 24 + 2)),
+        unbound(Operation.EQ, "id_bucket", 4),
+    )
+    # a predicate that no partition field can project selects every partition
+    assert inclusive_projection(SPEC, bound(Operation.LT, "id", 1)) == AlwaysTrue()
+    assert inclusive_projection(SPEC, Or(bound(Operation.LT, "id", 1), bound(Operation.EQ, "id", 1))) == AlwaysTrue()
+
+
+def test_strict_projection():
+    expr = Or(bound(Operation.LT, "ts", 17501 * DAY), bound(Operation.EQ, "id", 1))
+    assert strict_projection(SPEC, expr) == Or(
+        unbound(Operation.LT, "ts_day", 17501), unbound(Operation.LT, "ts_hour", 17501 * 24)
+    )
+    assert strict_projection(SPEC, bound(Operation.NOT_EQ, "id", 1)) == unbound(Operation.NOT_EQ, "id_bucket", 4)
+
+
+def test_project_unbound_expression():
+    with pytest.raises(ValueError) as exc_info:
+        inclusive_projection(SPEC, unbound(Operation.EQ, "id", 1))
+    assert "Cannot project an expression that is not bound: id == 1" in str(exc_info.value)
@@ -0,0 +1,183 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import random
+import uuid
+from decimal import Decimal
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from iceberg.expressions.base import (
+    AlwaysFalse,
+    AlwaysTrue,
+    And,
+    BoundPredicate,
+    Not,
+    Operation,
+    Or,
+    UnboundPredicate,
+    UnboundReference,
+)
+from iceberg.expressions.evaluator import Evaluator
+from iceberg.expressions.literals import literal
+from iceberg.expressions.pyarrow import ArrowEvaluator, expression_to_mask
+from iceberg.schema import Schema
+from iceberg.types import (
+    DateType,
+    DecimalType,
+    DoubleType,
+    FloatType,
+    IntegerType,
+    NestedField,
+    StringType,
+    StructType,
+    TimestampType,
+    UUIDType,
+)
+
+SCHEMA = Schema(
+    NestedField(1, "id", IntegerType(), is_optional=False),
+    NestedField(2, "data", StringType()),
+    NestedField(3, "d", DateType()),
+    NestedField(4, "ts", TimestampType()),
+    NestedField(5, "price", DecimalType(9, 2)),
+    NestedField(6, "uid", UUIDType()),
+    NestedField(7, "location", StructType(NestedField(8, "lat", DoubleType()), NestedField(9, "alt", FloatType()))),
+    schema_id=1,
+)
+UUIDS = [uuid.UUID(int=i) for i in range(3)]
+
+
+def make_batch(num_rows: int) -> pa.RecordBatch:
+    rng = random.Random(11)
+    return pa.RecordBatch.from_pydict(
+        {
+            "id": list(range(num_rows)),
+            "data": [rng.choice(["a", "b", "c", None]) for _ in range(num_rows)],
+            "d": [rng.choice([None, 17000 + rng.randint(0, 5)]) for _ in range(num_rows)],
+            "ts": [rng.choice([None, rng.randint(-3, 3) * 3_600_000_000]) for _ in range(num_rows)],
+            "price": [rng.choice([None, Decimal(rng.randint(-300, 300)).scaleb(-2)]) for _ in range(num_rows)],
+            "uid": [rng.choice([None, *[u.bytes for u in UUIDS]]) for _ in range(num_rows)],
+            "location": [
+                rng.choice([{"lat": rng.choice([None, float("nan"), -1.0, 0.0, 1.5]), "alt": rng.choice([None, 0.1, 2.0])}])
+                for _ in range(num_rows)
+            ],
+        },
+        schema=pa.schema(
+            [
+                ("id", pa.int32()),
+                ("data", pa.string()),
+                ("d", pa.date32()),
+                ("ts", pa.timestamp("us")),
+                ("price", pa.decimal128(9, 2)),
+                ("uid", pa.binary(16)),
+                ("location", pa.struct([("lat", pa.float64()), ("alt", pa.float32())])),
+            ]
+        ),
+    )
+
+
+class Row:
+    """A row of the batch with values in their internal representation, as the row evaluator reads them"""
+
+    def __init__(self, *values: Any):
+        self.values = values
+
+    def get(self, pos: int) -> Any:
+        return self.values[pos]
+
+
+def rows_of(batch: pa.RecordBatch) -> list:
+    columns = [
+        batch.column("id").to_pylist(),
+        batch.column("data").to_pylist(),
+        batch.column("d").cast(pa.int32()).to_pylist(),
+        batch.column("ts").cast(pa.int64()).to_pylist(),
+        batch.column("price").to_pylist(),
+        [None if value is None else uuid.UUID(bytes=value) for value in batch.column("uid").to_pylist()],
+        [Row(value["lat"], value["alt"]) for value in batch.column("location").to_pylist()],
+    ]
+    return [Row(*values) for values in zip(*columns)]
+
+
+def predicate(op: Operation, name: str, *values: Any) -> UnboundPredicate:
+    return UnboundPredicate(op, UnboundReference(name), [literal(value) for value in values])
+
+
+EXPRESSIONS = [
+    AlwaysTrue(),
+    AlwaysFalse(),
+    predicate(Operation.LT, "id", 10),
+    predicate(Operation.NOT_EQ, "id", 10),
+    predicate(Operation.IS_NULL, "id"),
+    predicate(Operation.GT_EQ, "data", "b"),
+    predicate(Operation.EQ, "data", "a"),
+    predicate(Operation.NOT_EQ, "data", "a"),
+    predicate(Operation.IN, "data", "a", "c"),
+    predicate(Operation.NOT_IN, "data", "a", "c"),
+    predicate(Operation.IS_NULL, "data"),
+    predicate(Operation.NOT_NULL, "data"),
+    predicate(Operation.LT_EQ, "d", "2016-07-20"),
+    predicate(Operation.IN, "d", "2016-07-18", "2016-07-21"),
+    predicate(Operation.GT, "ts", "1970-01-01T00:00:00"),
+    predicate(Operation.NOT_IN, "ts", "1970-01-01T00:00:00", "1970-01-01T01:00:00"),
+    predicate(Operation.LT, "price", Decimal("0.50")),
+    predicate(Operation.IN, "price", Decimal("0.50"), Decimal("-1.00")),
+    predicate(Operation.EQ, "uid", str(UUIDS[1])),
+    predicate(Operation.NOT_IN, "uid", str(UUIDS[0]), str(UUIDS[2])),
+    predicate(Operation.IS_NAN, "location.lat"),
+    predicate(Operation.NOT_NAN, "location.lat"),
+    predicate(Operation.GT, "location.lat", 0.0),
+    predicate(Operation.NOT_EQ, "location.lat", 0.0),
+    predicate(Operation.EQ, "location.alt", 0.1),
+    predicate(Operation.NOT_IN, "location.alt", 0.1),
+    And(
+        predicate(Operation.NOT_NULL, "data"),
+        Or(predicate(Operation.LT, "d", "2016-07-19"), predicate(Operation.IS_NAN, "location.lat")),
+    ),
+    Not(Or(predicate(Operation.EQ, "data", "a"), predicate(Operation.GT, "price", Decimal("1.00")))),
+]
+
+
+@pytest.mark.parametrize("expr", EXPRESSIONS, ids=str)
+def test_mask_matches_row_evaluator(expr):
+    batch = make_batch(300)
+    mask = ArrowEvaluator(SCHEMA, expr).mask(batch)
+    assert mask.type == pa.bool_() and mask.null_count == 0
+    evaluator = Evaluator(SCHEMA, expr)
+    assert mask.to_pylist() == [evaluator.eval(row) for row in rows_of(batch)]
+
+
+def test_filter():
+    batch = make_batch(50)
+    filtered = ArrowEvaluator(SCHEMA, predicate(Operation.IN, "data", "a", "b")).filter(batch)
+    assert filtered.schema == batch.schema
+    assert set(filtered.column("data").to_pylist()) == {"a", "b"}
+    assert filtered.num_rows == sum(value in ("a", "b") for value in batch.column("data").to_pylist())
+
+
+def test_mask_of_unbound_expression():
+    with pytest.raises(ValueError) as exc_info:
+        expression_to_mask(SCHEMA, predicate(Operation.EQ, "id", 1), make_batch(1))
+    assert "Cannot evaluate an expression that is not bound: id == 1" in str(exc_info.value)
+
+
+def test_mask_of_bound_predicate():
+    ref = UnboundReference("id").bind(SCHEMA, case_sensitive=True)
+    mask = expression_to_mask(SCHEMA, BoundPredicate(Operation.GT_EQ, ref, [literal(2)]), make_batch(4))
+    assert mask.to_pylist() == [False, False, True, True]
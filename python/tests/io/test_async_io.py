@@ -0,0 +1,192 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from iceberg.io.async_io import AsyncInputStream, ExecutorFileIO
+from iceberg.io.pyarrow import PyArrowFileIO
+
+
+def test_executor_file_io_read():
+    """Test reading a local file through an ExecutorFileIO"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foobarbaz")
+
+        file_io = ExecutorFileIO(PyArrowFileIO())
+
+        async def read():
+            input_file = file_io.new_input(file_location)
+            return (
+                await input_file.exists(),
+                await input_file.length(),
+                await input_file.read(),
+                await input_file.read_range(3, 3),
+            )
+
+        assert asyncio.run(read()) == (True, 9, b"foobarbaz", b"bar")
+        file_io.close()
+
+
+def test_executor_file_io_open():
+    """Test streaming a local file through an AsyncInputStream"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foobarbaz")
+
+        file_io = ExecutorFileIO(PyArrowFileIO())
+
+        async def read():
+            stream = await file_io.new_input(file_location).open()
+            assert isinstance(stream, AsyncInputStream)
+            async with stream:
+                stream.seek(3, 0)
+                first = await stream.read(3)
+                return first, stream.tell(), await stream.read(10)
+
+        assert asyncio.run(read()) == (b"bar", 6, b"baz")
+        file_io.close()
+
+
+def test_executor_file_io_read_ranges():
+    """Test reading several ranges of a file concurrently"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        content = bytes(range(256)) * 4
+        with open(file_location, "wb") as f:
+            f.write(content)
+
+        file_io = ExecutorFileIO(PyArrowFileIO())
+        ranges = [(1000, 100), (0, 4), (512, 16), (8, 8)]
+        views = asyncio.run(file_io.new_input(file_location).read_ranges(ranges, max_gap=0))
+
+        assert [bytes(view) for view in views] == [content[1000:], content[0:4], content[512:528], content[8:16]]
+        file_io.close()
+
+
+def test_executor_file_io_delete():
+    """Test deleting files through an ExecutorFileIO"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foo")
+
+        file_io = ExecutorFileIO(PyArrowFileIO())
+        asyncio.run(file_io.delete(file_io.new_input(file_location)))
+        assert not os.path.exists(file_location)
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(file_io.delete(file_location))
+        file_io.close()
+
+
+def test_executor_file_io_creates_input_files_on_the_executor():
+    """Test that the input files of the adapted FileIO are created by the executor instead of on the event loop"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foo")
+
+        threads = []
+
+        class RecordingFileIO(PyArrowFileIO):
+            def new_input(self, location, length=None):
+                threads.append(threading.current_thread())
+                return super().new_input(location, length=length)
+
+        file_io = ExecutorFileIO(RecordingFileIO())
+
+        async def read():
+            input_file = file_io.new_input(file_location)
+            assert not threads
+            return await input_file.read(), await input_file.length()
+
+        assert asyncio.run(read()) == (b"foo", 3)
+        assert len(threads) == 1 and threads[0] is not threading.main_thread()
+        file_io.close()
+
+
+def test_executor_file_io_limits_concurrency_per_host():
+    """Test that no more than max_concurrency_per_host calls run at the same time for a host"""
+
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    class SlowFileIO(PyArrowFileIO):
+        def delete(self, location):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["current"] -= 1
+
+    executor = ThreadPoolExecutor(max_workers=12)
+    file_io = ExecutorFileIO(SlowFileIO(), executor=executor, max_concurrency_per_host=3)
+
+    async def delete_all():
+        await asyncio.gather(*[file_io.delete(f"s3://bucket/{i}") for i in range(12)])
+
+    asyncio.run(delete_all())
+    file_io.close()
+    executor.shutdown()
+
+    assert in_flight["max"] == 3
+
+
+def test_executor_file_io_default_executor_serves_hosts_concurrently():
+    """Test that the default executor runs the calls of several hosts at the same time, each within its own limit"""
+
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    class SlowFileIO(PyArrowFileIO):
+        def delete(self, location):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["current"] -= 1
+
+    file_io = ExecutorFileIO(SlowFileIO(), max_concurrency_per_host=3)
+
+    async def delete_all():
+        await asyncio.gather(*[file_io.delete(f"s3://bucket-{i % 2}/{i}") for i in range(12)])
+
+    asyncio.run(delete_all())
+    file_io.close()
+
+    assert in_flight["max"] == 6
+
+
+def test_executor_file_io_raise_on_invalid_concurrency():
+    """Test that a ValueError is raised when the concurrency per host is not positive"""
+    with pytest.raises(ValueError) as exc_info:
+        ExecutorFileIO(PyArrowFileIO(), max_concurrency_per_host=0)
+
+    assert "Concurrency per host must be positive: 0" in str(exc_info.value)
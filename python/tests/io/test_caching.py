@@ -0,0 +1,288 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import os
+import tempfile
+
+import pytest
+
+from iceberg.io.base import InputStream
+from iceberg.io.caching import BlockCache, CachingFileIO
+from iceberg.io.instrumented import InstrumentedFileIO, IOOperation
+from iceberg.io.pyarrow import PyArrowFileIO
+
+
+class CountingFileIO(PyArrowFileIO):
+    """A PyArrowFileIO that counts the number of opened input streams"""
+
+    def __init__(self):
+        super().__init__()
+        self.opened = 0
+
+    def new_input(self, location, length=None):
+        input_file = super().new_input(location, length=length)
+        original_open = input_file.open
+
+        def counting_open():
+            self.opened += 1
+            return original_open()
+
+        input_file.open = counting_open
+        return input_file
+
+
+def write_file(directory: str, name: str, content: bytes) -> str:
+    location = os.path.join(directory, name)
+    os.makedirs(os.path.dirname(location), exist_ok=True)
+    with open(location, "wb") as f:
+        f.write(content)
+    return location
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 10, 100])
+def test_caching_input_stream_reads(block_size):
+    """Test that reads through the cache return the content of the file for any block size"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = bytes(range(50))
+        location = write_file(tmpdirname, "metadata/foo.avro", content)
+        file_io = CachingFileIO(PyArrowFileIO(), BlockCache(block_size=block_size))
+
+        input_file = file_io.new_input(location)
+        assert len(input_file) == 50
+        stream = input_file.open()
+        assert isinstance(stream, InputStream)
+        assert stream.read(7) == content[:7]
+        stream.seek(20, 0)
+        assert stream.read(15) == content[20:35]
+        stream.seek(-5, 2)
+        assert stream.read(100) == content[45:]
+        assert stream.read(1) == b""
+        stream.seek(-10, 1)
+        assert stream.tell() == 40
+        assert stream.read() == content[40:]
+        stream.close()
+        assert stream.closed()
+
+
+def test_caching_file_io_serves_repeated_reads_from_memory():
+    """Test that a cached file is only read once from the wrapped FileIO"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        location = write_file(tmpdirname, "v1.metadata.json", b"{}" * 100)
+        counting_io = CountingFileIO()
+        file_io = CachingFileIO(counting_io, BlockCache(block_size=64))
+
+        for _ in range(3):
+            with file_io.new_input(location).open() as f:
+                assert f.read() == b"{}" * 100
+
+        assert counting_io.opened == 1
+        assert file_io.cache.memory_usage() == 200
+
+
+def test_caching_file_io_passes_length_hints_through():
+    """Test that a length hint reaches the wrapped FileIO and is trusted by the cache"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        location = write_file(tmpdirname, "metadata/snap-1.avro", b"x" * 100)
+        file_io = InstrumentedFileIO(CachingFileIO(PyArrowFileIO(), BlockCache(block_size=64)))
+
+        assert len(file_io.new_input(location, length=80)) == 80
+        with file_io.new_input(location).open() as f:
+            assert f.read() == b"x" * 80
+
+
+def test_caching_file_io_does_not_cache_mutable_files():
+    """Test that locations that are not accepted by the cacheable predicate are always read from the wrapped FileIO"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        location = write_file(tmpdirname, "version-hint.text", b"1")
+        counting_io = CountingFileIO()
+        file_io = CachingFileIO(counting_io)
+
+        for version in [b"1", b"2"]:
+            write_file(tmpdirname, "version-hint.text", version)
+            assert file_io.new_input(location).open().read() == version
+            assert len(file_io.new_input(location)) == 1
+
+        assert counting_io.opened == 2
+        assert file_io.cache.memory_usage() == 0
+
+
+def test_block_cache_evicts_least_recently_used_blocks():
+    """Test that the memory tier stays within its byte budget"""
+    cache = BlockCache(block_size=10, memory_bytes=30)
+    for index in range(4):
+        cache.put("foo", index, b"x" * 10)
+    cache.get("foo", 1)
+    cache.put("foo", 4, b"x" * 10)
+
+    assert cache.memory_usage() == 30
+    assert cache.get("foo", 0) is None
+    assert cache.get("foo", 2) is None
+    assert cache.get("foo", 1) is not None
+    assert cache.get("foo", 3) is not None
+    assert cache.get("foo", 4) is not None
+
+
+def test_block_cache_disk_tier_survives_restarts():
+    """Test that blocks written to disk are reused by a new cache in the same directory"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cache_dir = os.path.join(tmpdirname, "cache")
+        location = write_file(tmpdirname, "metadata/snap-1.avro", bytes(range(100)))
+
+        counting_io = CountingFileIO()
+        file_io = CachingFileIO(counting_io, BlockCache(block_size=16, memory_bytes=16, directory=cache_dir))
+        assert file_io.new_input(location).open().read() == bytes(range(100))
+        assert file_io.cache.disk_usage() == 100
+        assert file_io.cache.memory_usage() == 4
+
+        restarted = CachingFileIO(counting_io, BlockCache(block_size=16, memory_bytes=16, directory=cache_dir))
+        assert restarted.cache.disk_usage() == 100
+        assert restarted.new_input(location).open().read() == bytes(range(100))
+        assert counting_io.opened == 1
+
+
+def test_block_cache_disk_tier_evicts_least_recently_used_blocks():
+    """Test that the disk tier stays within its byte budget"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cache = BlockCache(block_size=10, memory_bytes=0, directory=tmpdirname, disk_bytes=25)
+        for index in range(3):
+            cache.put("foo", index, b"x" * 10)
+
+        assert cache.disk_usage() == 20
+        assert len(os.listdir(tmpdirname)) == 2
+        assert cache.get("foo", 0) is None
+        assert cache.get("foo", 2) == b"x" * 10
+
+
+def test_caching_file_io_delete_invalidates_cache():
+    """Test that deleting a file through the CachingFileIO removes its cached blocks"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cache_dir = os.path.join(tmpdirname, "cache")
+        location = write_file(tmpdirname, "metadata/foo.avro", b"foo")
+        file_io = CachingFileIO(PyArrowFileIO(), BlockCache(directory=cache_dir))
+
+        assert file_io.new_input(location).open().read() == b"foo"
+        assert file_io.new_input(location).exists()
+        file_io.delete(location)
+
+        assert not os.path.exists(location)
+        assert not file_io.new_input(location).exists()
+        assert file_io.cache.memory_usage() == 0
+        assert file_io.cache.disk_usage() == 0
+        assert os.listdir(cache_dir) == []
+
+
+def test_caching_file_io_read_ranges():
+    """Test reading several ranges of a cached file"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = bytes(range(256))
+        location = write_file(tmpdirname, "metadata/foo.avro", content)
+        file_io = CachingFileIO(PyArrowFileIO(), BlockCache(block_size=32))
+
+        views = file_io.new_input(location).read_ranges([(200, 100), (0, 4), (64, 64)], max_gap=0)
+        assert [bytes(view) for view in views] == [content[200:], content[:4], content[64:128]]
+
+
+def test_caching_file_io_does_not_cache_data_files():
+    """Test that Avro data files are not cached like manifests"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        location = write_file(tmpdirname, "data/00000-0-uuid.avro", b"foo")
+        file_io = CachingFileIO(PyArrowFileIO())
+
+        assert file_io.new_input(location).open().read() == b"foo"
+        assert file_io.cache.memory_usage() == 0
+
+
+def test_block_cache_caches_lengths_of_many_files():
+    """Test that the lengths of more files than there are blocks in memory are cached"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        locations = [write_file(tmpdirname, f"metadata/m{i}.avro", b"x" * i) for i in range(100)]
+        instrumented_io = InstrumentedFileIO(PyArrowFileIO())
+        file_io = CachingFileIO(instrumented_io, BlockCache(block_size=64, memory_bytes=64))
+
+        for _ in range(2):
+            for i, location in enumerate(locations):
+                assert len(file_io.new_input(location)) == i
+
+        assert instrumented_io.metrics.total(IOOperation.LENGTH).count == 100
+
+
+def test_block_cache_disk_tier_keeps_lengths_across_restarts():
+    """Test that a new cache in the same directory opens cached files without requesting their length"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cache_dir = os.path.join(tmpdirname, "cache")
+        location = write_file(tmpdirname, "metadata/snap-1.avro", bytes(range(100)))
+        file_io = CachingFileIO(PyArrowFileIO(), BlockCache(directory=cache_dir))
+        assert file_io.new_input(location).open().read() == bytes(range(100))
+
+        instrumented_io = InstrumentedFileIO(PyArrowFileIO())
+        restarted = CachingFileIO(instrumented_io, BlockCache(directory=cache_dir))
+        assert restarted.new_input(location).open().read() == bytes(range(100))
+        assert instrumented_io.metrics.total(IOOperation.LENGTH).count == 0
+        assert instrumented_io.metrics.total(IOOperation.OPEN).count == 0
+
+
+def test_block_cache_disk_tier_evicts_lengths():
+    """Test that the disk tier holds at most max_lengths lengths"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cache = BlockCache(directory=tmpdirname, max_lengths=2)
+        for i in range(3):
+            cache.put_length(f"foo-{i}", i)
+
+        assert len(os.listdir(tmpdirname)) == 2
+        restarted = BlockCache(directory=tmpdirname, max_lengths=2)
+        assert [restarted.get_length(f"foo-{i}") for i in range(3)] == [None, 1, 2]
+
+
+def test_block_cache_removes_leftover_temporary_files():
+    """Test that temporary files of unfinished writes are removed when a cache is created"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        write_file(tmpdirname, "abc.tmp", b"partial")
+        BlockCache(directory=tmpdirname)
+
+        assert os.listdir(tmpdirname) == []
+
+
+def test_caching_file_io_retries_throttled_deletes():
+    """Test that delete_many retries the deletes throttled by the wrapped FileIO"""
+
+    class ThrottledFileIO(PyArrowFileIO):
+        def __init__(self):
+            super().__init__()
+            self.attempts = 0
+
+        def delete(self, location):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise OSError("Throttled")
+
+        def _is_throttled(self, error):
+            return str(error) == "Throttled"
+
+    throttled_io = ThrottledFileIO()
+    assert CachingFileIO(throttled_io).delete_many(["s3://bucket/metadata/foo.avro"], max_retries=1) == {
+        "s3://bucket/metadata/foo.avro": None
+    }
+    assert throttled_io.attempts == 2
+
+
+def test_block_cache_raise_on_invalid_block_size():
+    """Test that a ValueError is raised when the block size is not positive"""
+    with pytest.raises(ValueError) as exc_info:
+        BlockCache(block_size=0)
+
+    assert "Block size must be positive: 0" in str(exc_info.value)
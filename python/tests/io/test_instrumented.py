@@ -0,0 +1,170 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import os
+import tempfile
+
+import pytest
+
+from iceberg.io.base import InputStream, OutputStream
+from iceberg.io.instrumented import (
+    HISTOGRAM_BUCKETS,
+    FileRole,
+    InstrumentedFileIO,
+    IOMetrics,
+    IOOperation,
+    MetricKey,
+)
+from iceberg.io.pyarrow import PyArrowFileIO
+
+
+def test_instrumented_file_io_records_reads():
+    """Test that opens, reads, seeks and lengths are recorded with the scheme and role of the file"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "metadata", "snap-1-1-uuid.avro")
+        os.makedirs(os.path.dirname(file_location))
+        with open(file_location, "wb") as f:
+            f.write(b"foobarbaz")
+
+        file_io = InstrumentedFileIO(PyArrowFileIO())
+        input_file = file_io.new_input(file_location)
+        assert len(input_file) == 9
+        with input_file.open() as stream:
+            assert isinstance(stream, InputStream)
+            assert not stream.closed()
+            assert stream.read(3) == b"foo"
+            stream.seek(6, 0)
+            assert stream.tell() == 6
+            assert stream.read(10) == b"baz"
+        assert stream.closed()
+
+        snapshot = file_io.metrics.snapshot()
+        assert snapshot[MetricKey(IOOperation.READ, "file", FileRole.MANIFEST_LIST)].count == 2
+        assert snapshot[MetricKey(IOOperation.READ, "file", FileRole.MANIFEST_LIST)].bytes == 6
+        assert snapshot[MetricKey(IOOperation.OPEN, "file", FileRole.MANIFEST_LIST)].count == 1
+        assert snapshot[MetricKey(IOOperation.SEEK, "file", FileRole.MANIFEST_LIST)].count == 1
+        assert snapshot[MetricKey(IOOperation.LENGTH, "file", FileRole.MANIFEST_LIST)].count == 1
+        assert sum(snapshot[MetricKey(IOOperation.READ, "file", FileRole.MANIFEST_LIST)].histogram) == 2
+
+
+def test_instrumented_file_io_records_writes_and_deletes():
+    """Test that creates, writes, existence checks and deletes are recorded"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "00000-0-uuid.parquet")
+
+        file_io = InstrumentedFileIO(PyArrowFileIO())
+        output_file = file_io.new_output(file_location)
+        with output_file.create() as stream:
+            assert isinstance(stream, OutputStream)
+            stream.write(b"foo")
+            stream.write(b"bar")
+            assert not stream.closed()
+        assert stream.closed()
+        assert output_file.to_input_file().exists()
+        file_io.delete(output_file)
+
+        with pytest.raises(FileNotFoundError):
+            file_io.delete(file_location)
+
+        write = file_io.metrics.total(IOOperation.WRITE)
+        assert (write.count, write.bytes) == (2, 6)
+        assert file_io.metrics.total(IOOperation.CREATE).count == 1
+        assert file_io.metrics.total(IOOperation.EXISTS).count == 1
+        delete = file_io.metrics.snapshot()[MetricKey(IOOperation.DELETE, "file", FileRole.DATA)]
+        assert (delete.count, delete.errors) == (2, 1)
+
+
+def test_instrumented_file_io_records_errors():
+    """Test that operations raising errors are recorded as errors"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_io = InstrumentedFileIO(PyArrowFileIO())
+        with pytest.raises(FileNotFoundError):
+            file_io.new_input(os.path.join(tmpdirname, "v1.metadata.json")).open()
+
+        stats = file_io.metrics.snapshot()[MetricKey(IOOperation.OPEN, "file", FileRole.METADATA)]
+        assert (stats.count, stats.errors) == (1, 1)
+
+
+def test_instrumented_file_io_delegates_read_ranges():
+    """Test that range reads go through the wrapped InputFile and are recorded as one read"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "00000-0-uuid.parquet")
+        with open(file_location, "wb") as f:
+            f.write(bytes(range(100)))
+
+        file_io = InstrumentedFileIO(PyArrowFileIO())
+        views = file_io.new_input(file_location).read_ranges([(90, 10), (0, 5)], max_gap=0)
+
+        assert [bytes(view) for view in views] == [bytes(range(90, 100)), bytes(range(5))]
+        read = file_io.metrics.total(IOOperation.READ)
+        assert (read.count, read.bytes) == (1, 15)
+        assert file_io.metrics.total(IOOperation.OPEN).count == 0
+
+
+class ThrottledFileIO(PyArrowFileIO):
+    """A FileIO whose first delete of every location is throttled (for test use only)"""
+
+    def __init__(self):
+        super().__init__()
+        self.attempted = set()
+
+    def delete(self, location):
+        if location not in self.attempted:
+            self.attempted.add(location)
+            raise OSError("Throttled")
+
+    def _is_throttled(self, error):
+        return str(error) == "Throttled"
+
+
+def test_instrumented_file_io_retries_throttled_deletes():
+    """Test that delete_many retries the deletes throttled by the wrapped FileIO and records every attempt"""
+    file_io = InstrumentedFileIO(ThrottledFileIO())
+    results = file_io.delete_many(["s3://bucket/foo", "s3://bucket/bar"], max_retries=1)
+
+    assert results == {"s3://bucket/foo": None, "s3://bucket/bar": None}
+    delete = file_io.metrics.total(IOOperation.DELETE)
+    assert (delete.count, delete.errors) == (4, 2)
+
+
+def test_io_metrics_reset():
+    """Test that reset returns the recorded metrics and clears them"""
+    metrics = IOMetrics()
+    key = MetricKey(IOOperation.READ, "s3", FileRole.MANIFEST)
+    metrics.record(key, 0.001, num_bytes=10)
+
+    assert metrics.reset()[key].bytes == 10
+    assert metrics.snapshot() == {}
+    assert metrics.total(IOOperation.READ).count == 0
+
+
+def test_io_metrics_latency_histogram():
+    """Test that latencies are bucketed by powers of two of microseconds"""
+    metrics = IOMetrics()
+    key = MetricKey(IOOperation.READ, "s3", FileRole.DATA)
+    for seconds in [0.0000001, 0.000003, 0.000003, 0.001, 10_000.0]:
+        metrics.record(key, seconds)
+
+    stats = metrics.snapshot()[key]
+    assert stats.histogram[0] == 1
+    assert stats.histogram[2] == 2
+    assert stats.histogram[10] == 1
+    assert stats.histogram[HISTOGRAM_BUCKETS - 1] == 1
+    assert stats.percentile(50) == 0.000004
+    assert stats.percentile(80) == 0.001024
+    assert stats.mean_seconds == pytest.approx(10_000.001006 / 5)
@@ -17,12 +17,19 @@
 
 import os
 import tempfile
-from typing import Union
+from typing import Dict, Optional, Union
 from urllib.parse import ParseResult, urlparse
 
 import pytest
 
-from iceberg.io.base import FileIO, InputFile, InputStream, OutputFile, OutputStream
+from iceberg.io.base import (
+    FileIO,
+    InputFile,
+    InputStream,
+    OutputFile,
+    OutputStream,
+    coalesce_ranges,
+)
 from iceberg.io.pyarrow import PyArrowFile, PyArrowFileIO
 
 
@@ -106,7 +113,7 @@ class LocalOutputFile(OutputFile):
 class LocalFileIO(FileIO):
     """A FileIO implementation for local files (for test use only)"""
 
-    def new_input(self, location: str):
+    def new_input(self, location: str, length: Optional[int] = None):
         return LocalInputFile(location=location)
 
     def new_output(self, location: str):
@@ -369,3 +376,104 @@ def test_deleting_local_file_using_file_io_output_file(CustomFileIO, CustomOutpu
 
         # Confirm that the file no longer exists
         assert not os.path.exists(file_location)
+
+
+@pytest.mark.parametrize(
+    "ranges, max_gap, max_size, expected",
+    [
+        ([], 0, 100, []),
+        ([(0, 10)], 0, 100, [(0, 10, [0])]),
+        ([(0, 10), (10, 10)], 0, 100, [(0, 20, [0, 1])]),
+        ([(0, 10), (11, 10)], 0, 100, [(0, 10, [0]), (11, 10, [1])]),
+        ([(20, 5), (0, 10), (12, 4)], 2, 100, [(0, 16, [1, 2]), (20, 5, [0])]),
+        ([(0, 10), (2, 3)], 0, 100, [(0, 10, [0, 1])]),
+        ([(0, 60), (60, 60)], 0, 100, [(0, 60, [0]), (60, 60, [1])]),
+        ([(0, 200)], 0, 100, [(0, 200, [0])]),
+    ],
+)
+def test_coalesce_ranges(ranges, max_gap, max_size, expected):
+    """Test merging ranges that are close to each other"""
+    assert coalesce_ranges(ranges, max_gap=max_gap, max_size=max_size) == expected
+
+
+def test_coalesce_ranges_raise_on_negative_range():
+    """Test that a ValueError is raised for negative offsets and lengths"""
+    with pytest.raises(ValueError) as exc_info:
+        coalesce_ranges([(0, 10), (-1, 10)])
+
+    assert "Cannot read range with a negative offset or length: (-1, 10)" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("CustomInputFile", [LocalInputFile, PyArrowFile])
+@pytest.mark.parametrize("max_gap, max_workers", [(0, 1), (0, 4), (1024, 4)])
+def test_custom_local_input_file_read_ranges(CustomInputFile, max_gap, max_workers):
+    """Test reading several ranges of a local file at once"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        content = bytes(range(256)) * 4
+        with open(file_location, "wb") as f:
+            f.write(content)
+
+        input_file = CustomInputFile(location=file_location)
+        ranges = [(1000, 100), (0, 4), (10, 0), (512, 16), (8, 8)]
+        views = input_file.read_ranges(ranges, max_gap=max_gap, max_workers=max_workers)
+
+        assert all(isinstance(view, memoryview) for view in views)
+        assert [bytes(view) for view in views] == [content[1000:], content[0:4], b"", content[512:528], content[8:16]]
+
+
+@pytest.mark.parametrize("CustomFileIO", [LocalFileIO, PyArrowFileIO])
+def test_delete_many_local_files(CustomFileIO):
+    """Test deleting many local files at once, with per-location results and duplicate locations deleted once"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        locations = [os.path.join(tmpdirname, f"{i}.txt") for i in range(50)]
+        for location in locations:
+            with open(location, "wb") as f:
+                f.write(b"foo")
+        missing_location = os.path.join(tmpdirname, "missing.txt")
+
+        file_io = CustomFileIO()
+        duplicates = [locations[1], file_io.new_input(locations[2])]
+        results = file_io.delete_many(
+            iter([file_io.new_input(locations[0])] + locations[1:] + duplicates + [missing_location]), max_workers=4
+        )
+
+        assert set(results) == set(locations) | {missing_location}
+        assert all(results[location] is None for location in locations)
+        assert isinstance(results[missing_location], FileNotFoundError)
+        assert os.listdir(tmpdirname) == []
+
+
+class ThrottledFileIO(LocalFileIO):
+    """A FileIO that throttles the first deletes of every location (for test use only)"""
+
+    def __init__(self, throttled_attempts: int):
+        self.throttled_attempts = throttled_attempts
+        self.attempts: Dict[str, int] = {}
+
+    def delete(self, location):
+        self.attempts[location] = self.attempts.get(location, 0) + 1
+        if self.attempts[location] <= self.throttled_attempts:
+            raise OSError("Throttled")
+        self.attempts[location] = -1
+
+    def _is_throttled(self, error):
+        return str(error) == "Throttled"
+
+
+def test_delete_many_retries_throttled_deletes():
+    """Test that throttled deletes are retried until they succeed"""
+    file_io = ThrottledFileIO(throttled_attempts=2)
+    results = file_io.delete_many(["foo", "bar"], max_retries=2)
+
+    assert results == {"foo": None, "bar": None}
+    assert file_io.attempts == {"foo": -1, "bar": -1}
+
+
+def test_delete_many_gives_up_after_max_retries():
+    """Test that the throttling error is returned once a delete runs out of retries"""
+    file_io = ThrottledFileIO(throttled_attempts=3)
+    results = file_io.delete_many(["foo"], max_retries=1)
+
+    assert isinstance(results["foo"], OSError)
+    assert file_io.attempts == {"foo": 2}
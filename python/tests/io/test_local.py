@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import os
+import tempfile
+
+import pytest
+
+from iceberg.io.base import InputStream, OutputStream
+from iceberg.io.local import LocalFile, LocalFileIO
+
+
+def test_local_file_read_view():
+    """Test reading views of a memory mapped local file"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foobarbaz")
+
+        input_file = LocalFileIO().new_input(file_location)
+        assert len(input_file) == 9
+        assert len(LocalFileIO().new_input(file_location, length=5)) == 5
+
+        with input_file.open() as stream:
+            assert isinstance(stream, InputStream)
+            view = stream.read_view(3)
+            assert isinstance(view, memoryview)
+            assert view == b"foo"
+            assert stream.read(3) == b"bar"
+            stream.seek(-2, 2)
+            assert stream.read_view() == b"az"
+            assert stream.read(1) == b""
+            stream.seek(-5, 1)
+            assert stream.tell() == 4
+            assert stream.view == b"foobarbaz"
+
+        # Views stay valid after the stream is closed
+        assert view == b"foo"
+        assert stream.closed()
+        with pytest.raises(ValueError):
+            stream.read(1)
+
+
+def test_local_file_read_empty_file():
+    """Test that empty files, which cannot be memory mapped, can be read"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        open(file_location, "wb").close()
+
+        with LocalFileIO().new_input(f"file:{file_location}").open() as stream:
+            assert stream.read() == b""
+            assert len(stream) == 0
+
+
+def test_local_file_create():
+    """Test writing a local file, including its parent directories"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo", "bar.txt")
+        output_file = LocalFileIO().new_output(file_location)
+
+        with output_file.create() as stream:
+            assert isinstance(stream, OutputStream)
+            stream.write(b"foo")
+
+        with pytest.raises(FileExistsError) as exc_info:
+            output_file.create()
+        assert "Cannot create file, already exists:" in str(exc_info.value)
+
+        with output_file.create(overwrite=True) as stream:
+            stream.write(b"bar")
+
+        assert output_file.exists()
+        assert output_file.to_input_file().open().read() == b"bar"
+
+
+def test_local_file_io_delete():
+    """Test deleting local files"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foo")
+
+        file_io = LocalFileIO()
+        file_io.delete(file_io.new_input(file_location))
+        assert not os.path.exists(file_location)
+
+        with pytest.raises(FileNotFoundError) as exc_info:
+            file_io.delete(file_location)
+        assert "Cannot delete file, does not exist:" in str(exc_info.value)
+
+
+def test_local_file_raise_on_missing_file():
+    """Test that a FileNotFoundError is raised when opening or getting the length of a missing file"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_file = LocalFile(os.path.join(tmpdirname, "foo.txt"))
+        assert not input_file.exists()
+
+        with pytest.raises(FileNotFoundError) as exc_info:
+            input_file.open()
+        assert "Cannot open file, does not exist:" in str(exc_info.value)
+
+        with pytest.raises(FileNotFoundError) as exc_info:
+            len(input_file)
+        assert "Cannot get file info, file not found:" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "location, message",
+    [
+        ("s3://foo/bar.txt", "LocalFileIO location must be a local path or have a scheme of `file`"),
+        ("file://foo/bar.txt", "Network location is not allowed for LocalFileIO: foo"),
+    ],
+)
+def test_local_file_raise_on_non_local_location(location, message):
+    """Test that a ValueError is raised for locations that are not local"""
+    with pytest.raises(ValueError) as exc_info:
+        LocalFile(location)
+
+    assert message in str(exc_info.value)
@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+import threading
+
+import pytest
+
+from iceberg.io.base import InputStream
+from iceberg.io.prefetch import PrefetchingInputStream
+from iceberg.io.pyarrow import PyArrowFileIO
+
+
+class RecordingFile:
+    """A wrapper around an InputFile that records the ranges read by its streams"""
+
+    def __init__(self, input_file):
+        self._input_file = input_file
+        self.reads = []
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._input_file)
+
+    def open(self):
+        return RecordingStream(self._input_file.open(), self)
+
+
+class RecordingStream:
+    """A stream that records the ranges it reads in its RecordingFile"""
+
+    def __init__(self, stream, recording):
+        self._stream = stream
+        self._recording = recording
+
+    def read(self, size=-1):
+        position = self._stream.tell()
+        with self._recording.lock:
+            self._recording.reads.append((position, size))
+        return self._stream.read(size)
+
+    def seek(self, offset, whence=0):
+        self._stream.seek(offset, whence)
+
+    def tell(self):
+        return self._stream.tell()
+
+    def closed(self):
+        return self._stream.closed
+
+    def close(self):
+        self._stream.close()
+
+
+def write_file(directory: str, content: bytes) -> str:
+    location = os.path.join(directory, "foo.avro")
+    with open(location, "wb") as f:
+        f.write(content)
+    return location
+
+
+@pytest.mark.parametrize("block_size,max_block_size", [(1, 1), (3, 12), (10, 10), (100, 1000)])
+def test_prefetching_input_stream_reads(block_size, max_block_size):
+    """Test that reads through the prefetching stream return the content of the file for any block size"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = bytes(range(50))
+        input_file = PyArrowFileIO().new_input(write_file(tmpdirname, content))
+
+        stream = PrefetchingInputStream(input_file, block_size=block_size, max_block_size=max_block_size)
+        assert isinstance(stream, InputStream)
+        assert stream.read(7) == content[:7]
+        assert stream.read(3) == content[7:10]
+        stream.seek(20, 0)
+        assert stream.read(15) == content[20:35]
+        stream.seek(-5, 2)
+        assert stream.read(100) == content[45:]
+        assert stream.read(1) == b""
+        stream.seek(-10, 1)
+        assert stream.tell() == 40
+        assert stream.read() == content[40:]
+        stream.seek(0)
+        assert stream.read() == content
+        stream.close()
+        assert stream.closed()
+
+
+def test_prefetching_input_stream_grows_blocks():
+    """Test that the block size doubles up to the maximum while the file is read sequentially"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = os.urandom(1000)
+        recording = RecordingFile(PyArrowFileIO().new_input(write_file(tmpdirname, content)))
+
+        with PrefetchingInputStream(recording, block_size=10, max_block_size=80, prefetch_blocks=2) as stream:
+            assert stream.read() == content
+
+        assert sorted(recording.reads)[:5] == [(0, 10), (10, 20), (30, 40), (70, 80), (150, 80)]
+
+
+def test_prefetching_input_stream_restarts_after_seek():
+    """Test that seeking outside of the prefetched blocks restarts prefetching with the initial block size"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = os.urandom(1000)
+        recording = RecordingFile(PyArrowFileIO().new_input(write_file(tmpdirname, content)))
+
+        with PrefetchingInputStream(recording, block_size=10, max_block_size=80, prefetch_blocks=2) as stream:
+            assert stream.read(5) == content[:5]
+            stream.seek(500)
+            assert stream.read(5) == content[500:505]
+
+        assert (500, 10) in recording.reads
+
+
+def test_prefetching_input_stream_limits_buffered_bytes():
+    """Test that no more than the allowed number of bytes is requested ahead of the current block"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = os.urandom(1000)
+        recording = RecordingFile(PyArrowFileIO().new_input(write_file(tmpdirname, content)))
+
+        with PrefetchingInputStream(recording, block_size=100, prefetch_blocks=8, max_buffered_bytes=250) as stream:
+            assert stream.read(1) == content[:1]
+            stream._executor.shutdown(wait=True)
+            assert sum(size for _, size in recording.reads) <= 250
+
+
+def test_prefetching_input_stream_raises_errors_of_background_reads():
+    """Test that an error of a background read is raised by the read that needs the block"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_file = PyArrowFileIO().new_input(os.path.join(tmpdirname, "missing.avro"))
+
+        with PrefetchingInputStream(input_file) as stream:
+            with pytest.raises(FileNotFoundError):
+                stream.read(1)
+
+
+def test_prefetching_input_stream_rejects_invalid_arguments():
+    """Test that invalid block sizes and seeks raise a ValueError"""
+    input_file = PyArrowFileIO().new_input("foo.avro")
+    with pytest.raises(ValueError) as exc_info:
+        PrefetchingInputStream(input_file, block_size=10, max_block_size=5)
+    assert "Invalid block sizes: 10 and max 5" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        PrefetchingInputStream(input_file, prefetch_blocks=0)
+    assert "Number of prefetched blocks must be positive: 0" in str(exc_info.value)
+
+    with PrefetchingInputStream(input_file) as stream:
+        with pytest.raises(ValueError) as exc_info:
+            stream.seek(-1)
+        assert "Cannot seek to a negative position: -1" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        stream.read(1)
+    assert "I/O operation on closed file." in str(exc_info.value)
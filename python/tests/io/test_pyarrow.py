@@ -280,3 +280,147 @@ def test_deleting_s3_file_not_found(filesystem_mock):
         file_io.delete("s3://foo/bar.txt")
 
     assert "Cannot delete file, does not exist:" in str(exc_info.value)
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_file_io_reuses_filesystem_for_the_same_authority(filesystem_mock):
+    """Test that a PyArrowFileIO only infers a filesystem once per scheme and authority"""
+
+    s3fs_mock = MagicMock()
+    filesystem_mock.from_uri.side_effect = lambda location: (s3fs_mock, location[len("s3://") :])
+
+    file_io = PyArrowFileIO()
+    first = file_io.new_input("s3://foo/bar.txt")
+    second = file_io.new_output("s3://foo/baz/qux.txt")
+    file_io.delete("s3://foo/bar.txt")
+
+    assert filesystem_mock.from_uri.call_count == 1
+    assert first._filesystem is second._filesystem is s3fs_mock
+    assert first._path == "foo/bar.txt"
+    assert second._path == "foo/baz/qux.txt"
+    s3fs_mock.delete_file.assert_called_once_with("foo/bar.txt")
+
+    file_io.new_input("s3://other/bar.txt")
+    assert filesystem_mock.from_uri.call_count == 2
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_file_io_pools_filesystems_per_query_options(filesystem_mock):
+    """Test that locations with different filesystem options in their query do not share a filesystem"""
+
+    filesystem_mock.from_uri.side_effect = lambda location: (MagicMock(), location[len("s3://") :].split("?")[0])
+
+    file_io = PyArrowFileIO()
+    default = file_io.new_input("s3://foo/bar.txt")
+    west = file_io.new_input("s3://foo/bar.txt?region=us-west-2")
+    assert file_io.new_input("s3://foo/baz.txt?region=us-west-2")._filesystem is west._filesystem
+    assert file_io.new_input("s3://foo/baz.txt?region=eu-west-1")._filesystem is not west._filesystem
+    assert default._filesystem is not west._filesystem
+    assert west._path == "foo/bar.txt"
+    assert filesystem_mock.from_uri.call_count == 3
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_file_io_length_hint_skips_file_info(filesystem_mock):
+    """Test that a known length is returned without a request for the file info"""
+
+    s3fs_mock = MagicMock()
+    filesystem_mock.from_uri.side_effect = lambda location: (s3fs_mock, location[len("s3://") :])
+
+    file_io = PyArrowFileIO()
+    assert len(file_io.new_input("s3://foo/bar.avro", length=1234)) == 1234
+    s3fs_mock.get_file_info.assert_not_called()
+
+    s3fs_mock.get_file_info.return_value = MagicMock(type=FileType.File, size=42)
+    assert len(file_io.new_input("s3://foo/bar.avro")) == 42
+    s3fs_mock.get_file_info.assert_called_once_with("foo/bar.avro")
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_file_io_evict_and_close_filesystems(filesystem_mock):
+    """Test that evicted filesystems are inferred again on the next access"""
+
+    filesystem_mock.from_uri.side_effect = lambda location: (MagicMock(), location[len("s3://") :])
+
+    file_io = PyArrowFileIO()
+    file_io.new_input("s3://foo/bar.txt")
+    file_io.new_input("s3://bar/bar.txt")
+    assert filesystem_mock.from_uri.call_count == 2
+
+    file_io.evict_filesystem("s3://foo/other.txt")
+    file_io.new_input("s3://foo/bar.txt")
+    file_io.new_input("s3://bar/bar.txt")
+    assert filesystem_mock.from_uri.call_count == 3
+
+    file_io.close()
+    file_io.new_input("s3://bar/bar.txt")
+    assert filesystem_mock.from_uri.call_count == 4
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_file_io_does_not_pool_filesystem_with_unexpected_path(filesystem_mock):
+    """Test that a filesystem is not pooled when the path inferred by pyarrow cannot be derived from the location"""
+
+    filesystem_mock.from_uri.return_value = (MagicMock(), "unexpected")
+
+    file_io = PyArrowFileIO()
+    assert file_io.new_input("hdfs://foo:9000/bar.txt")._path == "unexpected"
+    assert file_io.new_input("hdfs://foo:9000/bar.txt")._path == "unexpected"
+    assert filesystem_mock.from_uri.call_count == 2
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_file_io_resets_filesystems_after_fork(filesystem_mock):
+    """Test that filesystems inherited from a parent process are not reused"""
+
+    filesystem_mock.from_uri.side_effect = lambda location: (MagicMock(), location[len("s3://") :])
+
+    file_io = PyArrowFileIO()
+    file_io.new_input("s3://foo/bar.txt")
+    file_io._pid = -1  # Pretend that the pool was created by a parent process
+    file_io.new_input("s3://foo/bar.txt")
+
+    assert filesystem_mock.from_uri.call_count == 2
+    assert file_io._pid == os.getpid()
+
+
+def test_file_io_local_locations_share_a_filesystem():
+    """Test that local paths with and without a file scheme resolve to the same pooled filesystem"""
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_location = os.path.join(tmpdirname, "foo.txt")
+        with open(file_location, "wb") as f:
+            f.write(b"foo")
+
+        file_io = PyArrowFileIO()
+        input_file = file_io.new_input(file_location)
+        assert input_file.open().read() == b"foo"
+        assert file_io.new_input(f"file:{file_location}")._filesystem is input_file._filesystem
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_delete_many_retries_throttled_s3_deletes(filesystem_mock):
+    """Test that PyArrowFileIO.delete_many retries deletes that fail with an S3 SlowDown error"""
+
+    s3fs_mock = MagicMock()
+    s3fs_mock.delete_file.side_effect = [OSError("AWS Error SLOW_DOWN during DeleteObject operation"), None]
+    filesystem_mock.from_uri.side_effect = lambda location: (s3fs_mock, location[len("s3://") :])
+
+    results = PyArrowFileIO().delete_many(["s3://foo/bar.txt"])
+
+    assert results == {"s3://foo/bar.txt": None}
+    assert s3fs_mock.delete_file.call_count == 2
+
+
+@patch("iceberg.io.pyarrow.FileSystem")
+def test_delete_many_does_not_retry_s3_permission_errors(filesystem_mock):
+    """Test that PyArrowFileIO.delete_many does not retry deletes that fail for other reasons"""
+
+    s3fs_mock = MagicMock()
+    s3fs_mock.delete_file.side_effect = OSError("AWS Error [code 15]")
+    filesystem_mock.from_uri.side_effect = lambda location: (s3fs_mock, location[len("s3://") :])
+
+    results = PyArrowFileIO().delete_many(["s3://foo/bar.txt"])
+
+    assert isinstance(results["s3://foo/bar.txt"], PermissionError)
+    assert s3fs_mock.delete_file.call_count == 1
@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from iceberg.io.simulated import (
+    ObjectStoreProfile,
+    SimulatedObjectStoreFileIO,
+    SimulatedThrottlingError,
+)
+
+
+def write_file(directory: str, name: str, content: bytes) -> str:
+    location = os.path.join(directory, name)
+    with open(location, "wb") as f:
+        f.write(content)
+    return location
+
+
+def test_simulated_file_io_charges_latency_and_bandwidth():
+    """Test that every request sleeps for the latency plus the transfer time of its bytes"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        location = write_file(tmpdirname, "foo.avro", b"x" * 1000)
+        sleeps = []
+        file_io = SimulatedObjectStoreFileIO(ObjectStoreProfile(latency=0.01, bandwidth=10_000), sleep=sleeps.append)
+
+        with file_io.new_input(location).open() as stream:
+            assert not stream.closed()
+            assert stream.read(100) == b"x" * 100
+            assert stream.read() == b"x" * 900
+        assert stream.closed()
+
+        assert sleeps == [0.01, 0.01, pytest.approx(0.01), 0.01, pytest.approx(0.09)]
+        assert file_io.request_count == 3
+
+
+def test_simulated_file_io_length_hint_skips_request():
+    """Test that a known length does not cost a request"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        location = write_file(tmpdirname, "foo.avro", b"x" * 10)
+        file_io = SimulatedObjectStoreFileIO(ObjectStoreProfile(latency=0.01), sleep=lambda _: None)
+
+        assert len(file_io.new_input(location, length=10)) == 10
+        assert file_io.request_count == 0
+        assert len(file_io.new_input(location)) == 10
+        assert file_io.request_count == 1
+
+
+def test_simulated_file_io_read_ranges_makes_one_request_per_coalesced_range():
+    """Test that coalesced ranges are read with a single request each"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        content = bytes(range(100))
+        location = write_file(tmpdirname, "foo.parquet", content)
+        file_io = SimulatedObjectStoreFileIO(sleep=lambda _: None)
+
+        views = file_io.new_input(location).read_ranges([(0, 10), (12, 10), (80, 5)], max_gap=5)
+        assert [bytes(view) for view in views] == [content[0:10], content[12:22], content[80:85]]
+        assert file_io.request_count == 2
+
+
+def test_simulated_file_io_is_repeatable_for_a_seed():
+    """Test that the same seed produces the same latencies and throttling errors"""
+
+    def run(seed):
+        sleeps, outcomes = [], []
+        profile = ObjectStoreProfile(
+            latency=0.02, latency_sigma=0.5, throttle_rate=0.3, tail_rate=0.1, tail_latency=1.0, seed=seed
+        )
+        file_io = SimulatedObjectStoreFileIO(profile, sleep=sleeps.append)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            location = write_file(tmpdirname, "foo.avro", b"x")
+            for _ in range(50):
+                try:
+                    outcomes.append(file_io.new_input(location).exists())
+                except SimulatedThrottlingError:
+                    outcomes.append(None)
+        return sleeps, outcomes
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+    sleeps, outcomes = run(7)
+    assert None in outcomes and True in outcomes
+    assert any(sleep > 1.0 for sleep in sleeps)
+
+
+@patch("iceberg.io.base.time.sleep")
+def test_simulated_file_io_writes_and_deletes(_):
+    """Test that writes are committed on close and that throttled deletes are retried by delete_many"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_io = SimulatedObjectStoreFileIO(ObjectStoreProfile(throttle_rate=0.5, seed=1), sleep=lambda _: None)
+        locations = [os.path.join(tmpdirname, f"{i}.avro") for i in range(10)]
+        written, throttled = [], []
+        for location in locations:
+            output_file = file_io.new_output(location)
+            stream = output_file.create()
+            stream.write(b"foo")
+            assert not stream.closed()
+            try:
+                stream.close()
+                written.append(location)
+            except SimulatedThrottlingError:
+                throttled.append(location)
+            assert stream.closed()
+            stream.close()
+
+        assert written and throttled
+        assert sorted(os.listdir(tmpdirname)) == sorted(os.path.basename(location) for location in written)
+        results = file_io.delete_many(written, max_retries=20)
+        assert results == {location: None for location in written}
+        assert not any(os.path.exists(location) for location in locations)
+
+
+def test_object_store_profile_validation():
+    """Test that invalid profiles raise a ValueError"""
+    with pytest.raises(ValueError) as exc_info:
+        ObjectStoreProfile(bandwidth=0)
+    assert "Bandwidth must be positive: 0" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        ObjectStoreProfile(throttle_rate=2)
+    assert "Rates must be between 0 and 1" in str(exc_info.value)
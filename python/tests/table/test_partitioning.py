@@ -15,9 +15,70 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from iceberg.table.partitioning import PartitionField
-from iceberg.transforms import bucket
-from iceberg.types import IntegerType
+import math
+import random
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+
+import pyarrow as pa
+import pytest
+
+from iceberg.schema import Schema
+from iceberg.table.partitioning import PartitionField, PartitionSpec
+from iceberg.transforms import bucket, day, hour, identity, month, truncate, year
+from iceberg.types import (
+    BooleanType,
+    DateType,
+    DecimalType,
+    DoubleType,
+    IntegerType,
+    LongType,
+    NestedField,
+    StringType,
+    StructType,
+    TimestampType,
+    UUIDType,
+)
+
+SCHEMA = Schema(
+    NestedField(1, "id", LongType(), is_optional=False),
+    NestedField(2, "category", StringType()),
+    NestedField(3, "ts", TimestampType()),
+    NestedField(4, "location", StructType(NestedField(5, "city", StringType()), NestedField(6, "zip", IntegerType()))),
+    schema_id=1,
+)
+
+SPEC = PartitionSpec(
+    SCHEMA,
+    1,
+    [
+        PartitionField(2, 1000, identity(StringType()), "category"),
+        PartitionField(3, 1001, day(TimestampType()), "ts_day"),
+        PartitionField(1, 1002, bucket(LongType(), 4), "id_bucket"),
+    ],
+    1002,
+)
+
+
+def make_batch(num_rows: int, seed: int = 7) -> pa.RecordBatch:
+    rng = random.Random(seed)
+    return pa.RecordBatch.from_pydict(
+        {
+            "id": [rng.randint(-1000, 1000) for _ in range(num_rows)],
+            "category": [rng.choice(["a", "b", None]) for _ in range(num_rows)],
+            "ts": [rng.choice([None, rng.randint(-2 * 86_400_000_000, 3 * 86_400_000_000)]) for _ in range(num_rows)],
+            "location": [{"city": rng.choice(["x", "y"]), "zip": rng.randint(0, 99)} for _ in range(num_rows)],
+        },
+        schema=pa.schema(
+            [
+                ("id", pa.int64()),
+                ("category", pa.string()),
+                ("ts", pa.timestamp("us")),
+                ("location", pa.struct([("city", pa.string()), ("zip", pa.int32())])),
+            ]
+        ),
+    )
 
 
 def test_partition_field_init():
@@ -34,3 +95,219 @@ def test_partition_field_init():
         repr(partition_field)
         == "PartitionField(field_id=1000, name=id, transform=transforms.bucket(source_type=IntegerType(), num_buckets=100), source_id=3)"
     )
+
+
+def test_partition_spec():
+    assert SPEC.spec_id == 1
+    assert SPEC.schema is SCHEMA
+    assert SPEC.last_assigned_field_id == 1002
+    assert not SPEC.is_unpartitioned()
+    assert PartitionSpec(SCHEMA, 0, [], 999).is_unpartitioned()
+    assert SPEC.fields_by_source_id(3) == [SPEC.fields[1]]
+    assert SPEC == PartitionSpec(SCHEMA, 1, list(SPEC.fields), 1002)
+    assert SPEC != PartitionSpec(SCHEMA, 1, SPEC.fields[:2], 1002)
+    assert str(SPEC) == "[\n  1000: category: identity(2)\n  1001: ts_day: day(3)\n  1002: id_bucket: bucket[4](1)\n]"
+    assert str(PartitionSpec(SCHEMA, 0, [], 999)) == "[]"
+    assert SPEC.partition_type() == StructType(
+        NestedField(1000, "category", StringType()),
+        NestedField(1001, "ts_day", DateType()),
+        NestedField(1002, "id_bucket", IntegerType()),
+    )
+
+
+def test_partition_indices_match_row_by_row_grouping():
+    batch = make_batch(2000)
+    expected = defaultdict(list)
+    for row, (record_id, category, ts) in enumerate(
+        zip(batch.column("id").to_pylist(), batch.column("category").to_pylist(), batch.column("ts").cast(pa.int64()).to_pylist())
+    ):
+        key = tuple(field.transform.apply(value) for field, value in zip(SPEC.fields, [category, ts, record_id]))
+        expected[key].append(row)
+
+    groups = SPEC.partition_indices(batch)
+    assert [(key, indices.tolist()) for key, indices in groups] == list(expected.items())
+    assert sum(len(indices) for _, indices in groups) == batch.num_rows
+
+
+def test_partition_batch():
+    batch = make_batch(500)
+    split = SPEC.partition_batch(batch)
+    for (key, indices), (split_key, rows) in zip(SPEC.partition_indices(batch), split):
+        assert key == split_key
+        assert rows.to_pylist() == batch.take(indices).to_pylist()
+    assert sum(rows.num_rows for _, rows in split) == batch.num_rows
+
+
+def test_partition_batch_slices_contiguous_partitions():
+    batch = pa.RecordBatch.from_pydict({"id": [1, 2, 3, 4], "category": ["a", "a", "b", "b"]})
+    spec = PartitionSpec(SCHEMA, 0, [PartitionField(2, 1000, identity(StringType()), "category")], 1000)
+    (first_key, first), (second_key, second) = spec.partition_batch(batch)
+    assert (first_key, second_key) == (("a",), ("b",))
+    assert first.column(0).buffers()[1].address == batch.column(0).buffers()[1].address
+    assert second.to_pydict() == {"id": [3, 4], "category": ["b", "b"]}
+
+
+def test_partition_by_nested_source_column():
+    batch = make_batch(100)
+    spec = PartitionSpec(
+        SCHEMA,
+        2,
+        [PartitionField(5, 1000, identity(StringType()), "city"), PartitionField(6, 1001, truncate(IntegerType(), 50), "zip")],
+        1001,
+    )
+    locations = batch.column("location").to_pylist()
+    for key, indices in spec.partition_indices(batch):
+        assert all((locations[row]["city"], locations[row]["zip"] // 50 * 50) == key for row in indices)
+
+
+def test_partition_by_null_and_nan_values():
+    schema = Schema(NestedField(1, "category", StringType()), NestedField(2, "score", DoubleType()), schema_id=1)
+    spec = PartitionSpec(
+        schema,
+        1,
+        [PartitionField(1, 1000, identity(StringType()), "category"), PartitionField(2, 1001, identity(DoubleType()), "score")],
+        1001,
+    )
+    batch = pa.RecordBatch.from_pydict(
+        {"category": [None, "a", None, "a", None, "a"], "score": [float("nan"), None, 1.5, None, float("nan"), 1.5]}
+    )
+    groups = [(key, indices.tolist()) for key, indices in spec.partition_indices(batch)]
+    assert [indices for _, indices in groups] == [[0, 4], [1, 3], [2], [5]]
+    assert [key[0] for key, _ in groups] == [None, "a", None, "a"]
+    assert math.isnan(groups[0][0][1])
+    assert [key[1] for key, _ in groups[1:]] == [None, 1.5, 1.5]
+
+
+def test_partition_empty_and_unpartitioned():
+    assert SPEC.partition_indices(make_batch(0)) == []
+    unpartitioned = PartitionSpec(SCHEMA, 0, [], 999)
+    [(key, indices)] = unpartitioned.partition_indices(make_batch(3))
+    assert key == ()
+    assert indices.tolist() == [0, 1, 2]
+
+
+def test_parse_partition_paths():
+    paths = [
+        "category=a/ts_day=2022-01-01/id_bucket=3",
+        "category=a%2Fb%3Dc/ts_day=2022-01-02/id_bucket=0",
+        "category=__HIVE_DEFAULT_PARTITION__/ts_day=null/id_bucket=3",
+        "category=a/ts_day=2022-01-01/id_bucket=1",
+    ]
+    table = SPEC.parse_partition_paths(iter(paths))
+    assert table.schema == pa.schema([("category", pa.string()), ("ts_day", pa.date32()), ("id_bucket", pa.int32())])
+    assert table.to_pydict() == {
+        "category": ["a", "a/b=c", None, "a"],
+        "ts_day": [date(2022, 1, 1), date(2022, 1, 2), None, date(2022, 1, 1)],
+        "id_bucket": [3, 0, 3, 1],
+    }
+
+
+def test_parse_partition_paths_of_written_partitions():
+    """Test that the paths of the partitions of a batch parse back to their partition keys"""
+    batch = make_batch(200)
+    keys = [key for key, _ in SPEC.partition_indices(batch)]
+    paths = [
+        "/".join(f"{field.name}={field.transform.to_human_string(value)}" for field, value in zip(SPEC.fields, key))
+        for key in keys
+    ]
+    table = SPEC.parse_partition_paths(paths)
+    parsed = zip(
+        table.column("category").to_pylist(),
+        table.column("ts_day").cast(pa.int32()).to_pylist(),
+        table.column("id_bucket").to_pylist(),
+    )
+    assert list(parsed) == keys
+
+
+def test_parse_partition_paths_of_all_types():
+    schema = Schema(
+        NestedField(1, "flag", BooleanType()),
+        NestedField(2, "big", LongType()),
+        NestedField(3, "amount", DecimalType(9, 2)),
+        NestedField(4, "ts", TimestampType()),
+        NestedField(5, "id", UUIDType()),
+        schema_id=1,
+    )
+    spec = PartitionSpec(
+        schema,
+        0,
+        [
+            PartitionField(1, 1000, identity(BooleanType()), "flag"),
+            PartitionField(2, 1001, identity(LongType()), "big"),
+            PartitionField(3, 1002, identity(DecimalType(9, 2)), "amount"),
+            PartitionField(4, 1003, identity(TimestampType()), "ts"),
+            PartitionField(5, 1004, identity(UUIDType()), "id"),
+        ],
+        1004,
+    )
+    table = spec.parse_partition_paths(
+        ["flag=true/big=9007199254740993/amount=12.5/ts=2022-01-01 10%3A00%3A00/id=f79c3e09-677c-4bbd-a479-3f349cb785e7"]
+    )
+    assert table.to_pylist() == [
+        {
+            "flag": True,
+            "big": 9007199254740993,
+            "amount": Decimal("12.50"),
+            "ts": datetime(2022, 1, 1, 10),
+            "id": b"\xf7\x9c>\tg|K\xbd\xa4y?4\x9c\xb7\x85\xe7",
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "transform, value, expected",
+    [
+        (year(TimestampType()), "2022", 52),
+        (year(TimestampType()), "1969", -1),
+        (month(TimestampType()), "2022-01", 624),
+        (month(TimestampType()), "1969-12", -1),
+        (day(TimestampType()), "2022-01-05", date(2022, 1, 5)),
+        (hour(TimestampType()), "2022-01-05-10", 455938),
+        (hour(TimestampType()), "1969-12-31-23", -1),
+        (year(TimestampType()), "null", None),
+    ],
+)
+def test_parse_partition_paths_of_time_transforms(transform, value, expected):
+    spec = PartitionSpec(SCHEMA, 0, [PartitionField(3, 1000, transform, "ts_part")], 1000)
+    assert spec.parse_partition_paths([f"ts_part={value}"]).column("ts_part").to_pylist() == [expected]
+    if expected is not None:
+        internal = (expected - date(1970, 1, 1)).days if isinstance(expected, date) else expected
+        assert transform.to_human_string(internal) == value
+
+
+@pytest.mark.parametrize(
+    "transform, value",
+    [
+        (year(TimestampType()), "2022-01"),
+        (month(TimestampType()), "2022"),
+        (month(TimestampType()), "2022-13"),
+        (day(TimestampType()), "2022-02-30"),
+        (hour(TimestampType()), "2022-01-05"),
+        (hour(TimestampType()), "2022-01-05-24"),
+    ],
+)
+def test_parse_invalid_time_partition_paths(transform, value):
+    spec = PartitionSpec(SCHEMA, 0, [PartitionField(3, 1000, transform, "ts_part")], 1000)
+    with pytest.raises(ValueError) as exc_info:
+        spec.parse_partition_paths([f"ts_part={value}"])
+    assert f"Invalid partition path segment ts_part={value}" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "path, message",
+    [
+        ("category=a/ts_day=2022-01-01", "Invalid partition path, expected 3 fields: category=a/ts_day=2022-01-01"),
+        ("category=a/ts_day=2022-01-01/id_bucket=1/file.parquet", "Invalid partition path, expected 3 fields"),
+        (
+            "ts_day=2022-01-01/category=a/id_bucket=1",
+            "Invalid partition path segment, expected field category: ts_day=2022-01-01",
+        ),
+        ("category=a/ts_day/id_bucket=1", "Invalid partition path segment, expected field ts_day: ts_day"),
+        ("category=a/ts_day=2022-01-01/id_bucket=1.5", "value cannot have fractional digits"),
+        ("category=a/ts_day=2022-01-01/id_bucket=abc", "Cannot convert partition value to int: abc"),
+    ],
+)
+def test_parse_invalid_partition_paths(path, message):
+    with pytest.raises(ValueError) as exc_info:
+        SPEC.parse_partition_paths(["category=a/ts_day=2022-01-01/id_bucket=1", path])
+    assert message in str(exc_info.value)
@@ -71,10 +71,14 @@ Notes:
         - -4.5F is -1 * 2ˆ2 * 1.125 and encoded as 11000000|10010000|0...0 in binary
         - 00000000 -> 0, 00000000 -> 0, 10010000 -> 144 (-112), 11000000 -> 192 (-64),
 """
+
+import gc
 import struct
 import uuid
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
 
+import pyarrow as pa
 import pytest
 
 import iceberg.utils.decimal as decimal_util
@@ -134,6 +138,30 @@ def test_unscaled_to_decimal(unscaled, scale, expected_result):
     assert decimal_util.unscaled_to_decimal(unscaled=unscaled, scale=scale) == expected_result
 
 
+@pytest.mark.parametrize(
+    "value, expected_result",
+    [
+        (0, b"\x00"),
+        (1, b"\x01"),
+        (-1, b"\xff"),
+        (127, b"\x7f"),
+        (128, b"\x00\x80"),
+        (-128, b"\x80"),
+        (-129, b"\xff\x7f"),
+        (32767, b"\x7f\xff"),
+        (-32768, b"\x80\x00"),
+        (Decimal("1.28"), b"\x00\x80"),
+        (Decimal("-1.28"), b"\x80"),
+    ],
+)
+def test_decimal_to_bytes_uses_minimal_twos_complement(value, expected_result):
+    """Test that decimals are serialized with the minimum number of two's-complement bytes"""
+    unscaled = decimal_util.decimal_to_unscaled(Decimal(value))
+    assert decimal_util.bytes_required(value) == len(expected_result)
+    assert decimal_util.decimal_to_bytes(Decimal(value)) == expected_result
+    assert int.from_bytes(expected_result, byteorder="big", signed=True) == unscaled
+
+
 @pytest.mark.parametrize(
     "primitive_type, value_str, expected_result",
     [
@@ -144,6 +172,17 @@ def test_unscaled_to_decimal(unscaled, scale, expected_result):
         (IntegerType(), "1", 1),
         (IntegerType(), "9999", 9999),
         (LongType(), "123456789", 123456789),
+        (LongType(), "9007199254740993", 9007199254740993),
+        (LongType(), "-9223372036854775808", -9223372036854775808),
+        (DateType(), "1000", 1000),
+        (DateType(), "-1", -1),
+        (DateType(), "1972-09-27", 1000),
+        (TimeType(), "10000", 10000),
+        (TimeType(), "00:00:00.010000", 10000),
+        (TimestampType(), "400000", 400000),
+        (TimestampType(), "1970-01-01T00:00:00.400000", 400000),
+        (TimestampType(), "1970-01-01 00:00:00.400000", 400000),
+        (TimestamptzType(), "1970-01-01T01:00:00.400000+01:00", 400000),
         (FloatType(), "1.1", 1.1),
         (DoubleType(), "99999.9", 99999.9),
         (DecimalType(5, 2), "123.45", Decimal("123.45")),
@@ -217,6 +256,8 @@ def test_hive_default_partition_values(primitive_type):
         (LongType(), "1234567.89", True),
         (LongType(), "123.00", True),
         (LongType(), "1234567.00", True),
+        (LongType(), "1E+2", True),
+        (DateType(), "12.5", True),
         (IntegerType(), "12345", False),
         (IntegerType(), "123456789", False),
         (IntegerType(), "12300", False),
@@ -239,6 +280,15 @@ def test_partition_to_py_raise_on_incorrect_precision_or_scale(primitive_type, v
         conversions.partition_to_py(primitive_type, value)
 
 
+@pytest.mark.parametrize(
+    "primitive_type, value",
+    [(IntegerType(), "abc"), (LongType(), "1-2"), (DateType(), "2022-13-01"), (DecimalType(9, 2), "12,5")],
+)
+def test_partition_to_py_raise_on_invalid_value(primitive_type, value):
+    with pytest.raises(ValueError):
+        conversions.partition_to_py(primitive_type, value)
+
+
 @pytest.mark.parametrize(
     "primitive_type, b, result",
     [
@@ -503,3 +553,71 @@ def test_raise_on_incorrect_precision_or_scale(primitive_type, value, expected_e
         conversions.to_bytes(primitive_type, value)
 
     assert expected_error_message in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "primitive_type, values, expected",
+    [
+        (BooleanType(), [True, None, False], [True, None, False]),
+        (IntegerType(), [-34, None, 2**31 - 1], [-34, None, 2**31 - 1]),
+        (LongType(), [None, -(2**63), 200], [None, -(2**63), 200]),
+        (FloatType(), [-4.5, None], [-4.5, None]),
+        (DoubleType(), [6.0, None, 0.1], [6.0, None, 0.1]),
+        (DateType(), [1000, None], [date(1972, 9, 27), None]),
+        (TimeType(), [10000, None], [time(0, 0, 0, 10000), None]),
+        (TimestampType(), [400000, None], [datetime(1970, 1, 1, 0, 0, 0, 400000), None]),
+        (TimestamptzType(), [400000], [datetime(1970, 1, 1, 0, 0, 0, 400000, tzinfo=timezone.utc)]),
+        (StringType(), ["ABC", None, ""], ["ABC", None, ""]),
+        (BinaryType(), [b"Z", None, b""], [b"Z", None, b""]),
+        (FixedType(2), [b"ab", None], [b"ab", None]),
+        (FixedType(3), [b"abc", b"def"], [b"abc", b"def"]),
+        (FixedType(3), [None, None], [None, None]),
+        (
+            UUIDType(),
+            [uuid.UUID("f79c3e09-677c-4bbd-a479-3f349cb785e7"), None],
+            [b"\xf7\x9c>\tg|K\xbd\xa4y?4\x9c\xb7\x85\xe7", None],
+        ),
+        (DecimalType(9, 2), [Decimal("-1.25"), None, Decimal("3456789.01")], [Decimal("-1.25"), None, Decimal("3456789.01")]),
+        (DecimalType(38, 2), [Decimal("-1.25"), None], [Decimal("-1.25"), None]),
+        (LongType(), [None, None], [None, None]),
+        (DoubleType(), [], []),
+    ],
+)
+def test_from_bytes_many(primitive_type, values, expected):
+    """Test decoding a column of buffers, where None is a missing value"""
+    buffers = [None if value is None else conversions.to_bytes(primitive_type, value) for value in values]
+    result = conversions.from_bytes_many(primitive_type, buffers)
+    assert result.type == conversions.codec_for(primitive_type).arrow_type()
+    assert result.to_pylist() == expected
+
+
+@pytest.mark.parametrize(
+    "primitive_type, buffers",
+    [
+        (IntegerType(), [b"\x01\x00\x00\x00", b"\x01\x00\x00\x00\x00"]),
+        (LongType(), [None, b"\x01\x00\x00\x00"]),
+        (StringType(), [b"\xff"]),
+        (FixedType(2), [b"abc"]),
+        (FixedType(2), [None, b"a"]),
+    ],
+)
+def test_from_bytes_many_raises_on_invalid_buffers(primitive_type, buffers):
+    with pytest.raises((ValueError, pa.ArrowInvalid)):
+        conversions.from_bytes_many(primitive_type, buffers)
+
+
+def test_codecs_are_cached_per_type():
+    assert conversions.codec_for(IntegerType()) is conversions.codec_for(IntegerType())
+    assert conversions.codec_for(IntegerType()) is not conversions.codec_for(DateType())
+    assert conversions.codec_for(DecimalType(9, 2)) is not conversions.codec_for(DecimalType(9, 3))
+
+
+def test_codecs_are_released_with_their_type():
+    decimal_type = DecimalType(29, 13)
+    conversions.to_bytes(decimal_type, Decimal("1.0000000000000"))
+    decimal_id = id(decimal_type)
+    assert decimal_id in conversions._CODECS
+
+    del decimal_type
+    gc.collect()
+    assert decimal_id not in conversions._CODECS
@@ -407,3 +407,218 @@ def test_build_position_accessors_with_struct(table_schema_nested):
     accessors = build_position_accessors(table_schema_nested)
     container = TestStruct({6: TestStruct({0: "name"})})
     assert accessors.get(16).get(container) == "name"
+
+
+def test_accessor_positions_and_get_many():
+    """Test that nested accessors are compiled into a path of positions and can read many containers"""
+    accessor = Accessor(position=1, inner=Accessor(position=0, inner=Accessor(position=2)))
+    assert accessor.positions == (1, 0, 2)
+    assert Accessor(position=3).positions == (3,)
+
+    containers = [TestStruct({1: TestStruct({0: TestStruct({2: value})})}) for value in ["a", "b", "c"]]
+    assert accessor.get(containers[1]) == "b"
+    assert accessor.get_many(containers) == ["a", "b", "c"]
+    assert Accessor(position=1, inner=Accessor(position=0)).get_many([TestStruct({1: TestStruct({0: 5})})]) == [5]
+    assert Accessor(position=0).get_many([TestStruct({0: None}), TestStruct({0: 1})]) == [None, 1]
+    assert accessor.get_many([]) == []
+
+
+@pytest.mark.parametrize(
+    "names, expected",
+    [
+        (["foo", "bar"], [NestedField(1, "foo", StringType(), False), NestedField(2, "bar", IntegerType(), True)]),
+        (["qux"], [NestedField(4, "qux", ListType(5, StringType(), True), True)]),
+        (["qux.element"], [NestedField(4, "qux", ListType(5, StringType(), True), True)]),
+        (
+            ["location.element.latitude"],
+            [
+                NestedField(
+                    11,
+                    "location",
+                    ListType(12, StructType(NestedField(13, "latitude", FloatType(), is_optional=False)), True),
+                    True,
+                )
+            ],
+        ),
+        (
+            ["quux.value.key"],
+            [
+                NestedField(
+                    6,
+                    "quux",
+                    MapType(7, StringType(), 8, MapType(9, StringType(), 10, IntegerType(), True), True),
+                    True,
+                )
+            ],
+        ),
+        (["person.age"], [NestedField(15, "person", StructType(NestedField(17, "age", IntegerType(), True)), False)]),
+        (
+            ["person", "person.age"],
+            [
+                NestedField(
+                    15,
+                    "person",
+                    StructType(NestedField(16, "name", StringType(), False), NestedField(17, "age", IntegerType(), True)),
+                    False,
+                )
+            ],
+        ),
+        ([], []),
+    ],
+)
+def test_schema_select(table_schema_nested, names, expected):
+    """Test that selecting columns keeps the selected fields with their full types and the parents of nested fields"""
+    selected = table_schema_nested.select(names)
+    assert tuple(selected.columns) == tuple(expected)
+    assert selected.schema_id == table_schema_nested.schema_id
+
+
+def test_schema_select_case_insensitive(table_schema_nested):
+    """Test selecting columns with names that differ in case"""
+    selected = table_schema_nested.select(["FOO", "Person.Name"], case_sensitive=False)
+    assert [field.field_id for field in selected.columns] == [1, 15]
+    assert selected.find_field("person.name").field_id == 16
+    assert selected.find_field("person.age") is None
+    assert selected.identifier_field_ids == [1]
+
+    with pytest.raises(ValueError) as exc_info:
+        table_schema_nested.select(["FOO"])
+    assert "Cannot select column, not found: FOO" in str(exc_info.value)
+
+
+def test_schema_select_is_memoized(table_schema_nested):
+    """Test that selecting the same columns twice returns the same schema"""
+    selected = table_schema_nested.select(["bar", "person.name"])
+    assert table_schema_nested.select(["bar", "person.name"]) is selected
+    assert table_schema_nested._selections[(("bar", "person.name"), True)] is selected
+    assert selected.identifier_field_ids == []
+
+
+def test_schema_interning():
+    """Test that schemas with the same fields, ID and identifier fields are the same instance"""
+    fields = [
+        NestedField(field_id=1, name="foo", field_type=StringType(), is_optional=False),
+        NestedField(field_id=2, name="bar", field_type=StructType(NestedField(3, "baz", IntegerType())), is_optional=True),
+    ]
+    first = schema.Schema(*fields, schema_id=1, identifier_field_ids=[1])
+    assert schema.Schema(*fields, schema_id=1, identifier_field_ids=[1]) is first
+    assert schema.Schema(*fields, schema_id=2, identifier_field_ids=[1]) is not first
+    assert schema.Schema(*fields, schema_id=1) is not first
+    assert schema.Schema(*fields[:1], schema_id=1, identifier_field_ids=[1]) is not first
+
+    # Selecting the same columns in a different order results in the same schema
+    assert first.select(["bar.baz", "foo"]) is first.select(["foo", "bar.baz"])
+
+
+def test_schema_indexes(table_schema_nested):
+    """Test that the indexes built in a single traversal match the indexes of the individual visitors"""
+    assert table_schema_nested._name_to_id == schema.index_by_name(table_schema_nested)
+    assert table_schema_nested._lazy_id_to_name() == schema.index_name_by_id(table_schema_nested)
+    assert table_schema_nested._lazy_id_to_field() == schema.index_by_id(table_schema_nested)
+    assert table_schema_nested._lazy_id_to_accessor() == build_position_accessors(table_schema_nested)
+
+
+def test_schema_indexes_are_built_on_first_need():
+    table_schema = schema.Schema(NestedField(1, "foo", StringType()), NestedField(2, "bar", IntegerType()), schema_id=17)
+    assert not table_schema._indexed
+    assert table_schema.find_column_name(2) == "bar"
+    assert not table_schema._indexed
+    assert table_schema.find_field(2).name == "bar"
+    assert table_schema._indexed
+
+
+class _RecordingVisitor(schema.SchemaVisitor[str]):
+    """A visitor that records the order of its callbacks and returns the visited types as strings"""
+
+    def __init__(self):
+        self.calls = []
+
+    def before_field(self, field: NestedField) -> None:
+        self.calls.append(f"before {field.name}")
+
+    def after_field(self, field: NestedField) -> None:
+        self.calls.append(f"after {field.name}")
+
+    def schema(self, schema, struct_result: str) -> str:
+        return f"schema {struct_result}"
+
+    def struct(self, struct: StructType, field_results) -> str:
+        return f"struct<{', '.join(field_results)}>"
+
+    def field(self, field: NestedField, field_result: str) -> str:
+        return f"{field.name}: {field_result}"
+
+    def list(self, list_type: ListType, element_result: str) -> str:
+        return f"list<{element_result}>"
+
+    def map(self, map_type: MapType, key_result: str, value_result: str) -> str:
+        return f"map<{key_result}, {value_result}>"
+
+    def primitive(self, primitive) -> str:
+        return str(primitive)
+
+
+def test_schema_visitor_callback_order(table_schema_nested):
+    """Test that the visitor callbacks are called in post-order, with the before and after hooks around each field"""
+    visitor = _RecordingVisitor()
+    result = schema.visit(table_schema_nested, visitor)
+
+    assert result == (
+        "schema struct<foo: string, bar: int, baz: boolean, qux: list<string>, quux: map<string, map<string, int>>, "
+        "location: list<struct<latitude: float, longitude: float>>, person: struct<name: string, age: int>>"
+    )
+    assert visitor.calls[:8] == [
+        "before foo",
+        "after foo",
+        "before bar",
+        "after bar",
+        "before baz",
+        "after baz",
+        "before qux",
+        "before element",
+    ]
+    assert visitor.calls[10:19] == [
+        "before quux",
+        "before key",
+        "after key",
+        "before value",
+        "before key",
+        "after key",
+        "before value",
+        "after value",
+        "after value",
+    ]
+    assert visitor.calls.count("before value") == visitor.calls.count("after value") == 2
+
+
+def test_schema_visitor_map_value_hooks():
+    """Test that the value of a map is finished with the after_map_value hook"""
+
+    class MapHooks(_RecordingVisitor):
+        def after_list_element(self, element: NestedField) -> None:
+            self.calls.append("after list element")
+
+        def after_map_value(self, value: NestedField) -> None:
+            self.calls.append("after map value")
+
+    visitor = MapHooks()
+    schema.visit(MapType(1, StringType(), 2, IntegerType()), visitor)
+    assert visitor.calls == ["before key", "after key", "before value", "after map value"]
+
+
+def test_schema_visitor_deeply_nested_schema():
+    """Test visiting a schema that is nested deeper than the recursion limit"""
+    depth = 1000
+    field_type = StructType(NestedField(depth + 1, "leaf", IntegerType()))
+    for field_id in range(depth, 0, -1):
+        field_type = StructType(NestedField(field_id, f"f{field_id}", field_type))
+    nested = schema.Schema(*field_type.fields, schema_id=1)
+
+    assert len(schema.index_by_id(nested)) == depth + 1
+    assert nested.find_field(".".join(f"f{field_id}" for field_id in range(1, depth + 1)) + ".leaf").field_id == depth + 1
+    assert nested.accessor_for_field(depth + 1).positions == (0,) * (depth + 1)
+
+
+def test_schema_visitor_struct_without_fields():
+    """Test visiting an empty struct"""
+    assert schema.visit(schema.Schema(schema_id=1), _RecordingVisitor()) == "schema struct<>"
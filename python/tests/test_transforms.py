@@ -19,6 +19,7 @@ from decimal import Decimal
 from uuid import UUID
 
 import mmh3 as mmh3
+import pyarrow as pa
 import pytest
 
 from iceberg import transforms
@@ -121,6 +122,78 @@ def test_bucket_method(type_var):
     assert bucket_transform.to_human_string("test") == "test"
 
 
+@pytest.mark.parametrize(
+    "type_var,arrow_type,values",
+    [
+        (IntegerType(), pa.int32(), [0, 1, -1, 34, None, 2**31 - 1, -(2**31)]),
+        (LongType(), pa.int64(), [0, 34, None, 2**63 - 1, -(2**63), 81068000000]),
+        (DateType(), pa.date32(), [None, date_to_days("2017-11-16"), 0, -1]),
+        (TimeType(), pa.time64("us"), [time_to_micros("22:31:08"), None, 0]),
+        (TimestampType(), pa.timestamp("us"), [timestamp_to_micros("2017-11-16T22:31:08"), None, -1]),
+        (TimestamptzType(), pa.timestamp("us", tz="UTC"), [timestamptz_to_micros("2017-11-16T14:31:08-08:00"), None]),
+        (
+            DecimalType(38, 2),
+            pa.decimal128(38, 2),
+            [
+                Decimal("14.20"),
+                Decimal("0.00"),
+                None,
+                Decimal("-0.01"),
+                Decimal("1.27"),
+                Decimal("1.28"),
+                Decimal("-1.28"),
+                Decimal("-1.29"),
+                Decimal("327.67"),
+                Decimal("-327.68"),
+                Decimal("999999999999999999999999999999999999.99"),
+                Decimal("-999999999999999999999999999999999999.99"),
+            ],
+        ),
+        (StringType(), pa.string(), ["iceberg", "", None, "a", "ab", "abc", "abcd", "abcde", "💰" * 9]),
+        (StringType(), pa.large_string(), ["iceberg", None, "string with a surrogate pair: 💰"]),
+        (BinaryType(), pa.binary(), [b"\x00\x01\x02\x03", b"", None, b"\xff" * 13]),
+        (FixedType(3), pa.binary(3), [b"foo", None, b"\x00\x00\x00"]),
+        (
+            UUIDType(),
+            pa.binary(16),
+            [UUID("f79c3e09-677c-4bbd-a479-3f349cb785e7").bytes, None, UUID(int=0).bytes],
+        ),
+    ],
+)
+def test_bucket_apply_array(type_var, arrow_type, values):
+    bucket_transform = transforms.bucket(type_var, 100)
+    array = pa.array(values, type=arrow_type)
+    if isinstance(type_var, UUIDType):
+        values = [UUID(bytes=value) if value is not None else None for value in values]
+    expected = [bucket_transform.apply(value) for value in values]
+
+    assert bucket_transform.apply_array(array).to_pylist() == expected
+    assert bucket_transform.apply_array(array.slice(1)).to_pylist() == expected[1:]
+    chunked = pa.chunked_array([array.slice(0, 2), array.slice(2)])
+    assert bucket_transform.apply_array(chunked).to_pylist() == expected
+
+
+def test_bucket_apply_array_empty():
+    bucket_transform = transforms.bucket(StringType(), 100)
+    assert bucket_transform.apply_array(pa.array([], type=pa.string())).to_pylist() == []
+    assert bucket_transform.apply_array(pa.array([None, None], type=pa.string())).to_pylist() == [None, None]
+
+
+def test_bucket_apply_array_unsupported_type():
+    with pytest.raises(ValueError) as exc_info:
+        transforms.bucket(LongType(), 100).apply_array(pa.array([1.0]))
+    assert "Cannot read array of type double as integers" in str(exc_info.value)
+
+
+def test_bucket_zero_and_empty_values():
+    assert (
+        transforms.bucket(IntegerType(), 100).apply(0)
+        == transforms.bucket(IntegerType(), 100).apply_array(pa.array([0])).to_pylist()[0]
+    )
+    assert transforms.bucket(StringType(), 100).apply("") == mmh3.hash("") % 100
+    assert transforms.bucket(DecimalType(9, 2), 100).apply(Decimal("0.00")) == (mmh3.hash(b"\x00") & 0x7FFFFFFF) % 100
+
+
 def test_string_with_surrogate_pair():
     string_with_surrogate_pair = "string with a surrogate pair: 💰"
     as_bytes = bytes(string_with_surrogate_pair, "UTF-8")
@@ -128,6 +201,152 @@ def test_string_with_surrogate_pair():
     assert bucket_transform.hash(string_with_surrogate_pair) == mmh3.hash(as_bytes)
 
 
+@pytest.mark.parametrize(
+    "transform,value,expected,human",
+    [
+        (transforms.year(DateType()), date_to_days("2017-12-01"), 47, "2017"),
+        (transforms.year(DateType()), date_to_days("1969-12-31"), -1, "1969"),
+        (transforms.year(TimestampType()), timestamp_to_micros("2017-12-01T10:12:55.038194"), 47, "2017"),
+        (transforms.year(TimestamptzType()), timestamp_to_micros("1969-12-31T23:59:59.999999"), -1, "1969"),
+        (transforms.month(DateType()), date_to_days("2017-12-01"), 575, "2017-12"),
+        (transforms.month(DateType()), date_to_days("1969-12-31"), -1, "1969-12"),
+        (transforms.month(TimestampType()), timestamp_to_micros("2017-12-01T10:12:55.038194"), 575, "2017-12"),
+        (transforms.month(TimestampType()), timestamp_to_micros("1969-01-01T00:00:00"), -12, "1969-01"),
+        (transforms.day(DateType()), date_to_days("2017-12-01"), 17501, "2017-12-01"),
+        (transforms.day(TimestampType()), timestamp_to_micros("2017-12-01T10:12:55.038194"), 17501, "2017-12-01"),
+        (transforms.day(TimestampType()), timestamp_to_micros("1969-12-31T23:59:59.999999"), -1, "1969-12-31"),
+        (transforms.hour(TimestampType()), timestamp_to_micros("2017-12-01T10:12:55.038194"), 420034, "2017-12-01-10"),
+        (transforms.hour(TimestamptzType()), timestamp_to_micros("1969-12-31T23:59:59.999999"), -1, "1969-12-31-23"),
+    ],
+)
+def test_time_transforms(transform, value, expected, human):
+    assert transform.apply(value) == expected
+    assert transform.apply(None) is None
+    assert transform.to_human_string(expected) == human
+    assert transform.to_human_string(None) == "null"
+    assert transform == eval(repr(transform))
+    assert transform.preserves_order
+    assert transform.dedup_name == "time"
+
+
+def test_time_transform_types():
+    assert transforms.day(TimestampType()).result_type(TimestampType()) == DateType()
+    assert transforms.month(DateType()).result_type(DateType()) == IntegerType()
+    assert transforms.year(TimestampType()).can_transform(DateType())
+    assert not transforms.hour(TimestampType()).can_transform(DateType())
+    assert not transforms.day(DateType()).can_transform(StringType())
+    for factory in [transforms.year, transforms.month, transforms.day, transforms.hour]:
+        with pytest.raises(ValueError) as exc_info:
+            factory(StringType())
+        assert "Cannot partition type string by" in str(exc_info.value)
+    with pytest.raises(ValueError):
+        transforms.hour(DateType())
+
+
+def test_time_transforms_satisfy_order_of_coarser_transforms():
+    hour_transform = transforms.hour(TimestampType())
+    day_transform = transforms.day(TimestampType())
+    year_transform = transforms.year(TimestampType())
+    assert hour_transform.satisfies_order_of(day_transform)
+    assert day_transform.satisfies_order_of(year_transform)
+    assert day_transform.satisfies_order_of(transforms.day(TimestampType()))
+    assert not year_transform.satisfies_order_of(day_transform)
+    assert not day_transform.satisfies_order_of(transforms.bucket(TimestampType(), 8))
+    assert transforms.identity(TimestampType()).satisfies_order_of(hour_transform)
+
+
+@pytest.mark.parametrize(
+    "transform,arrow_type,values",
+    [
+        (transforms.year(DateType()), pa.date32(), [0, -1, None, 17501, -719162, 2932896, 59, 60]),
+        (transforms.month(DateType()), pa.date32(), [0, -1, None, 17501, -719162, 2932896, -306, -307]),
+        (transforms.day(DateType()), pa.date32(), [0, -1, None, 17501]),
+        (transforms.year(TimestampType()), pa.timestamp("us"), [0, -1, None, 1512151975038194, -62135596800000000]),
+        (transforms.month(TimestampType()), pa.timestamp("us"), [0, -1, None, 1512151975038194, 253402300799999999]),
+        (transforms.day(TimestamptzType()), pa.timestamp("us", tz="UTC"), [0, -1, None, -86_400_000_001, 1512151975038194]),
+        (transforms.hour(TimestampType()), pa.timestamp("us"), [0, -1, None, -3_600_000_000, 1512151975038194]),
+        (transforms.truncate(IntegerType(), 10), pa.int32(), [0, 1, -1, None, 9, 10, -10, -11, 2**31 - 1, -(2**31) + 10]),
+        (transforms.truncate(LongType(), 7), pa.int64(), [0, -1, None, 2**62, -(2**62)]),
+        (
+            transforms.truncate(DecimalType(9, 2), 50),
+            pa.decimal128(9, 2),
+            [Decimal("10.65"), Decimal("-0.05"), None, Decimal("0.00"), Decimal("-9999999.99")],
+        ),
+        (
+            transforms.truncate(DecimalType(38, 2), 50),
+            pa.decimal128(38, 2),
+            [Decimal("10.65"), Decimal("-0.05"), None, Decimal("-12345678901234567890123456789012345.67")],
+        ),
+        (transforms.truncate(StringType(), 3), pa.string(), ["iceberg", "", None, "ab", "💰💰💰💰"]),
+        (transforms.truncate(StringType(), 3), pa.large_string(), ["iceberg", None]),
+        (transforms.truncate(BinaryType(), 2), pa.binary(), [b"\x00\x01\x02", b"", None]),
+        (transforms.truncate(BinaryType(), 3), pa.large_binary(), [None, b"\xff" * 7, b"ab", None, b"iceberg"]),
+        (transforms.identity(StringType()), pa.string(), ["iceberg", None]),
+        (transforms.always_null(), pa.int64(), [1, None]),
+    ],
+)
+def test_apply_array(transform, arrow_type, values):
+    array = pa.array(values, type=arrow_type)
+    if pa.types.is_temporal(arrow_type):
+        values = array.cast(pa.int32() if pa.types.is_date32(arrow_type) else pa.int64()).to_pylist()
+    expected = [transform.apply(value) for value in values]
+
+    def to_pylist(result):
+        return (result.cast(pa.int32()) if pa.types.is_date32(result.type) else result).to_pylist()
+
+    assert to_pylist(transform.apply_array(array)) == expected
+    assert to_pylist(transform.apply_array(array.slice(1))) == expected[1:]
+    chunked = transform.apply_array(pa.chunked_array([array.slice(0, 2), array.slice(2)]))
+    assert chunked.num_chunks == 2
+    assert [value for chunk in chunked.chunks for value in to_pylist(chunk)] == expected
+
+
+def test_apply_array_rejects_other_units():
+    with pytest.raises(ValueError) as exc_info:
+        transforms.day(TimestampType()).apply_array(pa.array([1], type=pa.timestamp("ms")))
+    assert "Cannot apply day to array of type timestamp[ms]" in str(exc_info.value)
+
+
+def test_truncate_method():
+    truncate_transform = transforms.truncate(StringType(), 4)
+    assert str(truncate_transform) == "truncate[4]"
+    assert truncate_transform == eval(repr(truncate_transform))
+    assert hash(truncate_transform) == hash(transforms.truncate(StringType(), 4))
+    assert truncate_transform != transforms.truncate(StringType(), 5)
+    assert truncate_transform.width == 4
+    assert truncate_transform.result_type(StringType()) == StringType()
+    assert truncate_transform.satisfies_order_of(transforms.truncate(StringType(), 3))
+    assert not truncate_transform.satisfies_order_of(transforms.truncate(StringType(), 5))
+    assert not transforms.truncate(IntegerType(), 4).satisfies_order_of(transforms.truncate(IntegerType(), 2))
+    assert truncate_transform.apply(None) is None
+    assert transforms.truncate(BinaryType(), 2).to_human_string(b"\x00\x01") == "AAE="
+    with pytest.raises(ValueError):
+        transforms.truncate(DateType(), 4)
+    with pytest.raises(ValueError):
+        transforms.truncate(IntegerType(), 0)
+
+
+@pytest.mark.parametrize(
+    "type_var,value,expected",
+    [
+        (DateType(), 17501, "2017-12-01"),
+        (TimeType(), 36775038194, "10:12:55.038194"),
+        (TimestampType(), 1512151975038194, "2017-12-01T18:12:55.038194"),
+        (TimestamptzType(), 1512151975038194, "2017-12-01T18:12:55.038194+00:00"),
+        (FixedType(3), b"foo", "Zm9v"),
+        (DecimalType(9, 2), Decimal("14.20"), "14.20"),
+        (StringType(), "iceberg", "iceberg"),
+        (IntegerType(), None, "null"),
+    ],
+)
+def test_identity_human_string(type_var, value, expected):
+    identity_transform = transforms.identity(type_var)
+    assert identity_transform.to_human_string(value) == expected
+    assert identity_transform.apply(value) == value
+    assert identity_transform.can_transform(type_var)
+    assert identity_transform.result_type(type_var) == type_var
+
+
 def test_unknown_transform():
     unknown_transform = transforms.UnknownTransform(FixedType(8), "unknown")
     assert str(unknown_transform) == str(eval(repr(unknown_transform)))
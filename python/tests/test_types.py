@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import gc
+
 import pytest
 
 from iceberg.types import (
@@ -203,3 +205,24 @@ def test_non_parameterized_type_equality(input_index, input_type, check_index, c
         assert input_type() == check_type()
     else:
         assert input_type() != check_type()
+
+
+def test_interned_types_are_released():
+    """Test that interned types are shared while they are referenced and released afterwards"""
+    field_var = NestedField(
+        1001, "released", MapType(1002, FixedType(1003), 1004, ListType(1005, DecimalType(37, 29))), is_optional=False
+    )
+    struct_var = StructType(field_var)
+    assert NestedField(1001, "released", field_var.type, is_optional=False) is field_var
+    assert StructType(NestedField(1001, "released", field_var.type, is_optional=False)) is struct_var
+    assert FixedType(1003) is field_var.type.key.type
+
+    del field_var, struct_var
+    gc.collect()
+
+    assert 1003 not in FixedType._instances
+    assert (37, 29) not in DecimalType._instances
+    assert not any(key[1] == 1001 for key in NestedField._instances.keys())
+    assert not any(key[1] == 1005 for key in ListType._instances.keys())
+    assert not any(key[0] == 1002 for key in MapType._instances.keys())
+    assert str(FixedType(1003)) == "fixed[1003]"
@@ -0,0 +1,60 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from iceberg.utils.datetime import (
+    days_to_months,
+    days_to_year_month,
+    days_to_years,
+    micros_to_days,
+    micros_to_hours,
+)
+
+
+@pytest.mark.parametrize(
+    "days",
+    [-719162, -141428, -36525, -366, -307, -306, -1, 0, 1, 58, 59, 60, 365, 11016, 11017, 17501, 2932896],
+)
+def test_days_to_year_month(days):
+    """Test that the integer conversion agrees with the calendar of the datetime module"""
+    expected = date(1970, 1, 1) + timedelta(days=days)
+    assert days_to_year_month(days) == (expected.year, expected.month)
+    assert days_to_years(days) == expected.year - 1970
+    assert days_to_months(days) == (expected.year - 1970) * 12 + expected.month - 1
+
+
+def test_days_to_year_month_over_arrays():
+    """Test that the conversions work elementwise on numpy arrays"""
+    days = np.arange(-800_000, 800_000, 97, dtype=np.int64)
+    years, months = days_to_year_month(days)
+    for index in range(0, len(days), 331):
+        assert (years[index], months[index]) == days_to_year_month(int(days[index]))
+    assert days_to_years(days).tolist() == [days_to_years(int(value)) for value in days]
+
+
+@pytest.mark.parametrize(
+    "micros,days,hours",
+    [(0, 0, 0), (1, 0, 0), (-1, -1, -1), (86_400_000_000, 1, 24), (-86_400_000_001, -2, -25), (1512151975038194, 17501, 420042)],
+)
+def test_micros_to_days_and_hours(micros, days, hours):
+    """Test that timestamps before the epoch are rounded down to the previous day and hour"""
+    assert micros_to_days(micros) == days
+    assert micros_to_hours(micros) == hours
@@ -78,7 +78,8 @@ class DataTableScan(BaseTableScan):
 
     def get_scans_for_manifest(self, manifest):
         from .filesystem import FileSystemInputFile
-        input_file = FileSystemInputFile.from_location(manifest.manifest_path, self.ops.conf)
+        input_file = FileSystemInputFile.from_location(manifest.manifest_path, self.ops.conf,
+                                                       length=manifest.length)
         reader = ManifestReader.read(input_file)
         schema_str = SchemaParser.to_json(reader.spec.schema)
         spec_str = PartitionSpecParser.to_json(reader.spec)
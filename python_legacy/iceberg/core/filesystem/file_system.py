@@ -24,7 +24,7 @@ from .util import get_fs
 
 class FileSystem(object):
 
-    def open(self, path, mode='rb'):
+    def open(self, path, mode='rb', length=None):
         raise NotImplementedError()
 
     def create(self, path, overwrite=False):
@@ -53,14 +53,17 @@ class FileSystemInputFile(InputFile):
         self.stat = stat
 
     @staticmethod
-    def from_location(location, conf):
+    def from_location(location, conf, length=None):
         fs = get_fs(location, conf)
-        return FileSystemInputFile(fs, location, conf)
+        return FileSystemInputFile(fs, location, conf, length=length)
 
     def location(self):
         return self.path
 
     def get_length(self):
+        # a length recorded in table metadata is trusted, and saves a stat of the file
+        if self.length is not None:
+            return self.length
         return self.get_stat().length
 
     def get_stat(self):
@@ -72,14 +75,14 @@ class FileSystemInputFile(InputFile):
         return self.stat
 
     def new_stream(self, gzipped=False):
-        with self.fs.open(self.location()) as fo:
+        with self.fs.open(self.location(), length=self.length) as fo:
             if gzipped:
                 fo = gzip.GzipFile(fileobj=fo)
             for line in fo:
                 yield line
 
     def new_fo(self, mode="rb"):
-        return self.fs.open(self.location(), mode=mode)
+        return self.fs.open(self.location(), mode=mode, length=self.length)
 
     def __repr__(self):
         return "FileSystemInputFile({})".format(self.path)
@@ -19,6 +19,7 @@ import errno
 import os
 from pathlib import Path
 import stat
+from typing import Optional
 from urllib.parse import urlparse
 
 from .file_status import FileStatus
@@ -38,7 +39,7 @@ class LocalFileSystem(FileSystem):
         if LocalFileSystem.fs_inst is None:
             LocalFileSystem.fs_inst = self
 
-    def open(self: "LocalFileSystem", path: str, mode: str = 'rb') -> object:
+    def open(self: "LocalFileSystem", path: str, mode: str = 'rb', length: Optional[int] = None) -> object:
         open_path = Path(LocalFileSystem.fix_path(path))
 
         if "w" in mode and not open_path.parents[0].exists():
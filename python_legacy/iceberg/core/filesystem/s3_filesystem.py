@@ -15,9 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import io
 import logging
 import re
+import threading
 import time
 from urllib.parse import urlparse
 
@@ -120,8 +122,8 @@ class S3FileSystem(FileSystem):
 
         return True
 
-    def open(self, path, mode='rb'):
-        return S3File(path, mode=mode)
+    def open(self, path, mode='rb', length=None):
+        return S3File(path, mode=mode, size=length)
 
     def delete(self, path):
         bucket, key, _ = url_to_bucket_key_name_tuple(S3FileSystem.normalize_s3_path(path))
@@ -146,11 +148,109 @@ class S3FileSystem(FileSystem):
         return re.sub(r'^s3n://|s3a://', 's3://', path)
 
 
+class S3MultipartWriter(object):
+    """Uploads the bytes written to it as the parts of an S3 multipart upload
+
+    Parts of part_size bytes are uploaded on background threads while the caller keeps writing. At most
+    max_pending_parts parts are held in memory, after which write blocks until a part has been uploaded. close
+    completes the upload, and abort, or a failed part, aborts it. Writes that never fill a part are stored with a
+    single PUT instead.
+    """
+    MIN_PART_SIZE = 5 * 1048576
+    DEFAULT_PART_SIZE = 16 * 1048576
+    DEFAULT_MAX_PENDING_PARTS = 4
+
+    def __init__(self, bucket, key, part_size=DEFAULT_PART_SIZE, max_pending_parts=DEFAULT_MAX_PENDING_PARTS,
+                 client=None):
+        if part_size < S3MultipartWriter.MIN_PART_SIZE:
+            raise ValueError("Part size must be at least {} bytes: {}".format(S3MultipartWriter.MIN_PART_SIZE,
+                                                                              part_size))
+        if max_pending_parts < 1:
+            raise ValueError("Number of pending parts must be positive: {}".format(max_pending_parts))
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.max_pending_parts = max_pending_parts
+        self.client = client if client is not None else get_s3("client")
+        self.closed = False
+
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._executor = None
+        self._parts = []
+        self._slots = threading.BoundedSemaphore(max_pending_parts)
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[:self.part_size])
+            del self._buffer[:self.part_size]
+            self._submit_part(part)
+        return len(data)
+
+    def _submit_part(self, body):
+        if self._upload_id is None:
+            self._upload_id = self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key)["UploadId"]
+            self._executor = ThreadPoolExecutor(max_workers=self.max_pending_parts)
+        self._raise_on_failed_part()
+        self._slots.acquire()
+        future = self._executor.submit(self._upload_part, len(self._parts) + 1, body)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._parts.append(future)
+
+    def _upload_part(self, part_number, body):
+        response = self.client.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id,
+                                           PartNumber=part_number, Body=body)
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _raise_on_failed_part(self):
+        for part in self._parts:
+            if part.done() and part.exception() is not None:
+                error = part.exception()
+                self.abort()
+                raise error
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self.client.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+                parts = [part.result() for part in self._parts]
+                self.client.complete_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id,
+                                                      MultipartUpload={"Parts": parts})
+                self._executor.shutdown()
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self.closed = True
+
+    def abort(self):
+        self.closed = True
+        self._buffer = bytearray()
+        if self._upload_id is None:
+            return
+        for part in self._parts:
+            part.cancel()
+        self._executor.shutdown(wait=True)
+        upload_id, self._upload_id = self._upload_id, None
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=upload_id)
+
+
 class S3File(object):
     MAX_CHUNK_SIZE = 4 * 1048576
     MIN_CHUNK_SIZE = 2 * 65536
 
-    def __init__(self, path, mode="rb"):
+    def __init__(self, path, mode="rb", size=None):
         self.path = path
         bucket, key, name = url_to_bucket_key_name_tuple(S3FileSystem.normalize_s3_path(path))
         self.curr_pos = 0
@@ -159,7 +259,9 @@ class S3File(object):
                             key=key))
         self.name = name
         if mode.startswith("r"):
-            self.size = self.obj.content_length
+            # content_length issues a HEAD request, which a known size avoids
+            self.size = size if size is not None else self.obj.content_length
+        self.writer = S3MultipartWriter(bucket, key) if mode.startswith("w") else None
 
         self.isatty = False
         self.closed = False
@@ -177,6 +279,13 @@ class S3File(object):
         self.chunk_size = self.MAX_CHUNK_SIZE
 
     def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.closed = True
+
+    def abort(self):
+        if self.writer is not None:
+            self.writer.abort()
         self.closed = True
 
     def flush(self):
@@ -239,15 +348,18 @@ class S3File(object):
         return self.curr_pos
 
     def write(self, string):
-        resp = self.obj.put(Body=string)
-        if not resp.get("ResponseMetadata", dict()).get("HTTPStatusCode") == 200:
-            raise RuntimeError("Unable to write to {}".format(self.path))
+        if self.writer is None:
+            raise RuntimeError("Unable to write to {} opened with mode {}".format(self.path, self.mode))
+        return self.writer.write(string)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
 
     def __iter__(self):
         return self
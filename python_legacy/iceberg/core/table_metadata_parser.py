@@ -65,14 +65,14 @@ class TableMetadataParser(object):
 
     @staticmethod
     def write(metadata, metadata_location):
-        if metadata_location.location().endswith(".gz"):
-            output_file = gzip.open(metadata_location.create("wb"), "wb")
-        else:
-            output_file = metadata_location.create("wb")
-
-        json_str = TableMetadataParser.to_json(metadata)
-        output_file.write(json_str.encode("utf-8"))
-        output_file.close()
+        json_bytes = TableMetadataParser.to_json(metadata).encode("utf-8")
+        # gzip does not close the file it writes to, and an S3 file only completes its upload when it is closed
+        with metadata_location.create("wb") as output_file:
+            if metadata_location.location().endswith(".gz"):
+                with gzip.open(output_file, "wb") as gzip_file:
+                    gzip_file.write(json_bytes)
+            else:
+                output_file.write(json_bytes)
 
     @staticmethod
     def get_file_extension(config):
@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.core.filesystem.s3_filesystem import S3MultipartWriter
+from mock import MagicMock
+import pytest
+
+PART_SIZE = S3MultipartWriter.MIN_PART_SIZE
+
+
+def s3_client():
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part.side_effect = lambda **kwargs: {"ETag": "etag-{}".format(kwargs["PartNumber"])}
+    return client
+
+
+def test_small_write_is_a_single_put():
+    client = s3_client()
+    writer = S3MultipartWriter("bucket", "key", client=client)
+    writer.write(b"foo")
+    writer.write("bar")
+    writer.close()
+
+    client.put_object.assert_called_once_with(Bucket="bucket", Key="key", Body=b"foobar")
+    client.create_multipart_upload.assert_not_called()
+
+
+def test_large_write_is_uploaded_in_parts():
+    client = s3_client()
+    writer = S3MultipartWriter("bucket", "key", part_size=PART_SIZE, max_pending_parts=2, client=client)
+    for _ in range(5):
+        writer.write(b"x" * (PART_SIZE // 2 + 1))
+    writer.close()
+
+    bodies = {call[1]["PartNumber"]: call[1]["Body"] for call in client.upload_part.call_args_list}
+    assert [len(bodies[number]) for number in sorted(bodies)] == [PART_SIZE, PART_SIZE, 5 * (PART_SIZE // 2 + 1) - 2 * PART_SIZE]
+    client.complete_multipart_upload.assert_called_once_with(
+        Bucket="bucket", Key="key", UploadId="upload-1",
+        MultipartUpload={"Parts": [{"ETag": "etag-{}".format(n), "PartNumber": n} for n in (1, 2, 3)]})
+    client.put_object.assert_not_called()
+    client.abort_multipart_upload.assert_not_called()
+
+
+def test_failed_part_aborts_the_upload():
+    client = s3_client()
+    client.upload_part.side_effect = IOError("connection reset")
+    writer = S3MultipartWriter("bucket", "key", part_size=PART_SIZE, client=client)
+    writer.write(b"x" * PART_SIZE)
+
+    with pytest.raises(IOError):
+        writer.close()
+
+    client.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="key", UploadId="upload-1")
+    client.complete_multipart_upload.assert_not_called()
+    with pytest.raises(ValueError):
+        writer.write(b"x")
+
+
+def test_invalid_part_size():
+    with pytest.raises(ValueError):
+        S3MultipartWriter("bucket", "key", part_size=1024, client=MagicMock())
@@ -16,9 +16,12 @@
 # under the License.
 
 import binascii
+import gzip
 
 from iceberg.core import ConfigProperties, TableMetadataParser
 from iceberg.core.filesystem import FileSystemInputFile, FileSystemOutputFile
+from iceberg.core.filesystem.s3_filesystem import S3File
+from mock import MagicMock, patch
 
 
 def test_compression_property(expected, prop):
@@ -31,6 +34,29 @@ def test_compression_property(expected, prop):
     verify_metadata(read, expected)
 
 
+class S3OutputFile(object):
+
+    def __init__(self, path):
+        self.path = path
+
+    def create(self, mode="w"):
+        return S3File(self.path, mode=mode)
+
+    def location(self):
+        return self.path
+
+
+def test_write_compressed_metadata_to_s3(expected):
+    with patch("iceberg.core.filesystem.s3_filesystem.get_s3", return_value=MagicMock()) as get_s3:
+        TableMetadataParser.write(expected, S3OutputFile("s3://bucket/table/metadata/v1.metadata.json.gz"))
+
+    put_object = get_s3.return_value.put_object
+    put_object.assert_called_once()
+    assert put_object.call_args[1]["Key"] == "table/metadata/v1.metadata.json.gz"
+    metadata = gzip.decompress(put_object.call_args[1]["Body"]).decode("utf-8")
+    verify_metadata(TableMetadataParser.from_json(None, "v1.metadata.json.gz", metadata), expected)
+
+
 def verify_metadata(read, expected):
     assert expected.schema.as_struct() == read.schema.as_struct()
     assert expected.location == read.location